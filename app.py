@@ -1,23 +1,174 @@
-from flask import Flask, render_template, request, jsonify, session, send_file
+from flask import Blueprint, Flask, current_app, render_template, request, jsonify, session, send_file, g
 import numpy as np
-import pandas as pd
 import os
-import io
 import json
-from methods import CRITIC, TOPSIS
-
-app = Flask(__name__)
-app.secret_key = 'kds_secret_key_2024'
+import datetime
+import io
+import threading
+import time
+from methods import (CRITIC, TOPSIS, CriticBootstrap, CriticTopsis, WeightSensitivity,
+                     WeightStability, IncrementalTOPSIS, StackedCRITIC, aggregate_weights, available_methods,
+                     create, get_method, weight_spread)
+from methods.stacked import AGGREGATIONS
+from methods.registry import RANKING
+from cache import ResultCache, make_key
+from storage import ResultStore, atomic_write_bytes, split_results
+from encoding import encode_payload, gzip_response
+from export import EXPORT_FORMATS, ExportCache, Table, result_tables, source_stamp, write_export, write_xlsx
+from dataview import CHART_TOP, HISTOGRAM_BINS, PAGE_LIMIT, RunView
+from ingest import (coerce_array, coerce_matrix, iter_excel_sheets, iter_rows, parse_generic_rows,
+                    parse_scenario_sheets, parse_weighted_rows)
+from jobs import JobManager, QueueFull, DONE
+from metrics import (LatencyHistograms, MetricsSnapshots, RequestProfiler, note_matrix_size,
+                     record_timing, server_timing_header, size_bucket, timed)
+
+# Route'lar blueprint uzerinde tanimlidir; uygulama create_app ile kurulur
+bp = Blueprint('kds', __name__)
 
 # Mutlak yollar kullan
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 UPLOAD_FOLDER = os.path.join(BASE_DIR, 'uploads')
 DATA_FOLDER = os.path.join(BASE_DIR, 'data')
 
-if not os.path.exists(UPLOAD_FOLDER):
-    os.makedirs(UPLOAD_FOLDER)
-if not os.path.exists(DATA_FOLDER):
-    os.makedirs(DATA_FOLDER)
+# Paylasilan durum create_app icinde kurulur (ice aktarma diske dokunmaz).
+# Durum modul duzeyinde tutuldugundan bir surec tek bir yapilandirma barindirir.
+
+# Ayni karar problemi tekrar gonderildiginde hesaplamayi atlamak icin onbellek
+# KDS_CACHE_DIR tanimliysa kayitlar diske de yazilir
+RESULT_CACHE = None
+
+# Her analiz kendi kimligiyle saklanir; critic_results.json / topsis_results.json
+# son calismanin kopyasi ("latest") olarak kalir
+RESULT_STORE = None
+
+# Indirilen Excel/CSV/Parquet dosyalari (kaynak sonuc degisene kadar gecerli)
+EXPORTS = None
+
+# Dashboard veri uclari icin yuklenmis sonuc gorunumleri (kaynak damgasina gore)
+RUN_VIEWS = None
+
+# Satir duzenlemeleri icin artimli TOPSIS modelleri (run_id -> model)
+INCREMENTAL_MODELS = None
+INCREMENTAL_LOCK = threading.Lock()
+
+# Istek gecikme histogramlari (/metrics) ve orneklemeli cProfile
+# (KDS_PROFILE_RATE: profillenecek istek orani, KDS_PROFILE_DIR: .prof klasoru)
+LATENCY = None
+PROFILER = None
+
+# KDS_METRICS_DIR tanimliysa (gunicorn.conf.py) her isci metriklerini buraya
+# yazar; /metrics ve /api/cache-stats tum iscileri pid etiketiyle raporlar
+METRICS = None
+
+# Uzun analizler icin arka plan isleri (es zamanli is ve kuyruk siniri ayarlanabilir);
+# durumlari data/jobs altinda yansitilir, boylece tum isciler sorgulayabilir
+JOBS = None
+
+
+def load_config(environ=None):
+    """
+    Ortam degiskenlerinden uygulama ayarlari
+
+    Args:
+        environ: Ortam degiskenleri (varsayilan os.environ)
+
+    Returns:
+        dict: Flask config anahtarlari
+    """
+    environ = os.environ if environ is None else environ
+    data_folder = environ.get('KDS_DATA_DIR', DATA_FOLDER)
+    return {
+        'SECRET_KEY': environ.get('KDS_SECRET_KEY', 'kds_secret_key_2024'),
+        'UPLOAD_FOLDER': environ.get('KDS_UPLOAD_DIR', UPLOAD_FOLDER),
+        'DATA_FOLDER': data_folder,
+        'CACHE_DIR': environ.get('KDS_CACHE_DIR'),
+        'PROFILE_RATE': float(environ.get('KDS_PROFILE_RATE', 0)),
+        'PROFILE_DIR': environ.get('KDS_PROFILE_DIR', os.path.join(data_folder, 'profiles')),
+        'JOB_WORKERS': int(environ.get('KDS_JOB_WORKERS', 2)),
+        'JOB_QUEUE': int(environ.get('KDS_JOB_QUEUE', 16)),
+        'METRICS_DIR': environ.get('KDS_METRICS_DIR'),
+        'METRICS_INTERVAL': float(environ.get('KDS_METRICS_INTERVAL', 1.0)),
+        'MAX_SAMPLES': int(environ.get('KDS_MAX_SAMPLES', 1000000)),
+        'WARMUP': environ.get('KDS_WARMUP', '0') == '1'
+    }
+
+
+def init_state(config):
+    """Klasorleri olustur ve paylasilan durumu config'e gore kur"""
+    global UPLOAD_FOLDER, DATA_FOLDER, RESULT_CACHE, RESULT_STORE, EXPORTS
+    global RUN_VIEWS, INCREMENTAL_MODELS, LATENCY, PROFILER, METRICS, JOBS
+
+    UPLOAD_FOLDER = config['UPLOAD_FOLDER']
+    DATA_FOLDER = config['DATA_FOLDER']
+    for folder in (UPLOAD_FOLDER, DATA_FOLDER):
+        if not os.path.exists(folder):
+            os.makedirs(folder)
+
+    RESULT_CACHE = ResultCache(max_size=128, ttl=3600, disk_dir=config['CACHE_DIR'])
+    RESULT_STORE = ResultStore(os.path.join(DATA_FOLDER, 'runs'))
+    EXPORTS = ExportCache(os.path.join(DATA_FOLDER, 'exports'))
+    RUN_VIEWS = ResultCache(max_size=8, ttl=600)
+    INCREMENTAL_MODELS = ResultCache(max_size=32, ttl=1800)
+    LATENCY = LatencyHistograms()
+    PROFILER = RequestProfiler(rate=config['PROFILE_RATE'], out_dir=config['PROFILE_DIR'])
+    METRICS = (MetricsSnapshots(config['METRICS_DIR'], config['METRICS_INTERVAL'])
+               if config['METRICS_DIR'] else None)
+    JOBS = JobManager(max_workers=config['JOB_WORKERS'], max_queue=config['JOB_QUEUE'],
+                      state_dir=os.path.join(DATA_FOLDER, 'jobs'))
+
+
+def warmup(app):
+    """
+    Agir modulleri yukle, sablonlari derle ve yontemleri kucuk bir problemle calistir
+
+    Prefork sunucuda (gunicorn preload_app) ana surecte bir kez cagrilir;
+    isciler hazir durumu fork ile devralir, ilk istekleri soguk baslangic
+    maliyeti tasimaz. Onbelleklere ve sonuc deposuna yazmaz.
+    """
+    import openpyxl  # noqa: F401  Excel yukleme/indirme uclari
+    try:
+        import pandas  # noqa: F401  yalnizca .xls okuma
+    except ImportError:
+        pass
+
+    for name in app.jinja_env.list_templates():
+        app.jinja_env.get_template(name)
+
+    matrix = np.array([[7.0, 3.0, 210.0], [5.0, 4.0, 180.0], [8.0, 2.0, 260.0], [6.0, 5.0, 150.0]])
+    criteria_types = ['max', 'min', 'max']
+    weights = CRITIC(matrix, criteria_types).run()['weights']
+    for method, method_kind in available_methods().items():
+        create(method, matrix, criteria_types, weights if method_kind == RANKING else None).run()
+    CriticTopsis(matrix, criteria_types).run()
+    encode_payload(TOPSIS(matrix, weights, criteria_types).run())
+    write_xlsx([Table('warmup', ['x'], lambda: [[1.0]])], io.BytesIO())
+
+
+def create_app(config=None):
+    """
+    Uygulama fabrikasi
+
+    Ayarlar ortam degiskenlerinden okunur (load_config); config verilirse
+    ayni anahtarlari ezer. KDS_WARMUP=1 (veya config WARMUP) ise warmup
+    cagrilir.
+
+    Args:
+        config: load_config anahtarlarini ezen sozluk
+
+    Returns:
+        Flask: Yapilandirilmis uygulama
+    """
+    settings = load_config()
+    settings.update(config or {})
+
+    app = Flask(__name__)
+    app.config.update(settings)
+    init_state(settings)
+    app.register_blueprint(bp)
+
+    if settings['WARMUP']:
+        warmup(app)
+    return app
 
 
 def save_results(filename, data):
@@ -26,8 +177,8 @@ def save_results(filename, data):
     if not os.path.exists(DATA_FOLDER):
         os.makedirs(DATA_FOLDER)
     filepath = os.path.join(DATA_FOLDER, filename)
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    payload = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    atomic_write_bytes(filepath, payload)
 
 
 def load_results(filename):
@@ -39,10 +190,279 @@ def load_results(filename):
     return None
 
 
-def parse_value(val):
-    """Degeri float'a cevir, virgulu noktaya cevir"""
-    import datetime
+def load_run(kind, run_id=None):
+    """Kimligi verilen calismayi, kimlik yoksa son sonucu yukle"""
+    if run_id:
+        if not run_id.startswith(f'{kind}-'):
+            return None
+        return RESULT_STORE.load(run_id)
+    latest = latest_run_id(kind)
+    return (latest and RESULT_STORE.load(latest)) or load_results(f'{kind}_results.json')
+
+
+def store_run(kind, results, write_json=True):
+    """
+    Sonucu kimlikli kayit ve son sonuc olarak sakla, kimligi dondur
+
+    write_json=False ise son sonuc JSON'u yazilmaz (sonuc numpy dizileri
+    icerebilir); son sonuc kimlik dosyasi uzerinden bulunur.
+    """
+    run_id = RESULT_STORE.new_id(kind)
+    results['run_id'] = run_id
+    RESULT_STORE.save(kind, results, run_id)
+    if write_json:
+        save_results(f'{kind}_results.json', results)
+    # Son sonucun kimligi, buyuk JSON dosyasini okumadan bulunabilsin diye ayrica yazilir
+    atomic_write_bytes(os.path.join(DATA_FOLDER, f'{kind}_latest_id'), run_id.encode('ascii'))
+    return run_id
+
+
+def latest_run_id(kind):
+    """
+    Son sonucun kimligi (yoksa None)
+
+    Kimlik dosyasi son sonuc JSON'undan yeni degilse (eski surumlerin
+    yazdigi veya elle degistirilen sonuclar) gecersiz sayilir.
+    """
+    id_path = os.path.join(DATA_FOLDER, f'{kind}_latest_id')
+    json_path = os.path.join(DATA_FOLDER, f'{kind}_results.json')
+    try:
+        if os.path.getmtime(id_path) < os.path.getmtime(json_path):
+            return None
+        with open(id_path, 'r', encoding='ascii') as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+# Her detay seviyesinde bulunan (bir alt seviyede olmayan) ornek alan
+DETAIL_MARKERS = {
+    'critic': {'summary': 'std_devs', 'full': 'normalized_matrix'},
+    'topsis': {'summary': 'distance_positive', 'full': 'weighted_matrix'},
+}
+
+
+def ensure_detail(kind, results, detail):
+    """Kayitli sonuc istenen detay seviyesini karsilamiyorsa yeniden hesapla"""
+    if not results or DETAIL_MARKERS[kind][detail] in results[kind]:
+        return results
+    if kind == 'critic':
+        results[kind] = CRITIC(results['decision_matrix'], results['criteria_types']).run(detail)
+    else:
+        engine = TOPSIS(results['decision_matrix'], results['weights'], results['criteria_types'])
+        results[kind] = engine.run(detail, k=results.get('top_k'))
+    return results
+
+
+def load_export_arrays(kind, run_id=None):
+    """
+    Disa aktarim icin sonucu dizi olarak yukle (JSON listelerine cevirmeden)
+
+    Kimlik yoksa son sonucun kimligi kullanilir; kimliksiz eski sonuclar ve
+    tam detayi olmayan kayitlar bellekte tamamlanip dizilere ayrilir.
+
+    Returns:
+        tuple: (sonuc meta verisi, {'yol/anahtar': numpy array}) veya None
+    """
+    if not run_id:
+        run_id = latest_run_id(kind)
+    if run_id and not run_id.startswith(f'{kind}-'):
+        return None
+    if not run_id:
+        results = load_results(f'{kind}_results.json')
+        if not results:
+            return None
+        run_id = results.get('run_id')
+        if not run_id or not os.path.exists(RESULT_STORE.path(run_id) or ''):
+            return split_results(ensure_detail(kind, results, 'full'))
+
+    loaded = RESULT_STORE.load_arrays(run_id)
+    if loaded is None:
+        return None
+    meta, arrays = loaded
+    if f"{kind}/{DETAIL_MARKERS[kind]['full']}" not in arrays:
+        return split_results(ensure_detail(kind, RESULT_STORE.load(run_id), 'full'))
+    return meta['results'], arrays
+
+
+def result_source(kind, run_id=None):
+    """
+    Sonucun onbellek kaynagi ve degisim damgasi
+
+    Returns:
+        tuple: (kaynak adi, damga); sonuc yoksa damga None
+    """
+    run_id = run_id or latest_run_id(kind)
+    if run_id:
+        source = run_id if run_id.startswith(f'{kind}-') else None
+        stamp = source and source_stamp(RESULT_STORE.path(run_id) or '')
+    else:
+        source = f'{kind}-latest'
+        stamp = source_stamp(os.path.join(DATA_FOLDER, f'{kind}_results.json'))
+    return source, stamp
+
+
+def load_view(kind, run_id=None):
+    """
+    Sonucun sayfali gorunumu (dataview.RunView), yoksa None
+
+    Gorunum kaynak damgasiyla onbellege alinir; ayni sonucun sonraki
+    sayfalari diziyi yeniden yuklemez, sonuc degistiginde yenisi kurulur.
+    Son sonuc kimligiyle aranir; dashboard ve veri uclari ayni gorunumu paylasir.
+    """
+    run_id = run_id or latest_run_id(kind)
+    source, stamp = result_source(kind, run_id)
+    if not stamp:
+        return None
+    key = f'{source}:{stamp}'
+    view = RUN_VIEWS.get(key)
+    if view is None:
+        loaded = load_export_arrays(kind, run_id)
+        if loaded is None:
+            return None
+        view = RunView(kind, *loaded)
+        RUN_VIEWS.set(key, view)
+    return view
+
+
+def export_response(kind, basename):
+    """
+    Sonucu istenen bicimde dosya olarak gonder
+
+    Dosya kaynak sonucun damgasiyla onbellege alinir; sonuc degismedikce
+    ayni istek dosyayi yeniden uretmez. Yanit diskteki dosyadan parca parca
+    aktarilir.
+    """
+    run_id = request.args.get('run_id')
+    fmt = request.args.get('format', 'xlsx')
+    table = request.args.get('table') if fmt != 'xlsx' else None
+
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({'error': f'Gecersiz bicim: {fmt}'}), 400
+    try:
+        k = parse_top_k(request.args.get('k')) if kind == 'topsis' else None
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    source, stamp = result_source(kind, run_id)
+    if not stamp:
+        return jsonify({'error': 'Sonuc bulunamadi'}), 404
+
+    def build(path):
+        with timed('load'):
+            loaded = load_export_arrays(kind, run_id)
+        with timed('export'):
+            write_export(result_tables(kind, *loaded, k=k), fmt, path, table)
+
+    try:
+        path, cached = EXPORTS.get_or_build(source, stamp, fmt, build, table=table, k=k)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    suffix = f'-{table}' if table else ''
+    response = send_file(path, mimetype=EXPORT_FORMATS[fmt], as_attachment=True,
+                         download_name=f'{basename}{suffix}.{fmt}', conditional=True)
+    response.headers['X-Export-Cache'] = 'hit' if cached else 'miss'
+    return response
+
+
+# 'compact' kodlamada izin verilen en fazla ondalik basamak (float64 ~15-17 anlamli basamak)
+MAX_PRECISION = 17
+
 
+def json_result(payload, options):
+    """
+    Yaniti istenen kodlamayla dondur ('json', 'compact' veya 'base64')
+
+    Gecersiz kodlama veya 0..MAX_PRECISION disindaki precision ValueError firlatir (400).
+    """
+    encoding = options.get('encoding', 'json')
+    if encoding == 'json':
+        return jsonify(payload)
+    precision = options.get('precision', 6)
+    if precision is not None:
+        try:
+            precision = int(precision)
+        except (TypeError, ValueError):
+            raise ValueError(f'Gecersiz precision: {precision}') from None
+        if not 0 <= precision <= MAX_PRECISION:
+            raise ValueError(f'precision 0 ile {MAX_PRECISION} arasinda olmali')
+    body = encode_payload(payload, encoding, precision)
+    return current_app.response_class(body, mimetype='application/json')
+
+
+def lean_results(results, detail):
+    """'full' disindaki detay seviyelerinde karar matrisini yanittan cikar"""
+    if detail == 'full':
+        return results
+    return {k: v for k, v in results.items() if k != 'decision_matrix'}
+
+
+def read_json():
+    """Istek govdesini JSON olarak oku (sure 'decode' zamanlayicisina eklenir)"""
+    with timed('decode'):
+        return request.get_json()
+
+
+def sampling_options(data, default=10000):
+    """
+    Istekteki ornek ve surec sayisini dogrula
+
+    n_samples MAX_SAMPLES ayarini asarsa ValueError (400); n_workers CPU
+    sayisina kirpilir.
+
+    Args:
+        data: Istek govdesi
+        default: n_samples verilmezse kullanilacak deger
+
+    Returns:
+        tuple: (n_samples, n_workers)
+    """
+    n_samples = int(data.get('n_samples', default))
+    limit = current_app.config['MAX_SAMPLES']
+    if not 1 <= n_samples <= limit:
+        raise ValueError(f'n_samples 1 ile {limit} arasinda olmali')
+    cpus = os.cpu_count() or 1
+    n_workers = data.get('n_workers')
+    n_workers = cpus if n_workers is None else max(1, min(int(n_workers), cpus))
+    return n_samples, n_workers
+
+
+def parse_top_k(value):
+    """
+    k secenegini dogrula (yalnizca en iyi k alternatif)
+
+    Args:
+        value: Istek govdesi veya sorgu parametresindeki k
+
+    Returns:
+        int veya None: Verilmediyse None (tam siralama); k < 1 ise ValueError
+    """
+    if value is None or value == '':
+        return None
+    k = int(value)
+    if k < 1:
+        raise ValueError('k en az 1 olmali')
+    return k
+
+
+def engine_meta(engine, prefix):
+    """
+    Motorun adim surelerini istek zamanlayicilarina ekle ve sonuc meta bilgisini dondur
+
+    Sonuc onbellekten geldiyse motor calismamistir (sureler bos, cached=True).
+    """
+    timings = engine.timings
+    for step, seconds in timings.items():
+        if isinstance(seconds, dict):
+            for inner, value in seconds.items():
+                record_timing(f'{step}.{inner}', value)
+        else:
+            record_timing(f'{prefix}.{step}', seconds)
+    return {'timings': timings, 'cached': not timings}
+
+
+def parse_value(val):
+    """Degeri float'a cevir, virgulu noktaya cevir (tum matris icin coerce_matrix)"""
     # None veya NaN kontrolu
     if val is None or (isinstance(val, float) and np.isnan(val)):
         return 0.0
@@ -72,7 +492,54 @@ def parse_value(val):
         return 0.0
 
 
-@app.route('/')
+@bp.before_app_request
+def start_instrumentation():
+    """Istek zamanlayicilarini ve (orneklenirse) profili baslat"""
+    g.request_start = time.perf_counter()
+    g.timings = {}
+    g.profiler = PROFILER.maybe_start()
+
+
+@bp.after_app_request
+def finish_instrumentation(response):
+    """Server-Timing basligini ekle, gecikmeyi histograma yaz, profili kaydet"""
+    start = g.pop('request_start', None)
+    if start is None:
+        return response
+    total = time.perf_counter() - start
+
+    profiler = g.pop('profiler', None)
+    if profiler is not None:
+        PROFILER.finish(profiler, request.endpoint or 'unmatched')
+
+    response.headers['Server-Timing'] = server_timing_header(g.get('timings', {}), total)
+    route = request.url_rule.rule if request.url_rule else 'unmatched'
+    LATENCY.observe((('route', route), ('method', request.method),
+                     ('size', size_bucket(g.get('matrix_cells')))), total)
+    if METRICS is not None:
+        METRICS.schedule(local_metrics)
+    return response
+
+
+def local_metrics():
+    """Bu surecin gecikme, onbellek ve is sayaclari"""
+    return {'latency': LATENCY.snapshot(), 'cache': RESULT_CACHE.stats(), 'jobs': JOBS.stats()['jobs']}
+
+
+def worker_metrics():
+    """Tum iscilerin metrikleri (pid -> local_metrics); bu surecinki guncel"""
+    snapshots = METRICS.read() if METRICS is not None else {}
+    snapshots[os.getpid()] = local_metrics()
+    return snapshots
+
+
+@bp.after_app_request
+def compress_response(response):
+    """Buyuk JSON/HTML yanitlarini istemci destekliyorsa gzip ile sikistir"""
+    return gzip_response(response, request.headers.get('Accept-Encoding'))
+
+
+@bp.route('/')
 def index():
     """Ana sayfa"""
     return render_template('index.html')
@@ -80,51 +547,79 @@ def index():
 
 # ========== CRITIC ROUTES ==========
 
-@app.route('/critic')
+@bp.route('/critic')
 def critic_page():
     """CRITIC veri giris sayfasi"""
     return render_template('critic_input.html')
 
 
-@app.route('/critic/upload-excel', methods=['POST'])
+@bp.route('/critic/upload-excel', methods=['POST'])
 def critic_upload_excel():
     """CRITIC icin Excel dosyasini yukle ve parse et"""
     return upload_excel_generic()
 
 
-@app.route('/critic/analyze', methods=['POST'])
-def critic_analyze():
-    """CRITIC analizi yap"""
-    try:
-        data = request.get_json()
+def run_critic_analysis(data, progress=None):
+    """
+    CRITIC analizini yap ve sonucu sakla (senkron route ve arka plan isleri icin)
+
+    Args:
+        data: Istek govdesi (matrix, criteria_types, criteria_names, alternative_names, detail)
+        progress: Istege bagli progress(adim, oran) geri cagirimi
+
+    Returns:
+        tuple: (sonuclar, donusum raporu)
+    """
+    report = progress or (lambda step, fraction: None)
+    report('parse', 0.0)
+
+    # Verileri al ve float'a cevir (tek geciste, parse_value kurallariyla)
+    with timed('parse'):
+        decision_matrix, coercion = coerce_matrix(data['matrix'])
+    note_matrix_size(decision_matrix.size)
+    criteria_types = data['criteria_types']
+    criteria_names = data['criteria_names']
+    alternative_names = data['alternative_names']
+    detail = data.get('detail', 'full')
+
+    results = {
+        'criteria_names': criteria_names,
+        'alternative_names': alternative_names,
+        'decision_matrix': decision_matrix.tolist(),
+        'criteria_types': criteria_types,
+        'detail': detail
+    }
+    report('parse', 0.1)
+
+    # CRITIC (ayni problem daha once hesaplandiysa onbellekten)
+    cache_key = make_key(f'critic:{detail}', decision_matrix, criteria_types)
+    engine = CRITIC(decision_matrix, criteria_types)
+    critic_result = RESULT_CACHE.get_or_compute(
+        cache_key, lambda: engine.run(
+            detail, lambda step, fraction: report(step, 0.1 + 0.8 * fraction))
+    )
+    results['critic'] = critic_result
+    results['meta'] = engine_meta(engine, 'critic')
 
-        # Verileri al ve float'a cevir
-        raw_matrix = data['matrix']
-        parsed_matrix = [[parse_value(cell) for cell in row] for row in raw_matrix]
-        decision_matrix = np.array(parsed_matrix, dtype=float)
-        criteria_types = data['criteria_types']
-        criteria_names = data['criteria_names']
-        alternative_names = data['alternative_names']
-
-        results = {
-            'criteria_names': criteria_names,
-            'alternative_names': alternative_names,
-            'decision_matrix': decision_matrix.tolist(),
-            'criteria_types': criteria_types
-        }
+    # Dosyaya kaydet (session yerine)
+    report('save', 0.9)
+    with timed('save'):
+        store_run('critic', results)
+    return results, coercion
 
-        # CRITIC
-        critic = CRITIC(decision_matrix, criteria_types)
-        critic_result = critic.run()
-        results['critic'] = critic_result
 
-        # Dosyaya kaydet (session yerine)
-        save_results('critic_results.json', results)
+@bp.route('/critic/analyze', methods=['POST'])
+def critic_analyze():
+    """CRITIC analizi yap"""
+    try:
+        data = read_json()
+        results, coercion = run_critic_analysis(data)
 
-        return jsonify({
+        return json_result({
             'success': True,
-            'results': results
-        })
+            'results': lean_results(results, results['detail']),
+            'coercion': coercion
+        }, data)
 
     except Exception as e:
         return jsonify({
@@ -133,119 +628,281 @@ def critic_analyze():
         }), 400
 
 
-@app.route('/critic/dashboard')
+@bp.route('/critic/dashboard')
 def critic_dashboard():
-    """CRITIC dashboard sayfasi"""
-    results = load_results('critic_results.json')
-    return render_template('critic_dashboard.html', results=results)
+    """CRITIC dashboard sayfasi (tablo ve grafik verileri /critic/data ile istenir)"""
+    with timed('load'):
+        view = load_view('critic', request.args.get('run_id'))
+    with timed('render'):
+        return render_template('critic_dashboard.html', summary=view and view.summary())
 
 
-@app.route('/critic/download-excel')
+@bp.route('/critic/download-excel')
 def critic_download_excel():
-    """CRITIC sonuclarini Excel olarak indir"""
-    results = load_results('critic_results.json')
-    if not results:
-        return jsonify({'error': 'Sonuc bulunamadi'}), 404
+    """
+    CRITIC sonuclarini indir
 
-    # Excel dosyasi olustur
-    output = io.BytesIO()
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        # Kriter agirliklari
-        weights_df = pd.DataFrame({
-            'Kriter': results['criteria_names'],
-            'Yon': results['criteria_types'],
-            'Agirlik': results['critic']['weights']
-        })
-        weights_df.to_excel(writer, sheet_name='Kriter Agirliklari', index=False)
+    ?format=xlsx (varsayilan, tum sayfalar), csv veya parquet (tek tablo,
+    ?table=karar-matrisi gibi; varsayilan kriter agirliklari)
+    """
+    return export_response('critic', 'critic_sonuclari')
 
-        # Karar matrisi
-        matrix_df = pd.DataFrame(
+
+@bp.route('/critic/bootstrap', methods=['POST'])
+def critic_bootstrap():
+    """Son (veya kimligi verilen) CRITIC sonucu icin agirlik guven araliklari ve sira kararliligi"""
+    data = request.get_json(silent=True) or {}
+    results = load_run('critic', data.get('run_id'))
+    if not results:
+        return jsonify({'success': False, 'error': 'Sonuc bulunamadi'}), 404
+
+    try:
+        analysis = CriticBootstrap(
             results['decision_matrix'],
-            columns=results['criteria_names'],
-            index=results['alternative_names']
+            results['criteria_types'],
+            method=data.get('method', 'bootstrap'),
+            seed=int(data.get('seed', 42))
         )
-        matrix_df.to_excel(writer, sheet_name='Karar Matrisi')
+        n_samples, n_workers = sampling_options(data)
+        with timed('bootstrap'):
+            summary = analysis.run(
+                n_samples=n_samples,
+                confidence=float(data.get('confidence', 0.95)),
+                n_workers=n_workers
+            )
+        summary['criteria_names'] = results['criteria_names']
 
-        # Normalize matris
-        norm_df = pd.DataFrame(
-            results['critic']['normalized_matrix'],
-            columns=results['criteria_names'],
-            index=results['alternative_names']
-        )
-        norm_df.to_excel(writer, sheet_name='Normalize Matris')
-
-        # TOPSIS icin hazir format
-        topsis_ready = pd.DataFrame()
-        topsis_ready[''] = [''] + results['criteria_types'] + results['alternative_names']
-
-        for i, crit in enumerate(results['criteria_names']):
-            col_data = [crit, results['critic']['weights'][i]]
-            for row in results['decision_matrix']:
-                col_data.append(row[i])
-            topsis_ready[f'C{i+1}'] = col_data
-
-        topsis_ready.to_excel(writer, sheet_name='TOPSIS Hazir Format', index=False)
-
-    output.seek(0)
-    return send_file(
-        output,
-        mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-        as_attachment=True,
-        download_name='critic_sonuclari.xlsx'
-    )
+        return jsonify({
+            'success': True,
+            'results': summary
+        })
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
+
+@bp.route('/critic/analyze-scenarios', methods=['POST'])
+def critic_analyze_scenarios():
+    """
+    Her sayfasi bir senaryo (veya karar verici) olan Excel dosyasi icin CRITIC
+
+    Tum senaryolar StackedCRITIC ile tek seferde hesaplanir. Form alanlari:
+    aggregate ('mean' veya 'geometric', varsayilan 'mean') ve detail
+    (varsayilan 'summary').
+    """
+    try:
+        file, error = _validate_upload()
+        if error:
+            return error
+        if file.filename.lower().endswith('.csv'):
+            raise ValueError('Senaryo analizi icin her senaryonun ayri sayfada oldugu Excel dosyasi gerekli')
+
+        detail = request.form.get('detail', 'summary')
+        method = request.form.get('aggregate', 'mean')
+        if method not in AGGREGATIONS:
+            raise ValueError(f"Gecersiz birlestirme yontemi: {method}")
+
+        with timed('parse'):
+            parsed = parse_scenario_sheets(iter_excel_sheets(file))
+        note_matrix_size(parsed['stack'].size)
+
+        engine = StackedCRITIC(parsed['stack'], parsed['criteria_types'])
+        critic_result = engine.run(detail)
+        combined = aggregate_weights(engine.weights, method)
+
+        return json_result({
+            'success': True,
+            'results': {
+                'scenario_names': parsed['scenario_names'],
+                'criteria_names': parsed['criteria_names'],
+                'criteria_types': parsed['criteria_types'],
+                'alternative_names': parsed['alternative_names'],
+                'detail': detail,
+                'critic': critic_result,
+                'aggregate': {'method': method, 'weights': combined.tolist()},
+                'spread': weight_spread(engine.weights, combined),
+                'meta': engine_meta(engine, 'critic')
+            }
+        }, request.form)
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
 
 
 # ========== TOPSIS ROUTES ==========
 
-@app.route('/topsis')
+@bp.route('/topsis')
 def topsis_page():
     """TOPSIS veri giris sayfasi"""
     return render_template('topsis_input.html')
 
 
-@app.route('/topsis/upload-excel', methods=['POST'])
+@bp.route('/topsis/upload-excel', methods=['POST'])
 def topsis_upload_excel():
     """TOPSIS icin Excel dosyasini yukle ve parse et"""
     return upload_excel_with_weights()
 
 
-@app.route('/topsis/analyze', methods=['POST'])
+def run_topsis_analysis(data, progress=None):
+    """
+    TOPSIS analizini yap ve sonucu sakla (senkron route ve arka plan isleri icin)
+
+    Args:
+        data: Istek govdesi (matrix, weights, criteria_types, criteria_names,
+              alternative_names, detail, istege bagli k)
+        progress: Istege bagli progress(adim, oran) geri cagirimi
+
+    Returns:
+        tuple: (sonuclar, donusum raporu)
+    """
+    report = progress or (lambda step, fraction: None)
+    report('parse', 0.0)
+
+    # Verileri al ve float'a cevir (tek geciste, parse_value kurallariyla)
+    with timed('parse'):
+        decision_matrix, coercion = coerce_matrix(data['matrix'])
+    note_matrix_size(decision_matrix.size)
+
+    weights = coerce_array(data['weights'])
+
+    criteria_types = data['criteria_types']
+    criteria_names = data['criteria_names']
+    alternative_names = data['alternative_names']
+    detail = data.get('detail', 'full')
+    # k verilirse yalnizca en iyi k alternatif hesaplanip dondurulur
+    k = parse_top_k(data.get('k'))
+
+    results = {
+        'criteria_names': criteria_names,
+        'alternative_names': alternative_names,
+        'decision_matrix': decision_matrix.tolist(),
+        'criteria_types': criteria_types,
+        'weights': weights.tolist(),
+        'detail': detail
+    }
+    if k:
+        results['top_k'] = k
+    report('parse', 0.1)
+
+    # TOPSIS (ayni problem daha once hesaplandiysa onbellekten)
+    cache_key = make_key(f'topsis:{detail}' + (f':top{k}' if k else ''),
+                         decision_matrix, criteria_types, weights)
+    engine = TOPSIS(decision_matrix, weights, criteria_types)
+    topsis_result = RESULT_CACHE.get_or_compute(
+        cache_key, lambda: engine.run(
+            detail, lambda step, fraction: report(step, 0.1 + 0.8 * fraction), k=k)
+    )
+    results['topsis'] = topsis_result
+    results['meta'] = engine_meta(engine, 'topsis')
+
+    # Dosyaya kaydet (session yerine)
+    report('save', 0.9)
+    with timed('save'):
+        store_run('topsis', results)
+    return results, coercion
+
+
+@bp.route('/topsis/analyze', methods=['POST'])
 def topsis_analyze():
     """TOPSIS analizi yap"""
     try:
-        data = request.get_json()
+        data = read_json()
+        results, coercion = run_topsis_analysis(data)
+
+        return json_result({
+            'success': True,
+            'results': lean_results(results, results['detail']),
+            'coercion': coercion
+        }, data)
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
 
-        # Verileri al ve float'a cevir
-        raw_matrix = data['matrix']
-        parsed_matrix = [[parse_value(cell) for cell in row] for row in raw_matrix]
-        decision_matrix = np.array(parsed_matrix, dtype=float)
+# Toplu TOPSIS'te tek seferde islenen agirlik vektoru sayisinin ust siniri
+MAX_BATCH_CHUNK = 4096
 
-        raw_weights = data['weights']
-        weights = np.array([parse_value(w) for w in raw_weights], dtype=float)
+
+@bp.route('/topsis/analyze-batch', methods=['POST'])
+def topsis_analyze_batch():
+    """Ayni karar matrisi icin birden fazla agirlik vektoruyle TOPSIS"""
+    try:
+        data = read_json()
+
+        with timed('parse'):
+            decision_matrix, coercion = coerce_matrix(data['matrix'])
+        note_matrix_size(decision_matrix.size)
+        weights_matrix = coerce_array(data['weights_matrix'])
 
         criteria_types = data['criteria_types']
-        criteria_names = data['criteria_names']
-        alternative_names = data['alternative_names']
-
-        results = {
-            'criteria_names': criteria_names,
-            'alternative_names': alternative_names,
-            'decision_matrix': decision_matrix.tolist(),
-            'criteria_types': criteria_types,
-            'weights': weights.tolist()
-        }
+        chunk_size = int(data.get('chunk_size', 256))
+        if chunk_size < 1:
+            raise ValueError('chunk_size en az 1 olmali')
+        chunk_size = min(chunk_size, MAX_BATCH_CHUNK)
 
-        # TOPSIS
-        topsis = TOPSIS(decision_matrix, weights, criteria_types)
-        topsis_result = topsis.run()
-        results['topsis'] = topsis_result
+        topsis = TOPSIS(decision_matrix, weights_matrix[0], criteria_types)
+        batch_result = topsis.run_batch(weights_matrix, chunk_size=chunk_size)
 
-        # Dosyaya kaydet (session yerine)
-        save_results('topsis_results.json', results)
+        return jsonify({
+            'success': True,
+            'results': {
+                'closeness': batch_result['closeness'].tolist(),
+                'ranking': batch_result['ranking'].tolist()
+            },
+            'coercion': coercion
+        })
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
+
+@bp.route('/topsis/sensitivity', methods=['POST'])
+def topsis_sensitivity():
+    """Son (veya kimligi verilen) TOPSIS sonucu icin Monte Carlo agirlik duyarlilik analizi"""
+    data = request.get_json(silent=True) or {}
+    results = load_run('topsis', data.get('run_id'))
+    if not results:
+        return jsonify({'success': False, 'error': 'Sonuc bulunamadi'}), 404
+
+    try:
+
+        # Temel agirliklar: varsayilan TOPSIS agirliklari, istenirse CRITIC agirliklari
+        base_weights = results['weights']
+        if data.get('weights_source') == 'critic':
+            critic_results = load_run('critic', data.get('critic_run_id'))
+            if not critic_results or len(critic_results['critic']['weights']) != len(base_weights):
+                return jsonify({'success': False, 'error': 'Uyumlu CRITIC sonucu bulunamadi'}), 404
+            base_weights = critic_results['critic']['weights']
+
+        analysis = WeightSensitivity(
+            results['decision_matrix'],
+            base_weights,
+            results['criteria_types'],
+            method=data.get('method', 'dirichlet'),
+            concentration=float(data.get('concentration', 100.0)),
+            perturbation=float(data.get('perturbation', 0.1)),
+            seed=int(data.get('seed', 42))
+        )
+        n_samples, n_workers = sampling_options(data)
+        summary = analysis.run(n_samples=n_samples, n_workers=n_workers)
+        summary['alternative_names'] = results['alternative_names']
+        summary['criteria_names'] = results['criteria_names']
 
         return jsonify({
             'success': True,
-            'results': results
+            'results': summary
         })
 
     except Exception as e:
@@ -255,118 +912,394 @@ def topsis_analyze():
         }), 400
 
 
-@app.route('/topsis/dashboard')
-def topsis_dashboard():
-    """TOPSIS dashboard sayfasi"""
-    results = load_results('topsis_results.json')
-    return render_template('topsis_dashboard.html', results=results)
+# Kararlilik analizinde kaba izgaranin en fazla nokta sayisi
+MAX_GRID_SIZE = 10001
 
 
-@app.route('/topsis/download-excel')
-def topsis_download_excel():
-    """TOPSIS sonuclarini Excel olarak indir"""
-    results = load_results('topsis_results.json')
+@bp.route('/topsis/stability', methods=['POST'])
+def topsis_stability():
+    """Son (veya kimligi verilen) TOPSIS sonucu icin kriter basina kesin agirlik kararlilik araliklari"""
+    data = request.get_json(silent=True) or {}
+    results = load_run('topsis', data.get('run_id'))
     if not results:
-        return jsonify({'error': 'Sonuc bulunamadi'}), 404
+        return jsonify({'success': False, 'error': 'Sonuc bulunamadi'}), 404
 
-    # Excel dosyasi olustur
-    output = io.BytesIO()
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        # Siralama sonuclari
-        ranking_df = pd.DataFrame({
-            'Alternatif': results['alternative_names'],
-            'Yakinlik Katsayisi (C)': results['topsis']['closeness'],
-            'Siralama': results['topsis']['ranking'],
-            'D+ (Ideal Uzaklik)': results['topsis']['distance_positive'],
-            'D- (Negatif-Ideal Uzaklik)': results['topsis']['distance_negative']
-        })
-        ranking_df = ranking_df.sort_values('Siralama')
-        ranking_df.to_excel(writer, sheet_name='Siralama Sonuclari', index=False)
-
-        # Agirlikli normalize matris
-        weighted_df = pd.DataFrame(
-            results['topsis']['weighted_matrix'],
-            columns=results['criteria_names'],
-            index=results['alternative_names']
+    try:
+        analysis = WeightStability(
+            results['decision_matrix'],
+            results['weights'],
+            results['criteria_types']
         )
-        weighted_df.to_excel(writer, sheet_name='Agirlikli Normalize Matris')
+        grid_size = min(max(int(data.get('grid_size', 201)), 2), MAX_GRID_SIZE)
+        with timed('stability'):
+            summary = analysis.run(grid_size=grid_size)
+        summary['alternative_names'] = results['alternative_names']
+        summary['criteria_names'] = results['criteria_names']
+
+        return jsonify({
+            'success': True,
+            'results': summary
+        })
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
 
-        # Ideal cozumler
-        ideal_df = pd.DataFrame({
-            'Kriter': results['criteria_names'],
-            'Ideal (A+)': results['topsis']['ideal_positive'],
-            'Negatif-Ideal (A-)': results['topsis']['ideal_negative']
+def load_edit_session(run_id):
+    """
+    Duzenlenecek TOPSIS calismasini artimli modele yukle (listelere cevirmeden)
+
+    Returns:
+        tuple: (IncrementalTOPSIS, matrissiz sonuc meta verisi) veya None
+    """
+    loaded = RESULT_STORE.load_arrays(run_id) if run_id and run_id.startswith('topsis-') else None
+    if loaded is not None:
+        meta, arrays = loaded
+        results = dict(meta['results'])
+        results.update({path: arr for path, arr in arrays.items() if '/' not in path})
+    else:
+        # Kimliksiz eski sonuclar yalnizca JSON olarak bulunur
+        results = None if run_id else load_run('topsis')
+        if not results:
+            return None
+
+    model = IncrementalTOPSIS(results['decision_matrix'], results['weights'], results['criteria_types'])
+    meta = {key: value.tolist() if isinstance(value, np.ndarray) else value
+            for key, value in results.items()
+            if key not in ('decision_matrix', 'weights', 'topsis', 'top_k', 'run_id')}
+    return model, meta
+
+
+def store_edit(model, meta):
+    """Duzenlenen modeli 'summary' detayiyla yeni calisma olarak sakla (tam detay istenince hesaplanir)"""
+    results = dict(meta, decision_matrix=model.decision_matrix, weights=model.weights,
+                   detail='summary', topsis=model.result('summary'))
+    return store_run('topsis', results, write_json=False)
+
+
+@bp.route('/topsis/edit', methods=['POST'])
+def topsis_edit():
+    """
+    Kayitli TOPSIS sonucunda tek bir alternatifi ekle/sil/guncelle
+
+    Govde: run_id, op ('add', 'remove', 'update'), index, row, alternative_name
+    (add: yeni ad, update: istege bagli yeniden adlandirma)
+
+    Artimli model onbellekte kalir ve sonraki duzenlemelerin kaynagidir; yeni
+    calisma 'summary' detayiyla kaydedilir. Yanit yeni calisma kimligini,
+    duzenlenen alternatifin yakinlik katsayisi ve sirasini ve sirasi degisen
+    alternatiflerin indeksleri ile yeni siralarini icerir.
+    """
+    try:
+        data = read_json() or {}
+
+        with INCREMENTAL_LOCK:
+            previous_id = data.get('run_id') or latest_run_id('topsis')
+            session = INCREMENTAL_MODELS.get(previous_id) if previous_id else None
+            if session is None:
+                session = load_edit_session(previous_id)
+                if session is None:
+                    return jsonify({'success': False, 'error': 'Sonuc bulunamadi'}), 404
+            model, meta = session
+
+            # Model yerinde degisir; islem veya kayit basarisiz olursa onbellekteki
+            # model kayitli sonucla uyusmaz, bu yuzden cikarilir
+            try:
+                op = data.get('op')
+                names = meta['alternative_names']
+                if op == 'add':
+                    moved = model.add_alternative(coerce_array(data['row']))
+                    index = model.n_alternatives - 1
+                    names.append(data.get('alternative_name') or f'A{model.n_alternatives}')
+                elif op == 'remove':
+                    index = int(data['index'])
+                    moved = model.remove_alternative(index)
+                    del names[index]
+                    index = None
+                elif op == 'update':
+                    index = int(data['index'])
+                    moved = model.update_alternative(index, coerce_array(data['row']))
+                    if data.get('alternative_name'):
+                        names[index] = data['alternative_name']
+                else:
+                    raise ValueError(f"Bilinmeyen islem: {op}")
+
+                with timed('save'):
+                    run_id = store_edit(model, meta)
+            except Exception:
+                if previous_id:
+                    INCREMENTAL_MODELS.discard(previous_id)
+                raise
+
+            if previous_id:
+                INCREMENTAL_MODELS.discard(previous_id)
+            INCREMENTAL_MODELS.set(run_id, session)
+
+        edited = {} if index is None else {
+            'index': index,
+            'closeness': float(model.closeness[index]),
+            'rank': int(model.ranking[index])
+        }
+        return jsonify({
+            'success': True,
+            'run_id': run_id,
+            'n_alternatives': model.n_alternatives,
+            'edited': edited,
+            'moved': moved.tolist(),
+            'moved_ranking': model.ranking[moved].tolist()
         })
-        ideal_df.to_excel(writer, sheet_name='Ideal Cozumler', index=False)
-
-    output.seek(0)
-    return send_file(
-        output,
-        mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-        as_attachment=True,
-        download_name='topsis_sonuclari.xlsx'
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
+
+@bp.route('/topsis/dashboard')
+def topsis_dashboard():
+    """TOPSIS dashboard sayfasi (?k=N: yalnizca en iyi N alternatif)"""
+    try:
+        k = parse_top_k(request.args.get('k'))
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    with timed('load'):
+        view = load_view('topsis', request.args.get('run_id'))
+    with timed('render'):
+        return render_template('topsis_dashboard.html', summary=view and view.summary(k))
+
+
+@bp.route('/topsis/download-excel')
+def topsis_download_excel():
+    """
+    TOPSIS sonuclarini indir (?k=N: yalnizca en iyi N alternatif)
+
+    ?format=xlsx (varsayilan, tum sayfalar), csv veya parquet (tek tablo,
+    ?table=ideal-cozumler gibi; varsayilan siralama sonuclari)
+    """
+    return export_response('topsis', 'topsis_sonuclari')
+
+
+# ========== CRITIC -> TOPSIS ==========
+
+def run_pipeline_analysis(data, progress=None):
+    """
+    CRITIC agirliklariyla TOPSIS analizini tek istekte yap
+
+    Matris bir kez cevrilir ve iki yontem ayni diziyi paylasir. CRITIC ve
+    TOPSIS sonuclari ayri calismalar olarak saklanir (dashboard'lar icin);
+    TOPSIS kaydi CRITIC kaydinin kimligini critic_run_id olarak tutar.
+
+    Returns:
+        tuple: (birlesik sonuclar, donusum raporu); run_id TOPSIS kaydinin kimligidir
+    """
+    report = progress or (lambda step, fraction: None)
+    report('parse', 0.0)
+
+    with timed('parse'):
+        decision_matrix, coercion = coerce_matrix(data['matrix'])
+    note_matrix_size(decision_matrix.size)
+    criteria_types = data['criteria_types']
+    detail = data.get('detail', 'full')
+
+    common = {
+        'criteria_names': data['criteria_names'],
+        'alternative_names': data['alternative_names'],
+        'decision_matrix': decision_matrix.tolist(),
+        'criteria_types': criteria_types,
+        'detail': detail
+    }
+    report('parse', 0.1)
+
+    cache_key = make_key(f'pipeline:{detail}', decision_matrix, criteria_types)
+    engine = CriticTopsis(decision_matrix, criteria_types)
+    combined = RESULT_CACHE.get_or_compute(
+        cache_key, lambda: engine.run(
+            detail, lambda step, fraction: report(step, 0.1 + 0.8 * fraction))
+    )
+    meta = engine_meta(engine, 'pipeline')
+
+    report('save', 0.9)
+    with timed('save'):
+        critic_results = dict(common, critic=combined['critic'], meta=meta)
+        critic_run_id = store_run('critic', critic_results)
+
+        topsis_results = dict(common, weights=combined['critic']['weights'],
+                              topsis=combined['topsis'], critic_run_id=critic_run_id, meta=meta)
+        run_id = store_run('topsis', topsis_results)
+
+    results = dict(common, weights=combined['critic']['weights'], critic=combined['critic'],
+                   topsis=combined['topsis'], critic_run_id=critic_run_id, run_id=run_id, meta=meta)
+    return results, coercion
+
+
+@bp.route('/pipeline/analyze', methods=['POST'])
+def pipeline_analyze():
+    """CRITIC agirliklari + TOPSIS siralamasi (govde /critic/analyze ile ayni)"""
+    try:
+        data = read_json()
+        results, coercion = run_pipeline_analysis(data)
+
+        return json_result({
+            'success': True,
+            'results': lean_results(results, results['detail']),
+            'coercion': coercion
+        }, data)
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
+
+# ========== KAYITLI YONTEMLER ==========
+
+def method_params(cls, data):
+    """
+    Istekteki yonteme ozgu parametreleri dogrula
+
+    Yalnizca yontemin kayitta bildirdigi parametreler (cls.method_params)
+    kabul edilir; ic ayarlar (tile_size, vectorized, ...) istemciye acik degildir.
+
+    Args:
+        cls: Kayitli yontem sinifi
+        data: Istek govdesi
+
+    Returns:
+        dict: Motor kurucusuna gecirilecek parametreler
+    """
+    params = data.get('params') or {}
+    if not isinstance(params, dict):
+        raise ValueError('params bir nesne olmali')
+    unknown = sorted(set(params) - set(cls.method_params))
+    if unknown:
+        allowed = ', '.join(cls.method_params) or 'yok'
+        raise ValueError(f"{cls.method_name} icin gecersiz parametre: {', '.join(unknown)} (izinli: {allowed})")
+    return params
+
+
+def run_method_analysis(method, data, progress=None):
+    """
+    Kayitli herhangi bir yontemle analiz yap ve sonucu sakla
+
+    Args:
+        method: Yontem adi (methods.available_methods() icinden)
+        data: Istek govdesi (matrix, criteria_types, criteria_names, alternative_names,
+              siralama yontemleri icin weights, istege bagli params ve detail)
+        progress: Istege bagli progress(adim, oran) geri cagirimi
+
+    Returns:
+        tuple: (sonuclar, donusum raporu)
+    """
+    cls = get_method(method)
+    if cls is None:
+        raise ValueError(f"Bilinmeyen yontem: {method}")
+
+    report = progress or (lambda step, fraction: None)
+    report('parse', 0.0)
+
+    with timed('parse'):
+        decision_matrix, coercion = coerce_matrix(data['matrix'])
+    note_matrix_size(decision_matrix.size)
+    criteria_types = data['criteria_types']
+    weights = coerce_array(data['weights']) if cls.method_kind == RANKING else None
+    params = method_params(cls, data)
+    detail = data.get('detail', 'full')
+
+    results = {
+        'criteria_names': data['criteria_names'],
+        'alternative_names': data['alternative_names'],
+        'decision_matrix': decision_matrix.tolist(),
+        'criteria_types': criteria_types,
+        'params': params,
+        'detail': detail
+    }
+    if weights is not None:
+        results['weights'] = weights.tolist()
+    report('parse', 0.1)
+
+    cache_key = make_key(f'{method}:{detail}:{json.dumps(params, sort_keys=True)}',
+                         decision_matrix, criteria_types, weights)
+    engine = create(method, decision_matrix, criteria_types, weights, **params)
+    results[method] = RESULT_CACHE.get_or_compute(
+        cache_key, lambda: engine.run(
+            detail, lambda step, fraction: report(step, 0.1 + 0.8 * fraction))
     )
+    results['meta'] = engine_meta(engine, method)
+
+    report('save', 0.9)
+    with timed('save'):
+        store_run(method, results)
+    return results, coercion
+
+
+@bp.route('/<method>/analyze', methods=['POST'])
+def method_analyze(method):
+    """Kayitli yontemle analiz yap (entropy, vikor, edas, ...)"""
+    if get_method(method) is None:
+        return jsonify({'success': False, 'error': f"Bilinmeyen yontem: {method}"}), 404
+
+    try:
+        data = read_json()
+        results, coercion = run_method_analysis(method, data)
+
+        return json_result({
+            'success': True,
+            'results': lean_results(results, results['detail']),
+            'coercion': coercion
+        }, data)
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
+
+@bp.route('/api/methods')
+def api_methods():
+    """Kayitli yontemler ve turleri ('weighting' veya 'ranking')"""
+    return jsonify(available_methods())
 
 
 # ========== HELPER FUNCTIONS ==========
 
+def _validate_upload():
+    """Yuklenen dosyayi kontrol et; (dosya, hata yaniti) dondur"""
+    if 'file' not in request.files:
+        return None, jsonify({'success': False, 'error': 'Dosya bulunamadi'})
+
+    file = request.files['file']
+    if file.filename == '':
+        return None, jsonify({'success': False, 'error': 'Dosya secilmedi'})
+
+    if not file.filename.lower().endswith(('.xlsx', '.xls', '.csv')):
+        return None, jsonify({'success': False, 'error': 'Sadece Excel (.xlsx, .xls) veya CSV dosyalari desteklenir'})
+
+    return file, None
+
+
 def upload_excel_generic():
-    """Genel Excel yukleme fonksiyonu"""
+    """Genel Excel/CSV yukleme fonksiyonu"""
     try:
-        if 'file' not in request.files:
-            return jsonify({'success': False, 'error': 'Dosya bulunamadi'})
-
-        file = request.files['file']
-        if file.filename == '':
-            return jsonify({'success': False, 'error': 'Dosya secilmedi'})
-
-        if not file.filename.endswith(('.xlsx', '.xls')):
-            return jsonify({'success': False, 'error': 'Sadece Excel dosyalari (.xlsx, .xls) desteklenir'})
-
-        # Excel dosyasini oku
-        df = pd.read_excel(file, header=None)
-        data = df.values.tolist()
-
-        # Formati belirle
-        first_row = [str(x).lower().strip() for x in data[0][1:] if pd.notna(x)]
-        is_advanced_format = all(x in ['min', 'max', 'maks', 'maliyet', 'fayda'] for x in first_row if x)
-
-        if is_advanced_format:
-            # Gelismis format: Ilk satir yonler
-            criteria_types = []
-            for val in data[0][1:]:
-                if pd.notna(val):
-                    val_str = str(val).lower().strip()
-                    if val_str in ['min', 'maliyet']:
-                        criteria_types.append('min')
-                    elif val_str in ['max', 'maks', 'fayda']:
-                        criteria_types.append('max')
-
-            criteria_names = [str(x) for x in data[1][1:] if pd.notna(x)]
-            alternative_names = [str(row[0]) for row in data[2:] if pd.notna(row[0]) and not str(row[0]).lower().startswith(('min', 'max', 'maks'))]
-            matrix = []
-            for row in data[2:]:
-                if pd.notna(row[0]) and not str(row[0]).lower().startswith(('min', 'max', 'maks')):
-                    matrix_row = [parse_value(x) for x in row[1:len(criteria_names)+1]]
-                    matrix.append(matrix_row)
-        else:
-            # Basit format: Ilk satir kriter adlari
-            criteria_names = [str(x) for x in data[0][1:] if pd.notna(x)]
-            criteria_types = ['max'] * len(criteria_names)
-            alternative_names = [str(row[0]) for row in data[1:] if pd.notna(row[0])]
-            matrix = []
-            for row in data[1:]:
-                if pd.notna(row[0]):
-                    matrix_row = [parse_value(x) for x in row[1:len(criteria_names)+1]]
-                    matrix.append(matrix_row)
+        file, error = _validate_upload()
+        if error:
+            return error
+
+        # Satirlar akis halinde okunur, matris dogrudan float64 diziye cevrilir
+        parsed = parse_generic_rows(iter_rows(file))
 
         return jsonify({
             'success': True,
             'data': {
-                'criteria_names': criteria_names,
-                'criteria_types': criteria_types,
-                'alternative_names': alternative_names,
-                'matrix': matrix
+                'criteria_names': parsed['criteria_names'],
+                'criteria_types': parsed['criteria_types'],
+                'alternative_names': parsed['alternative_names'],
+                'matrix': parsed['matrix'].tolist()
             }
         })
 
@@ -375,63 +1308,27 @@ def upload_excel_generic():
 
 
 def upload_excel_with_weights():
-    """Agirlikli Excel yukleme fonksiyonu (TOPSIS icin)"""
+    """Agirlikli Excel/CSV yukleme fonksiyonu (TOPSIS icin)"""
     try:
-        if 'file' not in request.files:
-            return jsonify({'success': False, 'error': 'Dosya bulunamadi'})
-
-        file = request.files['file']
-        if file.filename == '':
-            return jsonify({'success': False, 'error': 'Dosya secilmedi'})
-
-        if not file.filename.endswith(('.xlsx', '.xls')):
-            return jsonify({'success': False, 'error': 'Sadece Excel dosyalari (.xlsx, .xls) desteklenir'})
-
-        # Excel dosyasini oku
-        df = pd.read_excel(file, header=None)
-        data = df.values.tolist()
+        file, error = _validate_upload()
+        if error:
+            return error
 
         # TOPSIS format:
         # Satir 0: Kriter adlari
         # Satir 1: Kriter yonleri (min/max)
         # Satir 2: Agirliklar
         # Satir 3+: Alternatifler
-
-        criteria_names = [str(x) for x in data[0][1:] if pd.notna(x)]
-        n_criteria = len(criteria_names)
-
-        # Kriter yonleri
-        criteria_types = []
-        for val in data[1][1:n_criteria+1]:
-            if pd.notna(val):
-                val_str = str(val).lower().strip()
-                if val_str in ['min', 'maliyet']:
-                    criteria_types.append('min')
-                else:
-                    criteria_types.append('max')
-            else:
-                criteria_types.append('max')
-
-        # Agirliklar
-        weights = [parse_value(x) for x in data[2][1:n_criteria+1]]
-
-        # Alternatifler
-        alternative_names = []
-        matrix = []
-        for row in data[3:]:
-            if pd.notna(row[0]):
-                alternative_names.append(str(row[0]))
-                matrix_row = [parse_value(x) for x in row[1:n_criteria+1]]
-                matrix.append(matrix_row)
+        parsed = parse_weighted_rows(iter_rows(file))
 
         return jsonify({
             'success': True,
             'data': {
-                'criteria_names': criteria_names,
-                'criteria_types': criteria_types,
-                'weights': weights,
-                'alternative_names': alternative_names,
-                'matrix': matrix
+                'criteria_names': parsed['criteria_names'],
+                'criteria_types': parsed['criteria_types'],
+                'weights': parsed['weights'].tolist(),
+                'alternative_names': parsed['alternative_names'],
+                'matrix': parsed['matrix'].tolist()
             }
         })
 
@@ -439,47 +1336,263 @@ def upload_excel_with_weights():
         return jsonify({'success': False, 'error': str(e)})
 
 
+# ========== ARKA PLAN ISLERI ==========
+
+JOB_RUNNERS = {
+    'critic': run_critic_analysis,
+    'topsis': run_topsis_analysis,
+    'pipeline': run_pipeline_analysis,
+}
+
+
+# Tum analiz isteklerinde zorunlu alanlar (siralama yontemlerinde weights de)
+ANALYZE_FIELDS = ('matrix', 'criteria_types', 'criteria_names', 'alternative_names')
+
+
+def missing_fields(method, data):
+    """Is kuyruga alinmadan once eksik zorunlu alanlar"""
+    fields = ANALYZE_FIELDS
+    if method == 'topsis' or (method not in JOB_RUNNERS and get_method(method).method_kind == RANKING):
+        fields += ('weights',)
+    return [field for field in fields if field not in data]
+
+
+def _analysis_job(report, method, data):
+    """Arka plan isi: analizi yap, yalnizca kimlik ve donusum raporunu tut"""
+    try:
+        if method in JOB_RUNNERS:
+            results, coercion = JOB_RUNNERS[method](data, report)
+        else:
+            results, coercion = run_method_analysis(method, data, report)
+    except KeyError as e:
+        raise ValueError(f'Eksik alan: {e.args[0]}') from None
+    return {'run_id': results['run_id'], 'coercion': coercion}
+
+
+@bp.route('/jobs', methods=['POST'])
+def submit_job():
+    """Analizi arka plan isi olarak kuyruga ekle (govde: method + analyze istegi)"""
+    try:
+        data = read_json()
+        method = data.get('method')
+        if method not in JOB_RUNNERS and get_method(method) is None:
+            raise ValueError(f"Gecersiz yontem: {method}")
+        missing = missing_fields(method, data)
+        if missing:
+            raise ValueError(f"Eksik alan: {', '.join(missing)}")
+        if method == 'topsis':
+            parse_top_k(data.get('k'))
+        elif method not in JOB_RUNNERS:
+            method_params(get_method(method), data)
+
+        job = JOBS.submit(method, _analysis_job, method, data)
+        return jsonify({'success': True, 'job_id': job.id, 'status': job.status}), 202
+
+    except QueueFull as e:
+        return jsonify({'success': False, 'error': str(e)}), 503
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+
+@bp.route('/jobs/<job_id>')
+def job_status(job_id):
+    """Isin durumu ve ilerlemesi"""
+    job = JOBS.get(job_id)
+    if job is None:
+        return jsonify({'success': False, 'error': 'Is bulunamadi'}), 404
+    return jsonify({'success': True, **job.to_dict()})
+
+
+@bp.route('/jobs/<job_id>/result')
+def job_result(job_id):
+    """Tamamlanan isin sonuclari (analyze yanitiyla ayni bicim)"""
+    job = JOBS.get(job_id)
+    if job is None:
+        return jsonify({'success': False, 'error': 'Is bulunamadi'}), 404
+    if job.status != DONE:
+        return jsonify({'success': False, 'status': job.status, 'error': job.error or 'Is henuz tamamlanmadi'}), 409
+
+    run_id = job.result['run_id']
+    results = load_run(run_id.split('-', 1)[0], run_id)
+    if not results:
+        return jsonify({'success': False, 'error': 'Sonuc bulunamadi'}), 404
+    try:
+        return json_result({
+            'success': True,
+            'results': lean_results(results, results.get('detail', 'full')),
+            'coercion': job.result['coercion']
+        }, request.args)
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+
+@bp.route('/jobs/<job_id>/cancel', methods=['POST'])
+def cancel_job(job_id):
+    """Isi iptal et (calisan is bir sonraki adim sinirinda durur)"""
+    if JOBS.get(job_id) is None:
+        return jsonify({'success': False, 'error': 'Is bulunamadi'}), 404
+    cancelled = JOBS.cancel(job_id)
+    return jsonify({'success': cancelled, 'status': JOBS.get(job_id).status})
+
+
+@bp.route('/api/job-stats')
+def api_job_stats():
+    """Is kuyrugu doluluk ve durum sayaclari"""
+    return jsonify(JOBS.stats())
+
+
 # ========== LEGACY ROUTES (eski uyumluluk) ==========
 
-@app.route('/input')
+@bp.route('/input')
 def input_page():
     """Eski veri giris sayfasi - CRITIC'e yonlendir"""
     return render_template('critic_input.html')
 
 
-@app.route('/analyze', methods=['POST'])
+@bp.route('/analyze', methods=['POST'])
 def analyze():
     """Eski analyze - CRITIC'e yonlendir"""
     return critic_analyze()
 
 
-@app.route('/upload-excel', methods=['POST'])
+@bp.route('/upload-excel', methods=['POST'])
 def upload_excel():
     """Eski upload - CRITIC'e yonlendir"""
     return critic_upload_excel()
 
 
-@app.route('/dashboard')
+@bp.route('/dashboard')
 def dashboard_page():
     """Eski dashboard - CRITIC'e yonlendir"""
     return critic_dashboard()
 
 
-@app.route('/results')
+@bp.route('/results')
 def results_page():
-    """Sonuc sayfasi"""
-    results = load_results('critic_results.json')
-    return render_template('results.html', results=results)
+    """Sonuc sayfasi (matrisler /critic/data ile sayfa sayfa istenir)"""
+    with timed('load'):
+        view = load_view('critic', request.args.get('run_id'))
+    with timed('render'):
+        return render_template('results.html', summary=view and view.summary())
 
 
-@app.route('/api/results')
+@bp.route('/api/results')
 def api_results():
     """Sonuclari JSON olarak dondur"""
-    results = load_results('critic_results.json')
+    results = load_run('critic', request.args.get('run_id'))
+    if results:
+        return jsonify(results)
+    return jsonify({'error': 'No results found'}), 404
+
+
+@bp.route('/api/results/<run_id>')
+def api_results_by_id(run_id):
+    """Kimligi verilen calismanin sonuclarini JSON olarak dondur"""
+    kind = run_id.split('-', 1)[0]
+    results = load_run(kind, run_id)
     if results:
         return jsonify(results)
     return jsonify({'error': 'No results found'}), 404
 
 
+@bp.route('/<kind>/data/<name>')
+def result_data(kind, name):
+    """
+    Sonuc matrisi veya tablosunun bir sayfasi
+
+    ?run_id, ?offset, ?limit, ?sort (label, tablo sutunu veya matris sutun
+    indeksi), ?order=asc|desc, ?columns (bas:son veya 0,3,5), ?k (TOPSIS)
+    """
+    if kind not in ('critic', 'topsis'):
+        return jsonify({'success': False, 'error': f'Bilinmeyen sonuc turu: {kind}'}), 404
+    with timed('load'):
+        view = load_view(kind, request.args.get('run_id'))
+    if view is None:
+        return jsonify({'success': False, 'error': 'Sonuc bulunamadi'}), 404
+
+    try:
+        with timed('slice'):
+            page = view.page(
+                name,
+                offset=request.args.get('offset', 0, type=int),
+                limit=request.args.get('limit', PAGE_LIMIT, type=int),
+                sort=request.args.get('sort'),
+                descending=request.args.get('order') == 'desc',
+                columns=request.args.get('columns'),
+                k=parse_top_k(request.args.get('k'))
+            )
+        return jsonify({'success': True, 'run_id': view.run_id, **page})
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
+
+@bp.route('/<kind>/charts')
+def result_charts(kind):
+    """Dashboard grafikleri icin seyreltilmis seriler (?top, ?bins, ?k)"""
+    if kind not in ('critic', 'topsis'):
+        return jsonify({'success': False, 'error': f'Bilinmeyen sonuc turu: {kind}'}), 404
+    with timed('load'):
+        view = load_view(kind, request.args.get('run_id'))
+    if view is None:
+        return jsonify({'success': False, 'error': 'Sonuc bulunamadi'}), 404
+
+    try:
+        series = view.charts(
+            top=request.args.get('top', CHART_TOP, type=int),
+            bins=request.args.get('bins', HISTOGRAM_BINS, type=int),
+            k=parse_top_k(request.args.get('k'))
+        )
+        return jsonify({'success': True, 'run_id': view.run_id, 'series': series})
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
+
+@bp.route('/metrics')
+def metrics():
+    """Prometheus metin biciminde gecikme histogramlari, onbellek ve is sayaclari (isci basina pid etiketli)"""
+    workers = sorted(worker_metrics().items())
+    lines = LATENCY.render({pid: snapshot['latency'] for pid, snapshot in workers})
+    lines += [
+        '# HELP kds_cache_hits_total Sonuc onbellegi isabetleri',
+        '# TYPE kds_cache_hits_total counter',
+    ]
+    lines += [f'kds_cache_hits_total{{pid="{pid}"}} {snapshot["cache"]["hits"]}' for pid, snapshot in workers]
+    lines += [
+        '# HELP kds_cache_misses_total Sonuc onbellegi iskalari',
+        '# TYPE kds_cache_misses_total counter',
+    ]
+    lines += [f'kds_cache_misses_total{{pid="{pid}"}} {snapshot["cache"]["misses"]}' for pid, snapshot in workers]
+    lines += [
+        '# HELP kds_jobs Durumlarina gore arka plan isleri',
+        '# TYPE kds_jobs gauge',
+    ]
+    lines += [f'kds_jobs{{status="{status}",pid="{pid}"}} {count}'
+              for pid, snapshot in workers for status, count in snapshot['jobs'].items()]
+    return current_app.response_class('\n'.join(lines) + '\n', mimetype='text/plain; version=0.0.4')
+
+
+@bp.route('/api/cache-stats')
+def api_cache_stats():
+    """Sonuc onbellegi isabet/iska sayaclari (tum iscilerin toplami ve isci bazinda)"""
+    workers = {pid: snapshot['cache'] for pid, snapshot in worker_metrics().items()}
+    stats = RESULT_CACHE.stats()
+    for key in ('hits', 'misses', 'size'):
+        stats[key] = sum(worker[key] for worker in workers.values())
+    total = stats['hits'] + stats['misses']
+    stats['hit_rate'] = stats['hits'] / total if total else 0.0
+    stats['workers'] = {str(pid): worker for pid, worker in sorted(workers.items())}
+    return jsonify(stats)
+
+
 if __name__ == '__main__':
-    app.run(debug=True, port=5000)
+    # Gelistirme sunucusu; uretimde: gunicorn -c gunicorn.conf.py
+    create_app().run(debug=os.environ.get('KDS_DEBUG', '1') == '1',
+                     port=int(os.environ.get('KDS_PORT', 5000)))
@@ -0,0 +1,359 @@
+"""
+Cok sayida calisma kitabi icin komut satirindan toplu CRITIC/TOPSIS analizi
+
+Dosyalar web arayuzundeki yukleme kurallariyla (ingest.parse_generic_rows /
+parse_weighted_rows) okunur ve bir surec havuzunda islenir. Her dosya icin
+bir JSON sonucu, tum dosyalar icin summary.csv ve summary.json yazilir.
+Flask ve sablonlar yuklenmez; pandas yalnizca .xls dosyalari icin yuklenir.
+
+Kullanim:
+    python -m batch senaryolar/ --method critic --output sonuclar/
+    python -m batch "senaryolar/*.xlsx" --method pipeline --workers 8
+    python -m batch matrisler/*.npy --method topsis --types min,max,max --weights 0.2,0.3,0.5
+    python -m batch buyuk/*.npy --method pipeline --types min,max,max --blocked float32
+
+--blocked ile .npy dosyalari bellege eslenir ve BlockedCRITIC/BlockedTOPSIS
+ile satir bloklari halinde islenir (critic, topsis, pipeline; 'full' detay yok).
+Alternatif bazli sonuclar (closeness, ranking, distance_*) JSON'un yanina
+<cikti>.<yol>.npy olarak yazilir, JSON'da dosya adi yer alir; alternatif
+adlari uretilmez (A1..Am).
+"""
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from ingest import iter_rows, parse_generic_rows, parse_weighted_rows
+from methods import BlockedCRITIC, BlockedTOPSIS, CriticTopsis, available_methods, create, open_matrix
+from methods.blocked import DTYPES
+from methods.registry import DETAIL_LEVELS, RANKING
+
+INPUT_EXTENSIONS = ('.xlsx', '.xls', '.csv', '.npy')
+BLOCKED_METHODS = ('critic', 'topsis', 'pipeline')
+
+SUMMARY_FIELDS = ['dosya', 'durum', 'alternatif_sayisi', 'kriter_sayisi', 'en_iyi', 'sure', 'hata']
+
+
+def collect_inputs(patterns):
+    """
+    Klasor, glob deseni veya dosya yollarini desteklenen dosyalara genislet
+
+    Klasorler ozyinelemesiz taranir; gecici Excel dosyalari (~$...) atlanir.
+    Sonuc sirali ve tekrarsizdir.
+    """
+    paths = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            candidates = [os.path.join(pattern, name) for name in os.listdir(pattern)]
+        else:
+            candidates = glob.glob(pattern) or [pattern]
+        for path in candidates:
+            name = os.path.basename(path)
+            if name.lower().endswith(INPUT_EXTENSIONS) and not name.startswith('~$'):
+                paths.append(os.path.normpath(path))
+    return sorted(set(paths))
+
+
+def _method_kind(method):
+    """'pipeline' CRITIC bicimindeki dosyalarla calisir"""
+    return 'pipeline' if method == 'pipeline' else available_methods()[method]
+
+
+def read_input(path, kind, criteria_types=None, weights=None, blocked=False):
+    """
+    Dosyayi yontem turune uygun bicimde oku
+
+    .npy dosyalari yalnizca matris icerir; kriter yonleri (ve siralama
+    yontemleri icin agirliklar) komut satirindan verilir, adlar uretilir.
+    blocked ise matris kopyalanmadan bellege eslenir ve alternatif adlari
+    uretilmez (None; A1..Am kabul edilir).
+
+    Returns:
+        dict: criteria_names, criteria_types, alternative_names, matrix
+              (siralama yontemlerinde weights dahil)
+    """
+    if blocked and not path.lower().endswith('.npy'):
+        raise ValueError('--blocked yalnizca .npy girdileriyle kullanilabilir')
+    if path.lower().endswith('.npy'):
+        if blocked:
+            matrix = open_matrix(path)
+        else:
+            matrix = np.load(path, allow_pickle=False).astype(float, copy=False)
+        if matrix.ndim != 2:
+            raise ValueError(f'Karar matrisi 2 boyutlu olmali: {matrix.shape}')
+        m, n = matrix.shape
+        parsed = {
+            'criteria_names': [f'K{j + 1}' for j in range(n)],
+            'criteria_types': list(criteria_types) if criteria_types else ['max'] * n,
+            'alternative_names': None if blocked else [f'A{i + 1}' for i in range(m)],
+            'matrix': matrix
+        }
+        if kind == RANKING:
+            if weights is None:
+                raise ValueError('.npy girdileri icin --weights gerekli')
+            parsed['weights'] = np.asarray(weights, dtype=float)
+    else:
+        with open(path, 'rb') as f:
+            parse = parse_weighted_rows if kind == RANKING else parse_generic_rows
+            parsed = parse(iter_rows(f))
+        if criteria_types:
+            parsed['criteria_types'] = list(criteria_types)
+
+    if 0 in parsed['matrix'].shape:
+        raise ValueError('Dosyada alternatif veya kriter bulunamadi')
+    if len(parsed['criteria_types']) != parsed['matrix'].shape[1]:
+        raise ValueError(f"Kriter yonu sayisi ({len(parsed['criteria_types'])}) "
+                         f"kriter sayisina ({parsed['matrix'].shape[1]}) esit olmali")
+    return parsed
+
+
+def analyze_blocked(parsed, method, detail, dtype):
+    """
+    Bellege eslenmis matrisle bloklu CRITIC/TOPSIS (pipeline: ikisi art arda)
+
+    Returns:
+        tuple: (sonuc sozlugu, adim sureleri)
+    """
+    matrix, criteria_types = parsed['matrix'], parsed['criteria_types']
+    if method == 'critic':
+        engine = BlockedCRITIC(matrix, criteria_types, dtype=dtype)
+        return engine.run(detail), engine.timings
+    if method == 'topsis':
+        engine = BlockedTOPSIS(matrix, parsed['weights'], criteria_types, dtype=dtype)
+        return engine.run(detail), engine.timings
+
+    critic = BlockedCRITIC(matrix, criteria_types, dtype=dtype)
+    critic_result = critic.run(detail)
+    topsis = BlockedTOPSIS(matrix, critic_result['weights'], criteria_types, dtype=dtype)
+    topsis_result = topsis.run(detail)
+    return ({'critic': critic_result, 'topsis': topsis_result},
+            {'critic': critic.timings, 'topsis': topsis.timings})
+
+
+def analyze(parsed, method, detail, params=None, blocked=None):
+    """
+    Yontemi calistir
+
+    Args:
+        blocked: Verilirse ('float32'/'float64') bloklu motorlar bu veri tipiyle kullanilir
+
+    Returns:
+        tuple: (sonuc sozlugu, adim sureleri)
+    """
+    if blocked:
+        return analyze_blocked(parsed, method, detail, blocked)
+    if method == 'pipeline':
+        engine = CriticTopsis(parsed['matrix'], parsed['criteria_types'])
+    else:
+        engine = create(method, parsed['matrix'], parsed['criteria_types'],
+                        weights=parsed.get('weights'), **(params or {}))
+    return engine.run(detail), engine.timings
+
+
+def best_label(parsed, method, result):
+    """Ozet icin en iyi alternatif (siralama) veya en agir kriter (agirliklandirma)"""
+    if method == 'pipeline':
+        result = result['topsis']
+    if 'ranking' in result:
+        if 'indices' in result:
+            index = result['indices'][0]
+        else:
+            index = int(np.argmin(result['ranking']))
+        names = parsed['alternative_names']
+        return names[index] if names is not None else f'A{index + 1}'
+    if 'weights' in result:
+        return parsed['criteria_names'][int(np.argmax(result['weights']))]
+    return ''
+
+
+def save_arrays(result, output_path, prefix=''):
+    """
+    Sonuctaki numpy dizilerini JSON'un yanina .npy olarak yaz (bloklu mod)
+
+    Dizinin yerine JSON'da dosya adi kalir; m uzunlugundaki sonuclar Python
+    listelerine cevrilmez.
+    """
+    stem = os.path.splitext(output_path)[0]
+    for key, value in result.items():
+        if isinstance(value, dict):
+            save_arrays(value, output_path, f'{prefix}{key}.')
+        elif isinstance(value, np.ndarray):
+            array_path = f'{stem}.{prefix}{key}.npy'
+            np.save(array_path, value)
+            result[key] = os.path.basename(array_path)
+
+
+def process_file(path, output_path, method, detail, criteria_types=None, weights=None, params=None,
+                 blocked=None):
+    """
+    Tek dosyayi oku, analiz et ve sonucunu JSON olarak yaz
+
+    Surec havuzunda calisabilmesi icin modul seviyesinde tanimlidir; hatalar
+    yakalanip ozet satirinda raporlanir.
+
+    Returns:
+        dict: Ozet satiri (SUMMARY_FIELDS)
+    """
+    start = time.perf_counter()
+    row = {'dosya': path, 'durum': 'hata', 'alternatif_sayisi': '', 'kriter_sayisi': '',
+           'en_iyi': '', 'sure': '', 'hata': ''}
+    try:
+        parsed = read_input(path, _method_kind(method), criteria_types, weights, bool(blocked))
+        result, timings = analyze(parsed, method, detail, params, blocked)
+        best = best_label(parsed, method, result)
+        save_arrays(result, output_path)
+
+        output = {
+            'file': path,
+            'method': method,
+            'detail': detail,
+            'criteria_names': parsed['criteria_names'],
+            'criteria_types': parsed['criteria_types'],
+            'alternative_names': parsed['alternative_names'],
+            method: result,
+            'timings': timings
+        }
+        if 'weights' in parsed:
+            output['weights'] = parsed['weights'].tolist()
+        if detail == 'full':
+            output['decision_matrix'] = parsed['matrix'].tolist()
+
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(output, f, ensure_ascii=False, separators=(',', ':'))
+
+        row.update({
+            'durum': 'tamam',
+            'alternatif_sayisi': parsed['matrix'].shape[0],
+            'kriter_sayisi': parsed['matrix'].shape[1],
+            'en_iyi': best
+        })
+    except Exception as e:
+        row['hata'] = f'{type(e).__name__}: {e}'
+    row['sure'] = round(time.perf_counter() - start, 4)
+    return row
+
+
+def output_paths(paths, output_dir):
+    """Girdi basina cikti JSON yolu (ayni adli dosyalar numaralandirilir)"""
+    seen = {}
+    outputs = []
+    for path in paths:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        count = seen.get(stem, 0)
+        seen[stem] = count + 1
+        name = f'{stem}-{count + 1}' if count else stem
+        outputs.append(os.path.join(output_dir, f'{name}.json'))
+    return outputs
+
+
+def run_batch(paths, output_dir, method='critic', detail='summary', n_workers=None,
+              criteria_types=None, weights=None, params=None, blocked=None):
+    """
+    Dosyalari surec havuzunda isle ve ozet dosyalarini yaz
+
+    Args:
+        paths: Girdi dosyalari
+        output_dir: Sonuclarin yazilacagi klasor
+        n_workers: Surec sayisi (None: CPU sayisi, 1: ayni surecte)
+        blocked: .npy girdileri icin bloklu mod veri tipi ('float32', 'float64')
+
+    Returns:
+        list: Girdi sirasinda ozet satirlari
+    """
+    if method != 'pipeline' and method not in available_methods():
+        raise ValueError(f"Bilinmeyen yontem: {method}")
+    if detail not in DETAIL_LEVELS:
+        raise ValueError(f"Gecersiz detay seviyesi: {detail}")
+    if blocked and method not in BLOCKED_METHODS:
+        raise ValueError(f"Bloklu mod yalnizca {', '.join(BLOCKED_METHODS)} icin kullanilabilir")
+    if blocked and detail == 'full':
+        raise ValueError("Bloklu modda 'full' detay desteklenmez")
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+
+    outputs = output_paths(paths, output_dir)
+    options = (method, detail, criteria_types, weights, params, blocked)
+
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    n_workers = max(1, min(n_workers, len(paths)))
+
+    if n_workers == 1:
+        rows = [process_file(path, output, *options) for path, output in zip(paths, outputs)]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = [executor.submit(process_file, path, output, *options)
+                       for path, output in zip(paths, outputs)]
+            rows = [future.result() for future in futures]
+
+    write_summary(rows, output_dir)
+    return rows
+
+
+def write_summary(rows, output_dir):
+    """summary.csv ve summary.json dosyalarini yaz"""
+    with open(os.path.join(output_dir, 'summary.csv'), 'w', newline='', encoding='utf-8-sig') as f:
+        writer = csv.DictWriter(f, fieldnames=SUMMARY_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    with open(os.path.join(output_dir, 'summary.json'), 'w', encoding='utf-8') as f:
+        json.dump(rows, f, ensure_ascii=False, indent=2)
+
+
+def _float_list(text):
+    return [float(x) for x in text.split(',') if x.strip()]
+
+
+def _type_list(text):
+    types = [x.strip().lower() for x in text.split(',') if x.strip()]
+    invalid = [t for t in types if t not in ('min', 'max')]
+    if invalid:
+        raise argparse.ArgumentTypeError(f"Gecersiz kriter yonu: {', '.join(invalid)}")
+    return types
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m batch',
+                                     description='Calisma kitaplari icin toplu CRITIC/TOPSIS analizi')
+    parser.add_argument('inputs', nargs='+', help='klasor, glob deseni veya dosya (.xlsx, .xls, .csv, .npy)')
+    parser.add_argument('--method', default='critic',
+                        help="yontem: pipeline (CRITIC -> TOPSIS) veya kayitli yontemler "
+                             "(critic, topsis, entropy, vikor, edas)")
+    parser.add_argument('--detail', choices=DETAIL_LEVELS, default='summary')
+    parser.add_argument('--output', default='batch_results', help='cikti klasoru (varsayilan: batch_results)')
+    parser.add_argument('--workers', type=int, help='surec sayisi (varsayilan: CPU sayisi)')
+    parser.add_argument('--types', type=_type_list,
+                        help="kriter yonleri, orn. 'min,max,max' (.npy icin; dosyadakinin yerine gecer)")
+    parser.add_argument('--weights', type=_float_list, help="siralama yontemleri icin .npy agirliklari, orn. '0.2,0.3,0.5'")
+    parser.add_argument('--params', type=json.loads, help='yonteme ozgu parametreler (JSON), orn. \'{"v": 0.5}\'')
+    parser.add_argument('--blocked', choices=DTYPES,
+                        help='.npy girdilerini bellege esleyip bloklu CRITIC/TOPSIS ile isle')
+    args = parser.parse_args(argv)
+
+    paths = collect_inputs(args.inputs)
+    if not paths:
+        print('Islenecek dosya bulunamadi', file=sys.stderr)
+        return 2
+
+    try:
+        rows = run_batch(paths, args.output, args.method, args.detail, args.workers,
+                         args.types, args.weights, args.params, args.blocked)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    failed = [row for row in rows if row['durum'] != 'tamam']
+    for row in failed:
+        print(f"HATA {row['dosya']}: {row['hata']}", file=sys.stderr)
+    print(f"{len(rows) - len(failed)}/{len(rows)} dosya islendi -> {args.output}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
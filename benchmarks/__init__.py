@@ -0,0 +1 @@
+"""CRITIC ve TOPSIS icin performans olcum araclari"""
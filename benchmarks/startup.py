@@ -0,0 +1,159 @@
+"""
+Soguk baslangic olcumu: modul yukleme, uygulama kurulumu ve ilk istekler
+
+Her tekrar yeni bir Python surecinde calisir. Iki kip olculur:
+
+    cold     isci kendi basina baslar (gelistirme sunucusu / preload'suz
+             gunicorn): import + create_app + ilk istekler
+    preload  ana surec create_app(WARMUP) calistirir ve fork eder (gunicorn
+             preload_app); yalnizca fork sonrasi ilk istekler iscinin
+             hazir olma suresine girer
+
+Kullanim:
+    python -m benchmarks.startup
+    python -m benchmarks.startup --repeats 10 --output startup.json
+    python -m benchmarks.startup --app-dir /eski/surum   # karsilastirma
+
+--app-dir create_app icermeyen eski bir agaci gosterirse modul duzeyindeki
+app kullanilir ve yalnizca cold kip olculur.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Olcum sureci; numpy/flask'in onceden yuklenmemesi icin ayri bir betik
+CHILD = r'''
+import json, os, sys, time
+started = time.perf_counter()
+app_dir, mode, workbook = sys.argv[1:4]
+sys.path.insert(0, app_dir)
+os.chdir(app_dir)
+
+timings = {}
+t = time.perf_counter()
+import app as module
+timings['import'] = time.perf_counter() - t
+
+t = time.perf_counter()
+factory = getattr(module, 'create_app', None)
+if factory is None:
+    application = module.app
+else:
+    application = factory({'WARMUP': mode == 'preload'})
+timings['create_app'] = time.perf_counter() - t
+timings['heavy_modules_loaded'] = sorted(m for m in ('pandas', 'openpyxl') if m in sys.modules)
+
+if mode == 'preload':
+    reader, writer = os.pipe()
+    pid = os.fork()
+    if pid:
+        os.close(writer)
+        with os.fdopen(reader) as f:
+            timings.update(json.load(f))
+        os.waitpid(pid, 0)
+        print(json.dumps(timings))
+        sys.exit(0)
+    os.close(reader)
+    started = time.perf_counter()
+    timings = {}
+
+matrix = [[(i * 7 + j * 13) % 97 + 1.0 for j in range(8)] for i in range(50)]
+problem = {
+    'matrix': matrix,
+    'criteria_types': ['max', 'min'] * 4,
+    'criteria_names': [f'K{j + 1}' for j in range(8)],
+    'alternative_names': [f'A{i + 1}' for i in range(50)],
+    'weights': [0.125] * 8
+}
+requests = [
+    ('page', 'GET', '/topsis', {}),
+    ('analyze', 'POST', '/topsis/analyze', {'json': problem}),
+    ('dashboard', 'GET', '/topsis/dashboard', {}),
+    ('upload_excel', 'POST', '/critic/upload-excel', {'file': workbook}),
+    ('critic_analyze', 'POST', '/critic/analyze', {'json': problem}),
+    ('download_excel', 'GET', '/critic/download-excel', {}),
+]
+client = application.test_client()
+first = {}
+for name, method, url, options in requests:
+    if 'file' in options:
+        options = {'data': {'file': (open(options['file'], 'rb'), os.path.basename(options['file']))}}
+    t = time.perf_counter()
+    response = client.open(url, method=method, **options)
+    first[name] = time.perf_counter() - t
+    if response.status_code != 200:
+        raise SystemExit(f'{url}: {response.status_code}')
+timings['first_requests'] = first
+timings['ready'] = time.perf_counter() - started
+
+if mode == 'preload':
+    with os.fdopen(writer, 'w') as f:
+        json.dump(timings, f)
+    os._exit(0)
+print(json.dumps(timings))
+'''
+
+
+def measure(app_dir, mode, workbook, data_dir):
+    """Tek bir olcum sureci calistir ve sureleri dondur"""
+    env = dict(os.environ, KDS_DATA_DIR=os.path.join(data_dir, 'data'),
+               KDS_UPLOAD_DIR=os.path.join(data_dir, 'uploads'), KDS_WARMUP='0')
+    output = subprocess.run([sys.executable, '-c', CHILD, app_dir, mode, workbook],
+                            env=env, capture_output=True, text=True, check=True)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def summarize(runs):
+    """Tekrarlar uzerinden ortanca sureler"""
+    summary = {}
+    for key in ('import', 'create_app', 'ready'):
+        values = [run[key] for run in runs if key in run]
+        if values:
+            summary[key] = statistics.median(values)
+    summary['first_requests'] = {
+        name: statistics.median(run['first_requests'][name] for run in runs)
+        for name in runs[0]['first_requests']
+    }
+    if 'heavy_modules_loaded' in runs[0]:
+        summary['heavy_modules_loaded'] = runs[0]['heavy_modules_loaded']
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.startup',
+                                     description='Uygulama soguk baslangic olcumu')
+    parser.add_argument('--app-dir', default=ROOT, help='app.py iceren klasor (varsayilan: bu repo)')
+    parser.add_argument('--workbook', default=os.path.join(ROOT, 'CRITIC(2).xlsx'),
+                        help='yukleme istegi icin Excel dosyasi')
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--output', help='sonuclarin yazilacagi JSON dosyasi (varsayilan: stdout)')
+    args = parser.parse_args(argv)
+
+    app_dir = os.path.abspath(args.app_dir)
+    with open(os.path.join(app_dir, 'app.py'), 'r', encoding='utf-8') as f:
+        modes = ('cold', 'preload') if 'def create_app' in f.read() else ('cold',)
+
+    report = {'app_dir': app_dir, 'repeats': args.repeats, 'python': sys.version.split()[0]}
+    with tempfile.TemporaryDirectory() as data_dir:
+        for mode in modes:
+            runs = [measure(app_dir, mode, os.path.abspath(args.workbook), data_dir)
+                    for _ in range(args.repeats)]
+            report[mode] = summarize(runs)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,240 @@
+"""
+CRITIC, TOPSIS ve diger kayitli yontemler icin adim bazli performans olcumu
+
+Kullanim:
+    python -m benchmarks                          # standart boyutlar
+    python -m benchmarks --preset full            # 10^6 x 500'e kadar
+    python -m benchmarks --sizes 15x10,1000x50 --output bench.json
+    python -m benchmarks --baseline bench.json --threshold 0.1
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+
+from methods import CRITIC, EDAS, TOPSIS, VIKOR, Entropy
+
+PRESETS = {
+    'quick': [(15, 10), (1000, 20), (10000, 50)],
+    'standard': [(15, 10), (1000, 20), (10000, 50), (100000, 100)],
+    'full': [(15, 10), (1000, 20), (10000, 50), (100000, 100), (1000000, 500)],
+}
+
+CRITIC_STEPS = ['normalize', 'calculate_std_deviation', 'calculate_correlation',
+                'calculate_information_content', 'calculate_weights']
+TOPSIS_STEPS = ['normalize', 'weighted_normalize', 'find_ideal_solutions',
+                'calculate_distances', 'calculate_closeness']
+ENTROPY_STEPS = ['normalize', 'calculate_entropy', 'calculate_weights']
+VIKOR_STEPS = ['find_ideal_solutions', 'calculate_utility_regret', 'calculate_compromise',
+               'check_conditions']
+EDAS_STEPS = ['calculate_average', 'calculate_distances', 'calculate_weighted_sums',
+              'calculate_scores']
+
+# Bu sureden kisa olcumlerde gerileme raporlanmaz (zamanlayici gurultusu)
+NOISE_FLOOR = 0.001
+
+# Adimlar ve 'run' sonuclari listeye cevirmeden ('weights-only') olculur;
+# 'full' detayin serilestirme maliyeti (tum matrislerin .tolist()) bu hucre
+# sayisina kadar ayri 'run_full' girdisi olarak olculur
+FULL_DETAIL_MAX_CELLS = 10 ** 7
+
+
+def make_problem(n_alternatives, n_criteria, seed=0):
+    """Sentetik karar problemi (matris, kriter tipleri, agirliklar)"""
+    rng = np.random.default_rng(seed)
+    matrix = rng.random((n_alternatives, n_criteria)) * 100 + 1
+    criteria_types = ['max' if j % 3 else 'min' for j in range(n_criteria)]
+    weights = rng.dirichlet(np.ones(n_criteria))
+    return matrix, criteria_types, weights
+
+
+def _factories(matrix, criteria_types, weights):
+    return {
+        'critic': (lambda: CRITIC(matrix, criteria_types), CRITIC_STEPS),
+        'topsis': (lambda: TOPSIS(matrix, weights, criteria_types), TOPSIS_STEPS),
+        'entropy': (lambda: Entropy(matrix, criteria_types), ENTROPY_STEPS),
+        'vikor': (lambda: VIKOR(matrix, weights, criteria_types), VIKOR_STEPS),
+        'edas': (lambda: EDAS(matrix, weights, criteria_types), EDAS_STEPS),
+    }
+
+
+def _engine(factory):
+    """Ara sonuclari listeye cevirmeyen (adim kaydi kapali) motor"""
+    engine = factory()
+    if hasattr(engine, 'record_steps'):
+        engine.record_steps = False
+    return engine
+
+
+def _time_steps(factory, steps, repeats, full_detail=False):
+    """Her adimi (onceki adimlar olculmeden) tekrar tekrar calistir"""
+    timings = {step: [] for step in steps + ['run'] + (['run_full'] if full_detail else [])}
+    for _ in range(repeats):
+        engine = _engine(factory)
+        for step in steps:
+            start = time.perf_counter()
+            getattr(engine, step)()
+            timings[step].append(time.perf_counter() - start)
+
+        engine = factory()
+        start = time.perf_counter()
+        engine.run('weights-only')
+        timings['run'].append(time.perf_counter() - start)
+
+        if full_detail:
+            engine = factory()
+            start = time.perf_counter()
+            engine.run('full')
+            timings['run_full'].append(time.perf_counter() - start)
+    return timings
+
+
+def _peak_memory(factory, steps):
+    """Her adimin ve run('weights-only')'in tepe bellek kullanimi (tracemalloc, bayt)"""
+    peaks = {}
+    engine = _engine(factory)
+    for step in steps:
+        tracemalloc.start()
+        getattr(engine, step)()
+        peaks[step] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    tracemalloc.start()
+    factory().run('weights-only')
+    peaks['run'] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peaks
+
+
+def run_suite(sizes, methods=('critic', 'topsis'), repeats=5, measure_memory=True):
+    """
+    Tum boyutlar ve yontemler icin olcum yap
+
+    Returns:
+        dict: meta bilgileri ve sonuc listesi (JSON'a yazilabilir)
+    """
+    results = []
+    for n_alternatives, n_criteria in sizes:
+        matrix, criteria_types, weights = make_problem(n_alternatives, n_criteria)
+        factories = _factories(matrix, criteria_types, weights)
+
+        # Buyuk matrislerde tekrar sayisini azalt
+        size_repeats = repeats if matrix.size <= 10 ** 6 else max(1, repeats // 5)
+
+        for method in methods:
+            factory, steps = factories[method]
+            timings = _time_steps(factory, steps, size_repeats,
+                                  full_detail=matrix.size <= FULL_DETAIL_MAX_CELLS)
+            peaks = _peak_memory(factory, steps) if measure_memory else {}
+
+            for step, values in timings.items():
+                results.append({
+                    'method': method,
+                    'size': [n_alternatives, n_criteria],
+                    'step': step,
+                    'repeats': len(values),
+                    'min': min(values),
+                    'median': float(np.median(values)),
+                    'mean': float(np.mean(values)),
+                    'peak_memory_bytes': peaks.get(step)
+                })
+            print(f"{method:7s} {n_alternatives:>8d}x{n_criteria:<4d} "
+                  f"run: {np.median(timings['run']) * 1000:10.2f} ms", file=sys.stderr)
+
+    return {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count()
+        },
+        'results': results
+    }
+
+
+def _key(entry):
+    return entry['method'], tuple(entry['size']), entry['step']
+
+
+def compare(current, baseline, threshold=0.10):
+    """
+    Mevcut olcumu temel olcumle karsilastir
+
+    Args:
+        threshold: Izin verilen goreli yavaslama (0.10 = %10)
+
+    Returns:
+        list: Gerileyen olcumler (method, size, step, baseline, current, ratio)
+    """
+    base = {_key(e): e for e in baseline['results']}
+    regressions = []
+    for entry in current['results']:
+        previous = base.get(_key(entry))
+        if previous is None:
+            continue
+        old, new = previous['median'], entry['median']
+        if new > old * (1 + threshold) and new - old > NOISE_FLOOR:
+            regressions.append({
+                'method': entry['method'],
+                'size': entry['size'],
+                'step': entry['step'],
+                'baseline': old,
+                'current': new,
+                'ratio': new / old if old else float('inf')
+            })
+    return regressions
+
+
+def parse_sizes(text):
+    """'15x10,1000x50' -> [(15, 10), (1000, 50)]"""
+    sizes = []
+    for part in text.split(','):
+        m, n = part.lower().split('x')
+        sizes.append((int(m), int(n)))
+    return sizes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks',
+                                     description='CRITIC/TOPSIS performans olcumu')
+    parser.add_argument('--preset', choices=sorted(PRESETS), default='standard')
+    parser.add_argument('--sizes', type=parse_sizes, help="orn. '15x10,1000x50' (preset yerine)")
+    parser.add_argument('--methods', default='critic,topsis',
+                        help="virgulle ayrilmis yontemler (critic, topsis, entropy, vikor, edas)")
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--no-memory', action='store_true', help='tepe bellek olcumunu atla')
+    parser.add_argument('--output', help='sonuclarin yazilacagi JSON dosyasi (varsayilan: stdout)')
+    parser.add_argument('--baseline', help='karsilastirilacak temel JSON dosyasi')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='izin verilen goreli yavaslama (varsayilan 0.10)')
+    args = parser.parse_args(argv)
+
+    sizes = args.sizes or PRESETS[args.preset]
+    methods = [m.strip() for m in args.methods.split(',') if m.strip()]
+    report = run_suite(sizes, methods, args.repeats, not args.no_memory)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        for r in regressions:
+            print(f"GERILEME {r['method']} {r['size'][0]}x{r['size'][1]} {r['step']}: "
+                  f"{r['baseline'] * 1000:.2f} ms -> {r['current'] * 1000:.2f} ms "
+                  f"(x{r['ratio']:.2f})", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
@@ -0,0 +1,156 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+
+def make_key(method, decision_matrix, criteria_types, weights=None):
+    """
+    Karar probleminin icerigine gore kararli bir anahtar uret
+
+    Args:
+        method: Yontem adi ('critic', 'topsis', ...)
+        decision_matrix: Karar matrisi
+        criteria_types: Kriter tipleri
+        weights: Kriter agirliklari (varsa)
+
+    Returns:
+        str: SHA-256 hex ozeti
+    """
+    matrix = np.ascontiguousarray(decision_matrix, dtype=np.float64)
+
+    h = hashlib.sha256()
+    h.update(method.encode('utf-8'))
+    h.update(str(matrix.shape).encode('utf-8'))
+    h.update(matrix.tobytes())
+    h.update('|'.join(criteria_types).encode('utf-8'))
+    if weights is not None:
+        h.update(np.ascontiguousarray(weights, dtype=np.float64).tobytes())
+    return h.hexdigest()
+
+
+class ResultCache:
+    """
+    Boyut ve sure (TTL) sinirli, istege bagli diske yazan LRU sonuc onbellegi
+
+    Diske yazilacak degerler JSON'a cevrilebilir olmalidir (CRITIC.run /
+    TOPSIS.run ciktilari); yalnizca bellekte tutulan onbellek herhangi bir
+    nesneyi saklayabilir. Donen degerler paylasilir; cagiran taraf
+    degistirmemelidir.
+    """
+
+    def __init__(self, max_size=128, ttl=3600, disk_dir=None):
+        """
+        Args:
+            max_size: Bellekte tutulacak en fazla kayit sayisi
+            ttl: Kayitlarin gecerlilik suresi (saniye, None: suresiz)
+            disk_dir: Verilirse kayitlar bu klasore de JSON olarak yazilir
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.disk_dir = disk_dir
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        if disk_dir and not os.path.exists(disk_dir):
+            os.makedirs(disk_dir)
+
+    def _expired(self, created):
+        return self.ttl is not None and time.time() - created > self.ttl
+
+    def _disk_path(self, key):
+        return os.path.join(self.disk_dir, f'{key}.json')
+
+    def _load_from_disk(self, key):
+        path = self._disk_path(key)
+        if not os.path.exists(path):
+            return None
+        if self._expired(os.path.getmtime(path)):
+            os.remove(path)
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write_to_disk(self, key, value):
+        path = self._disk_path(key)
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(value, f)
+        os.replace(tmp_path, path)
+
+    def get(self, key):
+        """Kaydi dondur, yoksa veya suresi dolmussa None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                created, value = entry
+                if not self._expired(created):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+
+        value = self._load_from_disk(key) if self.disk_dir else None
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._store(key, value)
+            return value
+
+    def set(self, key, value):
+        """Kaydi ekle (en eski kayitlar boyut sinirina gore atilir)"""
+        with self._lock:
+            self._store(key, value)
+        if self.disk_dir:
+            self._write_to_disk(key, value)
+
+    def _store(self, key, value):
+        self._entries[key] = (time.time(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def get_or_compute(self, key, compute):
+        """Kayit varsa dondur, yoksa compute() ile hesaplayip sakla"""
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.set(key, value)
+        return value
+
+    def discard(self, key):
+        """Kaydi bellekten ve (varsa) diskten sil"""
+        with self._lock:
+            self._entries.pop(key, None)
+        if self.disk_dir and os.path.exists(self._disk_path(key)):
+            os.remove(self._disk_path(key))
+
+    def clear(self):
+        """Bellekteki kayitlari ve sayaclari sifirla"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """Isabet/iska sayaclari ve doluluk bilgisi"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'ttl': self.ttl,
+                'disk': bool(self.disk_dir)
+            }
@@ -0,0 +1,366 @@
+"""
+Dashboard'lar icin sayfali veri gorunumleri
+
+Sablonlar sonuc sozlugunu satir icine yazmak yerine yalnizca kucuk bir
+ozet alir; matrisler ve tablolar GET /<tur>/data/<ad> ile siralanmis,
+sayfalanmis ve sutunlari dilimlenmis olarak, grafik serileri ise en iyi N
+kayit ve bolmelenmis histogram olarak istenir. Sayfa boyutu ve yanit
+buyuklugu problemin boyutundan bagimsizdir.
+"""
+import numpy as np
+
+from cache import ResultCache
+
+# Sayfa ve sutun dilimi sinirlari
+PAGE_LIMIT = 25
+MAX_PAGE_LIMIT = 500
+MAX_COLUMNS = 100
+
+# Grafik serileri: en iyi N kayit ve histogram bolme sayisi
+CHART_TOP = 20
+MAX_CHART_TOP = 200
+HISTOGRAM_BINS = 20
+
+# Gorunum basina saklanan en fazla siralama duzeni (her biri satir sayisi uzunlugunda)
+MAX_SORT_ORDERS = 8
+
+# Ad -> saklanan dizi yolu; satirlari alternatif olmayan matrisler ayrica belirtilir
+MATRICES = {
+    'critic': {
+        'decision': 'decision_matrix',
+        'normalized': 'critic/normalized_matrix',
+        'correlation': 'critic/correlation_matrix',
+    },
+    'topsis': {
+        'decision': 'decision_matrix',
+        'normalized': 'topsis/normalized_matrix',
+        'weighted': 'topsis/weighted_matrix',
+    },
+}
+CRITERIA_ROW_MATRICES = ('critic/correlation_matrix',)
+
+# Tablo adi -> [(sutun anahtari, baslik, dizi yolu)]
+TABLES = {
+    'critic': {
+        'criteria': [
+            ('type', 'Yon', 'criteria_types'),
+            ('std_dev', 'Standart Sapma', 'critic/std_devs'),
+            ('information_content', 'Bilgi Icerigi', 'critic/information_content'),
+            ('weight', 'Agirlik', 'critic/weights'),
+        ],
+    },
+    'topsis': {
+        'ranking': [
+            ('rank', 'Sira', 'topsis/ranking'),
+            ('distance_positive', 'Si+ (Ideal Uzaklik)', 'topsis/distance_positive'),
+            ('distance_negative', 'Si- (Negatif-Ideal Uzaklik)', 'topsis/distance_negative'),
+            ('closeness', 'Yakinlik Katsayisi (C)', 'topsis/closeness'),
+        ],
+        'ideal': [
+            ('ideal_positive', 'A+ (Ideal)', 'topsis/ideal_positive'),
+            ('ideal_negative', 'A- (Negatif-Ideal)', 'topsis/ideal_negative'),
+        ],
+    },
+}
+CRITERIA_ROW_TABLES = ('criteria', 'ideal')
+
+
+def data_names(kind):
+    """Tur icin istenebilecek matris ve tablo adlari"""
+    return sorted(MATRICES.get(kind, {})) + sorted(TABLES.get(kind, {}))
+
+
+def parse_columns(text, n_columns):
+    """
+    Sutun secimini indekslere cevir
+
+    Args:
+        text: 'bas:son' dilimi veya '0,3,5' listesi (None: ilk MAX_COLUMNS sutun)
+        n_columns: Toplam sutun sayisi
+
+    Returns:
+        numpy array: Sutun indeksleri (en fazla MAX_COLUMNS)
+    """
+    if not text:
+        return np.arange(min(n_columns, MAX_COLUMNS))
+    try:
+        if ':' in text:
+            start, _, stop = text.partition(':')
+            start = int(start) if start else 0
+            stop = int(stop) if stop else n_columns
+            columns = np.arange(max(start, 0), min(stop, n_columns))
+        else:
+            columns = np.array([int(part) for part in text.split(',') if part.strip()], dtype=int)
+    except ValueError:
+        raise ValueError(f"Gecersiz sutun secimi: {text}")
+    if len(columns) and (columns.min() < 0 or columns.max() >= n_columns):
+        raise ValueError(f"Sutun indeksi 0-{n_columns - 1} araliginda olmali")
+    return columns[:MAX_COLUMNS]
+
+
+def _share(values, labels, top):
+    """En buyuk top deger ve geri kalanlarin toplami ('Diger')"""
+    order = np.argsort(-values, kind='stable')
+    head = order[:top]
+    series = {'labels': [labels[i] for i in head.tolist()], 'values': values[head].tolist(),
+              'indices': head.tolist()}
+    if len(order) > top:
+        series['other'] = float(values[order[top:]].sum())
+    return series
+
+
+class RunView:
+    """
+    Tek bir sonucun sayfali gorunumu
+
+    Diziler bir kez yuklenir (ResultStore.load_arrays); her siralama sutunu
+    icin tum satirlarin artan duzeni ilk istekte hesaplanip kucuk bir LRU'da
+    (MAX_SORT_ORDERS) saklanir. Azalan yon ve top-k bu duzenden ters cevirme
+    ve suzme ile elde edilir, boylece sonraki sayfalar siralama maliyeti tasimaz.
+    """
+
+    def __init__(self, kind, meta, arrays):
+        """
+        Args:
+            kind: 'critic' veya 'topsis'
+            meta, arrays: app.load_export_arrays ciktisi
+        """
+        if kind not in MATRICES:
+            raise ValueError(f"Veri gorunumu desteklenmiyor: {kind}")
+        self.kind = kind
+        self.meta = meta
+        self.arrays = arrays
+        self.criteria_names = self._names('criteria_names')
+        self.alternative_names = self._names('alternative_names')
+        self._orders = ResultCache(max_size=MAX_SORT_ORDERS, ttl=None)
+
+        # Top-k modunda saklanan TOPSIS dizilerinin satir i'si alternatif indices[i]'dir
+        self.stored_alternatives = (arrays['topsis/indices'] if 'topsis/indices' in arrays
+                                    else np.arange(len(self.alternative_names)))
+
+    def _names(self, key):
+        """Isim listesi (tamamen sayisal isimler dizi olarak saklanmis olabilir)"""
+        if key in self.meta:
+            return self.meta[key]
+        return self.arrays[key].tolist()
+
+    @property
+    def run_id(self):
+        return self.meta.get('run_id')
+
+    def _ranking(self):
+        """Saklanan satirlar icin TOPSIS siralari"""
+        return self.arrays['topsis/ranking']
+
+    def _included(self, k=None):
+        """Gorunume dahil saklanan satirlar (k: yalnizca ilk k sira)"""
+        n = len(self.stored_alternatives)
+        if self.kind != 'topsis' or not k or k >= n:
+            return np.arange(n)
+        return np.flatnonzero(self._ranking() <= k)
+
+    # ========== OZET ==========
+
+    def summary(self, k=None):
+        """Sablon icin kucuk ozet (boyutlar, en iyi alternatif / kriter)"""
+        summary = {
+            'run_id': self.run_id,
+            'n_alternatives': len(self.alternative_names),
+            'n_criteria': len(self.criteria_names),
+        }
+        if self.kind == 'critic':
+            weights = self.arrays['critic/weights']
+            summary['top_criterion'] = self.criteria_names[int(np.argmax(weights))]
+            return summary
+
+        included = self._included(k)
+        closeness = self.arrays['topsis/closeness'][included]
+        best = included[int(np.argmax(closeness))]
+        stored_k = self.meta.get('topsis', {}).get('k')
+        summary.update({
+            'k': len(included) if (k or stored_k) else None,
+            'best': self.alternative_names[int(self.stored_alternatives[best])],
+            'max_closeness': float(closeness.max()),
+            'min_closeness': float(closeness.min()),
+        })
+        return summary
+
+    # ========== SAYFALAR ==========
+
+    def page(self, name, offset=0, limit=PAGE_LIMIT, sort=None, descending=False, columns=None, k=None):
+        """
+        Matris veya tablonun bir sayfasi
+
+        Args:
+            name: data_names(kind) icinden bir ad
+            offset, limit: Sayfa baslangici ve boyutu (limit en fazla MAX_PAGE_LIMIT)
+            sort: 'label', tablo sutun anahtari veya matris sutun indeksi (None: saklanan sira)
+            descending: Azalan siralama
+            columns: Matrisler icin sutun secimi (parse_columns)
+            k: TOPSIS icin yalnizca ilk k siradaki alternatifler
+
+        Returns:
+            dict: total, offset, limit, columns ([{key, name}]) ve
+                  rows ([{index, label, values}]; index ozgun alternatif/kriter indeksi)
+        """
+        offset = max(int(offset), 0)
+        limit = min(max(int(limit), 1), MAX_PAGE_LIMIT)
+
+        if name in MATRICES[self.kind]:
+            path = MATRICES[self.kind][name]
+            if path not in self.arrays:
+                raise ValueError(f"Sonucta '{name}' matrisi yok")
+            matrix = self.arrays[path]
+            column_index = parse_columns(columns, matrix.shape[1])
+            column_specs = [{'key': int(j), 'name': self.criteria_names[j]} for j in column_index.tolist()]
+            by_criteria = path in CRITERIA_ROW_MATRICES
+        elif name in TABLES[self.kind]:
+            data = self._table_columns(name)
+            column_specs = [{'key': key, 'name': title} for key, title, _ in TABLES[self.kind][name]]
+            by_criteria = name in CRITERIA_ROW_TABLES
+        else:
+            raise ValueError(f"Bilinmeyen veri: {name} (secenekler: {', '.join(data_names(self.kind))})")
+
+        # Satirlar saklanan satir numaralari; karar matrisi tum alternatifleri tuttugu
+        # icin top-k kaydinda saklanan TOPSIS satirlari karar matrisi satirlarina eslenir
+        if by_criteria:
+            rows = np.arange(len(self.criteria_names))
+            original = rows
+            labels = self.criteria_names
+        else:
+            rows = self._included(k)
+            original = self.stored_alternatives
+            labels = None
+        source_rows = original if name == 'decision' else None
+
+        def label(r):
+            return labels[r] if labels is not None else self.alternative_names[int(original[r])]
+
+        # Siralama duzeni k'dan bagimsiz olarak tum satirlar icin hesaplanir
+        all_rows = np.arange(len(labels) if labels is not None else len(original))
+
+        def sort_values():
+            if sort == 'label':
+                return np.array([label(r) for r in all_rows.tolist()], dtype=object)
+            if name in TABLES[self.kind]:
+                if sort not in data:
+                    raise ValueError(f"Gecersiz siralama sutunu: {sort}")
+                return data[sort][all_rows]
+            try:
+                column = int(sort)
+            except ValueError:
+                raise ValueError(f"Gecersiz siralama sutunu: {sort}")
+            if not 0 <= column < matrix.shape[1]:
+                raise ValueError(f"Siralama sutunu 0-{matrix.shape[1] - 1} araliginda olmali")
+            matrix_rows = all_rows if source_rows is None else source_rows[all_rows]
+            return matrix[matrix_rows, column]
+
+        if sort in (None, ''):
+            ordered = rows
+        else:
+            ordered = self._order((name, str(sort)), sort_values)
+            if len(rows) < len(all_rows):
+                included = np.zeros(len(all_rows), dtype=bool)
+                included[rows] = True
+                ordered = ordered[included[ordered]]
+        if descending:
+            ordered = ordered[::-1]
+
+        selected = ordered[offset:offset + limit]
+        if name in TABLES[self.kind]:
+            cells = list(zip(*[data[key][selected].tolist() for key, _, _ in TABLES[self.kind][name]]))
+        else:
+            matrix_rows = selected if source_rows is None else source_rows[selected]
+            cells = matrix[np.ix_(matrix_rows, column_index)].tolist() if len(selected) else []
+
+        page = {
+            'name': name,
+            'total': len(rows),
+            'offset': offset,
+            'limit': limit,
+            'columns': column_specs,
+            'rows': [{'index': int(original[r]), 'label': label(r), 'values': list(values)}
+                     for r, values in zip(selected.tolist(), cells)]
+        }
+        if name in MATRICES[self.kind]:
+            page['total_columns'] = matrix.shape[1]
+        return page
+
+    def _order(self, key, values):
+        """
+        Tum satirlarin artan siralama duzeni (ilk istekte hesaplanip LRU'da saklanir)
+
+        Args:
+            key: (ad, siralama sutunu) onbellek anahtari
+            values: Tum satirlarin siralama degerlerini donduren fonksiyon
+        """
+        order = self._orders.get(key)
+        if order is None:
+            values = values()
+            if values.dtype.kind in 'OUS':
+                order = np.array(sorted(range(len(values)), key=lambda i: str(values[i])), dtype=int)
+            else:
+                order = np.argsort(values, kind='stable')
+            self._orders.set(key, order)
+        return order
+
+    def _table_columns(self, name):
+        """Tablo sutunlari (saklanan satir sirasinda diziler)"""
+        data = {}
+        for key, _, path in TABLES[self.kind][name]:
+            if path in self.arrays:
+                data[key] = self.arrays[path]
+            elif path in self.meta:
+                data[key] = np.array(self.meta[path], dtype=object)
+            else:
+                raise ValueError(f"Sonucta '{name}' tablosu icin '{key}' yok")
+        return data
+
+    # ========== GRAFIK SERILERI ==========
+
+    def charts(self, top=CHART_TOP, bins=HISTOGRAM_BINS, k=None):
+        """
+        Dashboard grafikleri icin boyuttan bagimsiz seriler
+
+        CRITIC: en agir top kriterin agirlik, standart sapma, bilgi icerigi
+        ve aralarindaki korelasyon alt matrisi. TOPSIS: en iyi top alternatif,
+        yakinlik katsayisi histogrami ve en agir top kriterin agirliklari.
+        Kalan kriterlerin agirlik toplami 'other' olarak verilir.
+        """
+        top = min(max(int(top), 1), MAX_CHART_TOP)
+        bins = min(max(int(bins), 1), 200)
+
+        if self.kind == 'critic':
+            weights = self.arrays['critic/weights']
+            share = _share(weights, self.criteria_names, top)
+            head = np.array(share['indices'], dtype=int)
+            series = {
+                'weights': share,
+                'std_devs': self.arrays['critic/std_devs'][head].tolist(),
+                'information_content': self.arrays['critic/information_content'][head].tolist(),
+            }
+            if 'critic/correlation_matrix' in self.arrays:
+                series['correlation'] = self.arrays['critic/correlation_matrix'][np.ix_(head, head)].tolist()
+            return series
+
+        included = self._included(k)
+        closeness = self.arrays['topsis/closeness'][included]
+        ranking = self._ranking()[included]
+        head = included[np.argsort(ranking, kind='stable')[:top]]
+        counts, edges = np.histogram(closeness, bins=bins, range=(0.0, 1.0))
+        weights = self.arrays['topsis/weights_used'] if 'topsis/weights_used' in self.arrays \
+            else np.asarray(self.meta['weights'], dtype=float)
+
+        series = {
+            'top': {
+                'labels': [self.alternative_names[i] for i in self.stored_alternatives[head].tolist()],
+                'closeness': self.arrays['topsis/closeness'][head].tolist(),
+                'ranking': self._ranking()[head].tolist(),
+            },
+            'histogram': {'edges': edges.tolist(), 'counts': counts.tolist()},
+            'weights': _share(weights, self.criteria_names, top),
+        }
+        for key in ('distance_positive', 'distance_negative'):
+            if f'topsis/{key}' in self.arrays:
+                series['top'][key] = self.arrays[f'topsis/{key}'][head].tolist()
+        return series
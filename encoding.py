@@ -0,0 +1,76 @@
+import base64
+import gzip
+import json
+
+import numpy as np
+
+from storage import is_numeric_list
+
+# 'json': mevcut davranis, 'compact': girintisiz + yuvarlanmis ondaliklar,
+# 'base64': ondalikli diziler base64 float32 olarak
+ENCODINGS = ('json', 'compact', 'base64')
+
+GZIP_MIN_SIZE = 1024
+GZIP_MIMETYPES = ('application/json', 'text/html', 'text/csv', 'text/plain')
+
+
+def _encode_value(value, encoding, precision):
+    if isinstance(value, dict):
+        return {k: _encode_value(v, encoding, precision) for k, v in value.items()}
+
+    if not (isinstance(value, np.ndarray) or is_numeric_list(value)):
+        return value
+
+    arr = np.asarray(value)
+    if arr.dtype.kind != 'f':
+        return arr.tolist()
+
+    if encoding == 'base64':
+        data = np.ascontiguousarray(arr, dtype='<f4').tobytes()
+        return {
+            'dtype': 'float32',
+            'shape': list(arr.shape),
+            'data': base64.b64encode(data).decode('ascii')
+        }
+
+    if precision is not None:
+        arr = np.round(arr, precision)
+    return arr.tolist()
+
+
+def encode_payload(payload, encoding='compact', precision=6):
+    """
+    Yaniti kompakt JSON metnine cevir
+
+    Args:
+        payload: JSON'a cevrilecek sozluk (listeler veya numpy dizileri icerebilir)
+        encoding: 'compact' veya 'base64'
+        precision: Ondalik basamak sayisi (None: yuvarlama yok)
+
+    Returns:
+        str: Girintisiz JSON
+    """
+    if encoding not in ENCODINGS:
+        raise ValueError(f"Gecersiz kodlama: {encoding}")
+    encoded = _encode_value(payload, encoding, precision)
+    return json.dumps(encoded, ensure_ascii=False, separators=(',', ':'))
+
+
+def gzip_response(response, accept_encoding):
+    """Istemci destekliyorsa ve yanit yeterince buyukse gzip ile sikistir"""
+    if (response.direct_passthrough
+            or response.status_code < 200 or response.status_code >= 300
+            or 'Content-Encoding' in response.headers
+            or 'gzip' not in (accept_encoding or '').lower()
+            or response.mimetype not in GZIP_MIMETYPES):
+        return response
+
+    data = response.get_data()
+    if len(data) < GZIP_MIN_SIZE:
+        return response
+
+    response.set_data(gzip.compress(data, compresslevel=5))
+    response.headers['Content-Encoding'] = 'gzip'
+    response.headers['Content-Length'] = str(len(response.get_data()))
+    response.vary.add('Accept-Encoding')
+    return response
@@ -0,0 +1,310 @@
+"""
+Sonuc disa aktarimi (Excel, CSV, Parquet)
+
+Tablolar saklanan sonuc dizilerinden (ResultStore.load_arrays) parca parca
+uretilir; hicbir asamada tum calisma kitabi veya JSON listeleri bellekte
+tutulmaz. Excel openpyxl write-only kipinde, Parquet (istege bagli pyarrow)
+satir gruplari halinde yazilir. Uretilen dosyalar ExportCache ile diske
+alinir ve kaynak sonuc degisene kadar yeniden kullanilir.
+"""
+import csv
+import glob
+import os
+import re
+import uuid
+from collections import namedtuple
+from itertools import islice
+
+import numpy as np
+
+from methods.kernels import top_k
+
+EXPORT_FORMATS = {
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'csv': 'text/csv',
+    'parquet': 'application/vnd.apache.parquet',
+}
+
+# Satirlar bu buyuklukte parcalar halinde listeye cevrilir ve yazilir
+CHUNK_ROWS = 4096
+
+# name: Excel sayfa adi, header: baslik satiri (None: basliksiz),
+# rows: her cagrida yeni bir satir ureteci donduren fonksiyon
+Table = namedtuple('Table', ['name', 'header', 'rows'])
+
+
+def table_slug(name):
+    """Tablo adini URL/dosya adi icin sadelestir ('Karar Matrisi' -> 'karar-matrisi')"""
+    return re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-')
+
+
+def _names(meta, arrays, key):
+    """Isim listesi (tamamen sayisal isimler dizi olarak saklanmis olabilir)"""
+    if key in meta:
+        return meta[key]
+    return arrays[key].tolist()
+
+
+def _rows(positions, labels, *columns):
+    """
+    Secilen satirlar icin [etiket, sutun degerleri...] satirlari uret
+
+    Args:
+        positions: Yazilacak satir indeksleri (sirali)
+        labels: Satir etiketleri (positions ile indekslenir)
+        columns: 1-B (tek sutun) veya 2-B (cok sutun) diziler
+    """
+    for start in range(0, len(positions), CHUNK_ROWS):
+        index = positions[start:start + CHUNK_ROWS]
+        parts = [np.asarray(column)[index].reshape(len(index), -1).tolist() for column in columns]
+        for i, position in enumerate(index.tolist()):
+            row = [labels[position]]
+            for part in parts:
+                row.extend(part[i])
+            yield row
+
+
+# ========== TABLO TANIMLARI ==========
+
+def critic_tables(meta, arrays):
+    """CRITIC Excel sayfalari (eski pandas ciktisi ile ayni duzen)"""
+    criteria_names = _names(meta, arrays, 'criteria_names')
+    criteria_types = meta['criteria_types']
+    alternative_names = _names(meta, arrays, 'alternative_names')
+    matrix = arrays['decision_matrix']
+    weights = arrays['critic/weights'].tolist()
+    everyone = np.arange(len(alternative_names))
+
+    def ready_rows():
+        # upload_excel_with_weights ile ayni duzen:
+        # Satir 0: Kriter adlari, Satir 1: Yonler, Satir 2: Agirliklar, Satir 3+: Alternatifler
+        yield [''] + criteria_names
+        yield [''] + criteria_types
+        yield [''] + weights
+        yield from _rows(everyone, alternative_names, matrix)
+
+    return [
+        Table('Kriter Agirliklari', ['Kriter', 'Yon', 'Agirlik'],
+              lambda: (list(row) for row in zip(criteria_names, criteria_types, weights))),
+        Table('Karar Matrisi', [None] + criteria_names,
+              lambda: _rows(everyone, alternative_names, matrix)),
+        Table('Normalize Matris', [None] + criteria_names,
+              lambda: _rows(everyone, alternative_names, arrays['critic/normalized_matrix'])),
+        Table('TOPSIS Hazir Format', None, ready_rows),
+    ]
+
+
+def topsis_tables(meta, arrays, k=None):
+    """
+    TOPSIS Excel sayfalari (eski pandas ciktisi ile ayni duzen)
+
+    Args:
+        k: Verilirse yalnizca en iyi k alternatif yazilir (TOPSIS dashboard'undaki ?k ile ayni)
+    """
+    criteria_names = _names(meta, arrays, 'criteria_names')
+    alternative_names = _names(meta, arrays, 'alternative_names')
+    closeness = arrays['topsis/closeness']
+
+    if 'topsis/indices' in arrays:
+        # Top-k modunda saklanan sonuc: satirlar zaten siralidir
+        indices = arrays['topsis/indices'][:k] if k else arrays['topsis/indices']
+        positions = np.arange(len(indices))
+        order = positions
+        ranking = np.arange(1, len(indices) + 1)
+    elif k:
+        positions = order = top_k(closeness, k)
+        ranking = np.zeros(len(closeness), dtype=int)
+        ranking[positions] = np.arange(1, len(positions) + 1)
+    else:
+        positions = np.arange(len(closeness))
+        ranking = arrays['topsis/ranking']
+        order = np.argsort(ranking, kind='stable')
+
+    # Etiketler saklanan satir sirasina gore (top-k kaydinda indices sirasinda)
+    labels = alternative_names
+    if 'topsis/indices' in arrays:
+        labels = [alternative_names[i] for i in indices.tolist()]
+
+    return [
+        Table('Siralama Sonuclari',
+              ['Alternatif', 'Yakinlik Katsayisi (C)', 'Siralama',
+               'D+ (Ideal Uzaklik)', 'D- (Negatif-Ideal Uzaklik)'],
+              lambda: _rows(order, labels, closeness, ranking,
+                            arrays['topsis/distance_positive'], arrays['topsis/distance_negative'])),
+        Table('Agirlikli Normalize Matris', [None] + criteria_names,
+              lambda: _rows(positions, labels, arrays['topsis/weighted_matrix'])),
+        Table('Ideal Cozumler', ['Kriter', 'Ideal (A+)', 'Negatif-Ideal (A-)'],
+              lambda: (list(row) for row in zip(criteria_names,
+                                                arrays['topsis/ideal_positive'].tolist(),
+                                                arrays['topsis/ideal_negative'].tolist()))),
+    ]
+
+
+def result_tables(kind, meta, arrays, k=None):
+    """Sonuc turune gore tablo listesi"""
+    if kind == 'critic':
+        return critic_tables(meta, arrays)
+    if kind == 'topsis':
+        return topsis_tables(meta, arrays, k)
+    raise ValueError(f"Disa aktarim desteklenmiyor: {kind}")
+
+
+def select_table(tables, slug=None):
+    """Tek tablolu bicimler icin tabloyu sec (varsayilan: ilk tablo)"""
+    if not slug:
+        return tables[0]
+    for table in tables:
+        if table_slug(table.name) == slug:
+            return table
+    choices = ', '.join(table_slug(table.name) for table in tables)
+    raise ValueError(f"Bilinmeyen tablo: {slug} (secenekler: {choices})")
+
+
+# ========== YAZICILAR ==========
+
+def write_xlsx(tables, path):
+    """Tum tablolari write-only calisma kitabina satir satir yaz"""
+    from openpyxl import Workbook
+    workbook = Workbook(write_only=True)
+    for table in tables:
+        sheet = workbook.create_sheet(table.name)
+        if table.header is not None:
+            sheet.append(table.header)
+        for row in table.rows():
+            sheet.append(row)
+    workbook.save(path)
+
+
+def write_csv(table, path):
+    """Tabloyu CSV olarak yaz (Excel'in Turkce karakterleri tanimasi icin BOM ile)"""
+    with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+        writer = csv.writer(f)
+        if table.header is not None:
+            writer.writerow(['' if cell is None else cell for cell in table.header])
+        rows = table.rows()
+        while True:
+            chunk = list(islice(rows, CHUNK_ROWS))
+            if not chunk:
+                break
+            writer.writerows(chunk)
+
+
+def write_parquet(table, path):
+    """Tabloyu Parquet olarak satir gruplari halinde yaz (pyarrow gerektirir)"""
+    if table.header is None:
+        raise ValueError(f"'{table.name}' tablosu Parquet olarak yazilamaz (basliksiz tablo)")
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ValueError('Parquet disa aktarimi icin pyarrow kurulu olmali')
+
+    names = [str(name) if name is not None else 'Alternatif' for name in table.header]
+    writer = None
+    rows = table.rows()
+    try:
+        while True:
+            chunk = list(islice(rows, CHUNK_ROWS))
+            if not chunk:
+                break
+            columns = [list(column) for column in zip(*chunk)]
+            if writer is None:
+                batch = pa.Table.from_arrays([pa.array(column) for column in columns], names=names)
+                writer = pq.ParquetWriter(path, batch.schema)
+            else:
+                batch = pa.Table.from_arrays(
+                    [pa.array(column, type=field.type) for column, field in zip(columns, writer.schema)],
+                    names=names)
+            writer.write_table(batch)
+        if writer is None:
+            empty = pa.Table.from_arrays([pa.array([], type=pa.null()) for _ in names], names=names)
+            pq.write_table(empty, path)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def write_export(tables, fmt, path, table=None):
+    """
+    Tablolari istenen bicimde dosyaya yaz
+
+    Args:
+        tables: result_tables ciktisi
+        fmt: 'xlsx' (tum tablolar), 'csv' veya 'parquet' (tek tablo)
+        table: CSV/Parquet icin tablo kisa adi (table_slug)
+    """
+    if fmt == 'xlsx':
+        write_xlsx(tables, path)
+    elif fmt == 'csv':
+        write_csv(select_table(tables, table), path)
+    elif fmt == 'parquet':
+        write_parquet(select_table(tables, table), path)
+    else:
+        raise ValueError(f"Gecersiz disa aktarim bicimi: {fmt}")
+
+
+# ========== ONBELLEK ==========
+
+def source_stamp(path):
+    """Kaynak dosyanin degisim damgasi (mtime + boyut); dosya yoksa None"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return f'{stat.st_mtime_ns:x}{stat.st_size:x}'
+
+
+class ExportCache:
+    """
+    Uretilen disa aktarim dosyalarinin disk onbellegi
+
+    Dosya adi kaynak sonucun damgasini icerir; sonuc yeniden yazildiginda
+    damga degisir, eski dosyalar bir sonraki uretimde silinir.
+    """
+
+    def __init__(self, base_dir):
+        """
+        Args:
+            base_dir: Disa aktarim dosyalarinin yazilacagi klasor
+        """
+        self.base_dir = base_dir
+        if not os.path.exists(base_dir):
+            os.makedirs(base_dir)
+
+    def path(self, source, stamp, fmt, table=None, k=None):
+        """Onbellek dosyasinin yolu"""
+        parts = [source, stamp, table or 'all', f'top{k}' if k else 'full']
+        return os.path.join(self.base_dir, f"{'-'.join(parts)}.{fmt}")
+
+    def get_or_build(self, source, stamp, fmt, build, table=None, k=None):
+        """
+        Onbellekteki dosyanin yolunu dondur, yoksa build(gecici_yol) ile uret
+
+        Uretim gecici dosyaya yapilip yeniden adlandirilir; yarim dosya
+        hicbir zaman sunulmaz.
+
+        Returns:
+            tuple: (dosya yolu, onbellekten mi)
+        """
+        path = self.path(source, stamp, fmt, table, k)
+        if os.path.exists(path):
+            return path, True
+
+        tmp_path = os.path.join(self.base_dir, f'.{uuid.uuid4().hex}.tmp.{fmt}')
+        try:
+            build(tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        self._prune(source, stamp)
+        return path, False
+
+    def _prune(self, source, stamp):
+        """Ayni kaynagin eski damgali dosyalarini sil"""
+        for old in glob.glob(os.path.join(glob.escape(self.base_dir), f'{glob.escape(source)}-*')):
+            if not os.path.basename(old).startswith(f'{source}-{stamp}-'):
+                try:
+                    os.remove(old)
+                except OSError:
+                    pass
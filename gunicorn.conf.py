@@ -0,0 +1,48 @@
+"""
+Uretim sunucusu: gunicorn -c gunicorn.conf.py
+
+Uygulama ana surecte bir kez yuklenir ve isinir (preload_app + KDS_WARMUP);
+isciler fork ile hazir numpy, sablon ve yontem durumunu devralir. Ayarlar:
+
+    KDS_BIND      dinlenecek adres (varsayilan 0.0.0.0:8000)
+    KDS_WORKERS   isci sureci sayisi (varsayilan CPU sayisi)
+    KDS_THREADS   isci basina is parcacigi (varsayilan 2)
+    KDS_TIMEOUT   istek zaman asimi, saniye (varsayilan 120)
+    KDS_METRICS_DIR  iscilerin metrik anlik goruntuleri (varsayilan data/metrics)
+    KDS_METRICS_INTERVAL  bir iscinin goruntusunu en fazla kac saniyede bir
+                  yazacagi (varsayilan 1)
+
+Her isci kendi sayaclarini tutar; /metrics ve /api/cache-stats tum iscileri
+KDS_METRICS_DIR uzerinden toplayip pid etiketiyle yayinlar (Prometheus'ta
+sum without (pid) (...) ile birlestirin). Diger iscilerin sayaclari en fazla
+KDS_METRICS_INTERVAL kadar geriden gelir; isci kapanirken son durum yazilir.
+Klasor sunucu baslarken temizlenir.
+
+Uygulama ayarlari (KDS_DATA_DIR, KDS_SECRET_KEY, ...) icin app.load_config'e bakin.
+"""
+import os
+
+from app import load_config
+from metrics import MetricsSnapshots
+
+os.environ.setdefault('KDS_WARMUP', '1')
+os.environ.setdefault('KDS_METRICS_DIR', os.path.join(load_config()['DATA_FOLDER'], 'metrics'))
+
+wsgi_app = 'app:create_app()'
+bind = os.environ.get('KDS_BIND', '0.0.0.0:8000')
+workers = int(os.environ.get('KDS_WORKERS', os.cpu_count() or 1))
+threads = int(os.environ.get('KDS_THREADS', 2))
+timeout = int(os.environ.get('KDS_TIMEOUT', 120))
+preload_app = True
+
+
+def on_starting(server):
+    """Onceki calistirmanin metrik dosyalarini sil (sayaclar sifirdan baslar)"""
+    MetricsSnapshots.clear(os.environ['KDS_METRICS_DIR'])
+
+
+def worker_exit(server, worker):
+    """Iscinin zamanlanmis metrik yazmasini beklemeden son durumunu yaz"""
+    import app
+    if app.METRICS is not None:
+        app.METRICS.flush(app.local_metrics)
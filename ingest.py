@@ -0,0 +1,461 @@
+import csv
+import datetime
+import io
+import os
+from collections import Counter
+from itertools import islice
+
+import numpy as np
+
+# Hucre turu kodlari
+_NUMBER, _STRING, _MISSING, _DATE, _OTHER = 0, 1, 2, 3, 4
+
+_TYPE_CODES = {
+    float: _NUMBER,
+    int: _NUMBER,
+    bool: _NUMBER,
+    np.float64: _NUMBER,
+    str: _STRING,
+    np.str_: _STRING,
+    type(None): _MISSING,
+    datetime.datetime: _DATE,
+    datetime.date: _DATE,
+}
+
+_MISSING_STRINGS = frozenset(['', 'nan', 'none', 'null'])
+
+CRITERIA_TYPE_WORDS = ['min', 'max', 'maks', 'maliyet', 'fayda']
+
+
+def _type_code(cls):
+    """Hucre turunu parse_value ile ayni onceliklerle siniflandir"""
+    code = _TYPE_CODES.get(cls)
+    if code is None:
+        # Alt siniflar (orn. pandas Timestamp -> datetime) icin issubclass
+        if issubclass(cls, (int, float)):
+            code = _NUMBER
+        elif issubclass(cls, (datetime.datetime, datetime.date)):
+            code = _DATE
+        elif issubclass(cls, str):
+            code = _STRING
+        else:
+            code = _OTHER
+        _TYPE_CODES[cls] = code
+    return code
+
+
+def _parse_or_none(value):
+    """Tek bir degeri float'a cevir, cevrilemezse None"""
+    try:
+        return float(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def _parse_clean_string(text):
+    """Temizlenmis metni (deger, durum) olarak cevir; durum: None, 'missing', 'invalid'"""
+    if text.lower() in _MISSING_STRINGS:
+        return 0.0, 'missing'
+    value = _parse_or_none(text)
+    if value is None:
+        return 0.0, 'invalid'
+    return value, None
+
+
+def _coerce_strings(strings, report=None):
+    """Metin hucrelerini toplu olarak float'a cevir"""
+    cleaned = [text.replace(',', '.').strip() for text in strings.tolist()]
+
+    values = None
+    if '' not in cleaned:
+        try:
+            values = np.fromiter(map(float, cleaned), dtype=np.float64, count=len(cleaned))
+        except ValueError:
+            pass
+
+    if values is not None:
+        # 'nan' metni parse_value'da 0 kabul edilir ('+nan' gibi bicimler NaN kalir)
+        missing = [i for i in np.flatnonzero(np.isnan(values))
+                   if cleaned[i].lower() in _MISSING_STRINGS]
+        values[missing] = 0.0
+        if report is not None:
+            report['missing'] += len(missing)
+        return values
+
+    # Bos veya gecersiz metin var: her benzersiz metin bir kez cevrilir
+    parsed = {text: _parse_clean_string(text) for text in dict.fromkeys(cleaned)}
+    value_map = {text: value for text, (value, _) in parsed.items()}
+    values = np.fromiter(map(value_map.__getitem__, cleaned), dtype=np.float64, count=len(cleaned))
+
+    if report is not None:
+        for text, count in Counter(cleaned).items():
+            status = parsed[text][1]
+            if status:
+                report[status] += count
+    return values
+
+
+def coerce_array(values):
+    """
+    Karisik hucreleri (sayi, metin, None, tarih) tek geciste float64 diziye cevir
+
+    parse_value ile birebir ayni kurallar uygulanir: None/NaN -> 0,
+    tarih -> 0, virgullu ondalik metinler ('1,5') -> 1.5, bos/'nan'/'none'/
+    'null' metinler ve cevrilemeyen metinler -> 0.
+
+    Args:
+        values: Ic ice liste veya numpy array
+
+    Returns:
+        numpy array (float64), girdiyle ayni boyutta
+    """
+    return _coerce(values, None)
+
+
+def coerce_matrix(values):
+    """
+    coerce_array ile ayni donusum, ayrica 0'a cevrilen hucrelerin raporu
+
+    Returns:
+        tuple: (float64 dizi, rapor sozlugu)
+            rapor: cells (toplam), zeroed (0'a cevrilen), missing (bos/None/NaN),
+                   invalid (sayiya cevrilemeyen metin/deger), dates (tarih)
+    """
+    report = {'cells': 0, 'zeroed': 0, 'missing': 0, 'invalid': 0, 'dates': 0}
+    out = _coerce(values, report)
+    report['cells'] = int(out.size)
+    report['zeroed'] = report['missing'] + report['invalid'] + report['dates']
+    return out, report
+
+
+def _coerce(values, report):
+    if isinstance(values, np.ndarray):
+        arr = values
+    else:
+        arr = np.array(values, dtype=object)
+        if arr.dtype == object and arr.size and isinstance(arr.flat[0], (list, tuple)):
+            raise ValueError('Matris satirlari ayni uzunlukta olmali')
+
+    # Zaten sayisal dizi: yalnizca NaN -> 0
+    if arr.dtype.kind in 'fiub':
+        out = arr.astype(np.float64)
+        nan_mask = np.isnan(out)
+        out[nan_mask] = 0.0
+        if report is not None:
+            report['missing'] += int(nan_mask.sum())
+        return out
+
+    if arr.dtype.kind == 'U':
+        return _coerce_strings(arr.reshape(-1), report).reshape(arr.shape)
+
+    flat = arr.reshape(-1)
+    cell_types = list(map(type, flat))
+    for cls in set(cell_types):
+        _type_code(cls)
+    codes = np.fromiter(map(_TYPE_CODES.__getitem__, cell_types), dtype=np.int8, count=flat.size)
+    out = np.zeros(flat.size, dtype=np.float64)
+
+    numbers = codes == _NUMBER
+    if numbers.any():
+        number_values = flat[numbers].astype(np.float64)
+        nan_mask = np.isnan(number_values)
+        number_values[nan_mask] = 0.0
+        out[numbers] = number_values
+        if report is not None:
+            report['missing'] += int(nan_mask.sum())
+
+    strings = codes == _STRING
+    if strings.any():
+        out[strings] = _coerce_strings(flat[strings], report)
+
+    others = codes == _OTHER
+    if others.any():
+        parsed = [_parse_or_none(v) for v in flat[others]]
+        out[others] = [0.0 if v is None else v for v in parsed]
+        if report is not None:
+            report['invalid'] += sum(v is None for v in parsed)
+
+    if report is not None:
+        report['missing'] += int(np.count_nonzero(codes == _MISSING))
+        report['dates'] += int(np.count_nonzero(codes == _DATE))
+
+    return out.reshape(arr.shape)
+
+
+# ========== SATIR KAYNAKLARI ==========
+
+def iter_excel_rows(file):
+    """
+    Excel dosyasinin ilk sayfasini satir satir oku (openpyxl read_only)
+
+    .xls dosyalari openpyxl ile okunamadigi icin pandas'a dusulur.
+    """
+    if _filename(file).lower().endswith('.xls'):
+        import pandas as pd
+        df = pd.read_excel(file, header=None)
+        yield from df.itertuples(index=False, name=None)
+        return
+
+    from openpyxl import load_workbook
+    workbook = load_workbook(file, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[0]
+        yield from sheet.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def iter_excel_sheets(file):
+    """
+    Excel dosyasinin tum sayfalarini (sayfa adi, satir ureteci) olarak oku
+
+    Her sayfanin satirlari bir sonraki sayfaya gecmeden tuketilmelidir.
+    """
+    if _filename(file).lower().endswith('.xls'):
+        import pandas as pd
+        for name, df in pd.read_excel(file, header=None, sheet_name=None).items():
+            yield name, df.itertuples(index=False, name=None)
+        return
+
+    from openpyxl import load_workbook
+    workbook = load_workbook(file, read_only=True, data_only=True)
+    try:
+        for sheet in workbook.worksheets:
+            yield sheet.title, sheet.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def iter_csv_rows(file, encoding='utf-8-sig'):
+    """
+    CSV dosyasini standart csv modulu ile satir satir oku
+
+    Tum hucreler metin olarak okunur; sayiya cevirme coerce_array'e
+    birakilir, boylece kurallar Excel ile ayni kalir. Bos satirlar atlanir.
+    pandas gerektirmez.
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, newline='', encoding=encoding) as f:
+            yield from (row for row in csv.reader(f) if row)
+        return
+
+    # Yuklenen dosyalar (FileStorage) ve ikili dosya nesneleri
+    text = io.TextIOWrapper(getattr(file, 'stream', file), encoding=encoding, newline='')
+    try:
+        yield from (row for row in csv.reader(text) if row)
+    finally:
+        # Alttaki akisi kapatmadan birak
+        text.detach()
+
+
+def _filename(file):
+    """Dosya nesnesinin veya yolunun adi"""
+    if isinstance(file, (str, os.PathLike)):
+        return os.fspath(file)
+    return str(getattr(file, 'filename', None) or getattr(file, 'name', '') or '')
+
+
+def iter_rows(file):
+    """Dosya uzantisina gore uygun satir kaynagini sec (dosya nesnesi veya yol)"""
+    if _filename(file).lower().endswith('.csv'):
+        return iter_csv_rows(file)
+    return iter_excel_rows(file)
+
+
+# ========== BICIM AYRISTIRMA ==========
+
+def _is_missing(value):
+    """pd.notna'nin tersi (None, NaN veya bos CSV hucresi)"""
+    return value is None or value == '' or (isinstance(value, float) and value != value)
+
+
+def _cells(row, start, stop):
+    """Satirin [start:stop] dilimini, eksik hucreleri None ile doldurarak dondur"""
+    cells = tuple(row[start:stop])
+    if len(cells) < stop - start:
+        cells += (None,) * (stop - start - len(cells))
+    return cells
+
+
+def _repeats_header(row, header):
+    """Satirin veri hucreleri kriter adlarini tekrarliyor mu"""
+    # Hizli on kontrol: basliklar metindir ve ilk ad eslesmelidir
+    if len(row) < 2 or not isinstance(row[1], str) or row[1].strip() != header[0]:
+        return False
+    return [str(x).strip() for x in _cells(row, 1, len(header) + 1)] == header
+
+
+def _read_body(rows, n_criteria, keep_row, chunk_size, criteria_names=None):
+    """
+    Alternatif satirlarini parca parca float64 matrise cevir
+
+    Bellekte ayni anda en fazla chunk_size satirlik ham hucre tutulur.
+    criteria_names verilirse kriter adlarini tekrarlayan ilk satirda (yeni
+    bir bolumun basligi, orn. ara hesap tablolari) okuma durur.
+    """
+    alternative_names = []
+    blocks = []
+    buffer = []
+    header = [str(name).strip() for name in criteria_names] if criteria_names else None
+
+    for row in rows:
+        if header and _repeats_header(row, header):
+            break
+        if not row or _is_missing(row[0]) or not keep_row(row[0]):
+            continue
+        alternative_names.append(str(row[0]))
+        buffer.append(_cells(row, 1, n_criteria + 1))
+        if len(buffer) >= chunk_size:
+            blocks.append(coerce_array(np.array(buffer, dtype=object).reshape(len(buffer), n_criteria)))
+            buffer = []
+
+    if buffer:
+        blocks.append(coerce_array(np.array(buffer, dtype=object).reshape(len(buffer), n_criteria)))
+
+    if blocks:
+        matrix = np.concatenate(blocks) if len(blocks) > 1 else blocks[0]
+    else:
+        matrix = np.zeros((0, n_criteria))
+    return alternative_names, matrix
+
+
+def _is_type_row(row):
+    """Satirin veri hucrelerinin tamami kriter yonu kelimesi mi (min, max, maliyet, ...)"""
+    words = [str(x).lower().strip() for x in row[1:] if not _is_missing(x)]
+    return all(x in CRITERIA_TYPE_WORDS for x in words if x)
+
+
+def parse_generic_rows(rows, chunk_size=10000):
+    """
+    CRITIC bicimindeki satirlari ayristir
+
+    Gelismis bicim: 1. satir yonler (min/max), 2. satir kriter adlari
+    (yonler iki satirda tekrarlanabilir). Alternatiflerden sonra kriter
+    adlarini tekrarlayan ilk satirda okuma durur.
+    Basit bicim: 1. satir kriter adlari, tum kriterler 'max'.
+
+    Returns:
+        dict: criteria_names, criteria_types, alternative_names, matrix (ndarray)
+    """
+    rows = iter(rows)
+    first = next(rows, None) or ()
+
+    is_advanced_format = _is_type_row(first)
+
+    if is_advanced_format:
+        criteria_types = []
+        for val in first[1:]:
+            if not _is_missing(val):
+                val_str = str(val).lower().strip()
+                if val_str in ['min', 'maliyet']:
+                    criteria_types.append('min')
+                elif val_str in ['max', 'maks', 'fayda']:
+                    criteria_types.append('max')
+
+        second = next(rows, None) or ()
+        # Yonler ikinci satirda tekrarlanmis olabilir (orn. maliyet/fayda + min/maks)
+        if any(not _is_missing(x) for x in second[1:]) and _is_type_row(second):
+            second = next(rows, None) or ()
+        criteria_names = [str(x) for x in second[1:] if not _is_missing(x)]
+
+        def keep_row(name):
+            return not str(name).lower().startswith(('min', 'max', 'maks'))
+    else:
+        criteria_names = [str(x) for x in first[1:] if not _is_missing(x)]
+        criteria_types = ['max'] * len(criteria_names)
+
+        def keep_row(name):
+            return True
+
+    alternative_names, matrix = _read_body(rows, len(criteria_names), keep_row, chunk_size,
+                                           criteria_names)
+
+    return {
+        'criteria_names': criteria_names,
+        'criteria_types': criteria_types,
+        'alternative_names': alternative_names,
+        'matrix': matrix
+    }
+
+
+def parse_weighted_rows(rows, chunk_size=10000):
+    """
+    TOPSIS bicimindeki satirlari ayristir
+
+    Satir 0: Kriter adlari, Satir 1: Kriter yonleri (min/max),
+    Satir 2: Agirliklar, Satir 3+: Alternatifler
+
+    Returns:
+        dict: criteria_names, criteria_types, weights, alternative_names, matrix (ndarray)
+    """
+    rows = iter(rows)
+    header = list(islice(rows, 3))
+    header += [()] * (3 - len(header))
+
+    criteria_names = [str(x) for x in header[0][1:] if not _is_missing(x)]
+    n_criteria = len(criteria_names)
+
+    criteria_types = []
+    for val in _cells(header[1], 1, n_criteria + 1):
+        if not _is_missing(val) and str(val).lower().strip() in ['min', 'maliyet']:
+            criteria_types.append('min')
+        else:
+            criteria_types.append('max')
+
+    weights = coerce_array(np.array(_cells(header[2], 1, n_criteria + 1), dtype=object))
+
+    alternative_names, matrix = _read_body(rows, n_criteria, lambda name: True, chunk_size)
+
+    return {
+        'criteria_names': criteria_names,
+        'criteria_types': criteria_types,
+        'weights': weights,
+        'alternative_names': alternative_names,
+        'matrix': matrix
+    }
+
+
+def parse_scenario_sheets(sheets, chunk_size=10000):
+    """
+    Her sayfasi bir senaryo olan calisma kitabini s x m x n yigina cevir
+
+    Sayfalar parse_generic_rows ile okunur; alternatif veya kriter icermeyen
+    sayfalar (orn. aciklama sayfalari) atlanir. Tum senaryolar ayni kriter
+    adlari, yonleri ve matris boyutuna sahip olmalidir.
+
+    Args:
+        sheets: (sayfa adi, satirlar) ciftleri (orn. iter_excel_sheets)
+
+    Returns:
+        dict: scenario_names, criteria_names, criteria_types,
+              alternative_names (ilk senaryonun), stack (ndarray)
+    """
+    first = None
+    scenario_names = []
+    matrices = []
+
+    for name, rows in sheets:
+        parsed = parse_generic_rows(rows, chunk_size)
+        if 0 in parsed['matrix'].shape:
+            continue
+        if first is None:
+            first = parsed
+        elif parsed['matrix'].shape != first['matrix'].shape:
+            raise ValueError(f"'{name}' sayfasinin boyutu {parsed['matrix'].shape}, "
+                             f"ilk senaryo {first['matrix'].shape}")
+        elif (parsed['criteria_names'] != first['criteria_names']
+              or parsed['criteria_types'] != first['criteria_types']):
+            raise ValueError(f"'{name}' sayfasinin kriterleri ilk senaryodan farkli")
+        scenario_names.append(str(name))
+        matrices.append(parsed['matrix'])
+
+    if first is None:
+        raise ValueError('Calisma kitabinda senaryo bulunamadi')
+
+    return {
+        'scenario_names': scenario_names,
+        'criteria_names': first['criteria_names'],
+        'criteria_types': first['criteria_types'],
+        'alternative_names': first['alternative_names'],
+        'stack': np.stack(matrices)
+    }
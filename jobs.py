@@ -0,0 +1,239 @@
+import json
+import os
+import queue
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from storage import atomic_write_bytes
+
+# Is durumlari
+QUEUED, RUNNING, DONE, FAILED, CANCELLED = 'queued', 'running', 'done', 'failed', 'cancelled'
+FINISHED_STATES = (DONE, FAILED, CANCELLED)
+
+JOB_ID_PATTERN = re.compile(r'^[0-9a-f]{32}$')
+
+
+class JobCancelled(Exception):
+    """Is iptal edildiginde ilerleme geri cagirimindan firlatilir"""
+
+
+class QueueFull(Exception):
+    """Kuyrukta yer kalmadiginda submit tarafindan firlatilir"""
+
+
+class Job:
+    """Arka planda calisan tek bir analiz isi"""
+
+    def __init__(self, kind):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.status = QUEUED
+        self.progress = 0.0
+        self.step = None
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self._cancel = threading.Event()
+        # Durum yansisi (JobManager state_dir verildiginde ayarlanir)
+        self._cancel_path = None
+        self._on_change = None
+
+    @classmethod
+    def from_dict(cls, data):
+        """Baska bir surecin yazdigi durumdan salt okunur Job"""
+        job = cls(data['kind'])
+        job.id = data['job_id']
+        for key in ('status', 'progress', 'step', 'result', 'error',
+                    'created_at', 'started_at', 'finished_at'):
+            setattr(job, key, data[key])
+        return job
+
+    def cancel_requested(self):
+        """Bu surecte veya (durum yansisi varsa) baska bir surecte iptal istendi mi"""
+        if self._cancel.is_set():
+            return True
+        return bool(self._cancel_path) and os.path.exists(self._cancel_path)
+
+    def report(self, step, fraction):
+        """Ilerlemeyi guncelle; iptal istenmisse JobCancelled firlat"""
+        if self.cancel_requested():
+            raise JobCancelled()
+        self.step = step
+        self.progress = min(max(float(fraction), 0.0), 1.0)
+        if self._on_change:
+            self._on_change(self)
+
+    def to_dict(self):
+        return {
+            'job_id': self.id,
+            'kind': self.kind,
+            'status': self.status,
+            'progress': self.progress,
+            'step': self.step,
+            'result': self.result,
+            'error': self.error,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at
+        }
+
+
+class JobManager:
+    """
+    Sinirli kuyruklu, sabit sayida is parcacigiyla calisan is yoneticisi
+
+    Is fonksiyonu func(report, *args) seklinde cagrilir; report(adim, oran)
+    ilerlemeyi kaydeder ve iptal edilen islerde JobCancelled firlatarak
+    hesaplamayi bir sonraki adim sinirinda durdurur. Is parcaciklari ilk
+    gonderimde baslatilir (fork oncesi olusturulan yonetici iscilerde de
+    calisir).
+
+    state_dir verilirse her durum degisikligi '<is>.json' olarak yazilir;
+    ayni klasoru paylasan surecler (prefork isciler) birbirinin islerini
+    sorgulayabilir ve '<is>.cancel' isaretiyle iptal edebilir. Kuyruk ve
+    sayaclar (stats) surece ozeldir.
+    """
+
+    def __init__(self, max_workers=2, max_queue=16, max_finished=256, state_dir=None):
+        """
+        Args:
+            max_workers: Ayni anda calisacak en fazla is sayisi
+            max_queue: Bekleyebilecek en fazla is sayisi (dolunca QueueFull)
+            max_finished: Durumu sorgulanabilmesi icin saklanan biten is sayisi
+            state_dir: Surecler arasi paylasilan durum klasoru (None: yalnizca bellek)
+        """
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.max_finished = max_finished
+        self.state_dir = state_dir
+        if state_dir and not os.path.exists(state_dir):
+            os.makedirs(state_dir)
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self._workers = []
+
+    def _start_workers(self):
+        with self._lock:
+            if self._workers:
+                return
+            for i in range(self.max_workers):
+                worker = threading.Thread(target=self._work, name=f'kds-job-{i}', daemon=True)
+                worker.start()
+                self._workers.append(worker)
+
+    def submit(self, kind, func, *args):
+        """Isi kuyruga ekle ve Job nesnesini dondur"""
+        self._start_workers()
+        job = Job(kind)
+        if self.state_dir:
+            job._cancel_path = self._state_path(job.id, 'cancel')
+            job._on_change = self._save
+        with self._lock:
+            # Kuyruga yalnizca kilit altinda eklenir; durum yansisi isten once yazilir
+            if self._queue.full():
+                raise QueueFull('Is kuyrugu dolu, daha sonra tekrar deneyin')
+            self._jobs[job.id] = job
+            self._save(job)
+            self._queue.put_nowait((job, func, args))
+            self._prune()
+        return job
+
+    def get(self, job_id):
+        """Isi dondur (baska surecin isi durum yansisindan okunur), yoksa None"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is not None or not self.state_dir or not JOB_ID_PATTERN.match(job_id or ''):
+            return job
+        try:
+            with open(self._state_path(job_id, 'json'), 'r', encoding='utf-8') as f:
+                return Job.from_dict(json.load(f))
+        except (OSError, ValueError):
+            return None
+
+    def cancel(self, job_id):
+        """
+        Iptal iste; kuyruktaki is hic baslamaz, calisan is bir sonraki
+        adimda durur
+
+        Returns:
+            bool: Is bulunduysa ve henuz bitmediyse True
+        """
+        job = self.get(job_id)
+        if job is None or job.status in FINISHED_STATES:
+            return False
+        with self._lock:
+            local = job_id in self._jobs
+        if not local:
+            # Isin sahibi surec isareti bir sonraki adimda gorur
+            atomic_write_bytes(self._state_path(job_id, 'cancel'), b'')
+            return True
+        job._cancel.set()
+        if job.status == QUEUED:
+            self._finish(job, CANCELLED)
+        return True
+
+    def stats(self):
+        """Kuyruk ve is durumu sayaclari"""
+        with self._lock:
+            counts = {state: 0 for state in (QUEUED, RUNNING) + FINISHED_STATES}
+            for job in self._jobs.values():
+                counts[job.status] += 1
+        return {
+            'workers': self.max_workers,
+            'max_queue': self.max_queue,
+            'jobs': counts
+        }
+
+    def _state_path(self, job_id, suffix):
+        return os.path.join(self.state_dir, f'{job_id}.{suffix}')
+
+    def _save(self, job):
+        """Durum yansisini yaz (state_dir yoksa bir sey yapmaz)"""
+        if self.state_dir:
+            atomic_write_bytes(self._state_path(job.id, 'json'),
+                               json.dumps(job.to_dict()).encode('utf-8'))
+
+    def _finish(self, job, status, error=None):
+        job.status = status
+        job.error = error
+        job.finished_at = time.time()
+        self._save(job)
+
+    def _prune(self):
+        """En eski biten isleri max_finished sinirina gore unut"""
+        finished = [job_id for job_id, job in self._jobs.items() if job.status in FINISHED_STATES]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job_id]
+            if self.state_dir:
+                for suffix in ('json', 'cancel'):
+                    if os.path.exists(self._state_path(job_id, suffix)):
+                        os.remove(self._state_path(job_id, suffix))
+
+    def _work(self):
+        while True:
+            job, func, args = self._queue.get()
+            try:
+                if job.cancel_requested():
+                    if job.status not in FINISHED_STATES:
+                        self._finish(job, CANCELLED)
+                    continue
+                job.status = RUNNING
+                job.started_at = time.time()
+                self._save(job)
+                try:
+                    job.result = func(job.report, *args)
+                except JobCancelled:
+                    self._finish(job, CANCELLED)
+                except Exception as e:
+                    self._finish(job, FAILED, str(e))
+                else:
+                    job.progress = 1.0
+                    self._finish(job, DONE)
+            finally:
+                self._queue.task_done()
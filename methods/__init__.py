@@ -1,4 +1,18 @@
+from .registry import METHODS, available_methods, create, get_method, register
 from .critic import CRITIC
 from .topsis import TOPSIS
+from .entropy import Entropy
+from .vikor import VIKOR
+from .edas import EDAS
+from .pipeline import CriticTopsis
+from .blocked import BlockedCRITIC, BlockedTOPSIS, open_matrix
+from .sensitivity import WeightSensitivity
+from .stability import WeightStability
+from .bootstrap import CriticBootstrap
+from .incremental import IncrementalTOPSIS, OnlineCRITIC
+from .stacked import StackedCRITIC, aggregate_weights, weight_spread
 
-__all__ = ['CRITIC', 'TOPSIS']
+__all__ = ['CRITIC', 'TOPSIS', 'Entropy', 'VIKOR', 'EDAS', 'CriticTopsis', 'BlockedCRITIC',
+           'BlockedTOPSIS', 'open_matrix', 'WeightSensitivity', 'WeightStability', 'CriticBootstrap',
+           'IncrementalTOPSIS', 'OnlineCRITIC', 'StackedCRITIC', 'aggregate_weights', 'weight_spread',
+           'METHODS', 'available_methods', 'create', 'get_method', 'register']
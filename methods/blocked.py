@@ -0,0 +1,264 @@
+"""
+Bellege sigmayan karar matrisleri icin bloklu CRITIC ve TOPSIS
+
+Karar matrisi bellege eslenmis (np.load(..., mmap_mode='r')) bir .npy dosyasi
+veya herhangi bir 2 boyutlu dizi olabilir; matrisin tamami hicbir zaman
+kopyalanmaz. Satirlar block_rows'luk bloklar halinde okunur, secilen veri
+tipine (float32/float64) cevrilir ve yerinde islenir. Tepe bellek kullanimi
+yaklasik 2 x blok boyutu + alternatif basina birkac vektordur.
+
+float32 dogrulugu (100000 x 50 rastgele matris, float64 ile karsilastirma):
+TOPSIS yakinlik katsayilarinda en buyuk mutlak fark ~1e-7, CRITIC
+agirliklarinda ~1e-9, korelasyonlarda ~3e-8. Yakinlik farki bu mertebede olan
+komsu alternatiflerin yeri degisebilir (orn. %1.5 alternatifte en fazla 3
+sira; ilk 100 sira ayni). float64 modu tam TOPSIS/CRITIC ile ~1e-15 icinde
+aynidir. Sutun toplamlari ve momentler her zaman float64 biriktirilir.
+Bu sinirlar tests/test_blocked.py'de bellege eslenmis .npy ile sinanir.
+"""
+import time
+
+import numpy as np
+
+from .incremental import OnlineCRITIC
+from .kernels import benefit_mask, rank, top_k
+from .registry import DETAIL_LEVELS, run_steps
+
+DTYPES = ('float32', 'float64')
+
+
+def open_matrix(path):
+    """
+    .npy karar matrisini bellege esleyerek ac (salt okunur)
+
+    Returns:
+        numpy memmap (alternatifler x kriterler)
+    """
+    matrix = np.load(path, mmap_mode='r')
+    if matrix.ndim != 2 or matrix.dtype.kind not in 'fiu':
+        raise ValueError('Karar matrisi 2 boyutlu sayisal bir dizi olmali')
+    return matrix
+
+
+def _check_dtype(dtype):
+    dtype = np.dtype(dtype)
+    if dtype.name not in DTYPES:
+        raise ValueError(f"Gecersiz veri tipi: {dtype.name} (float32 veya float64)")
+    return dtype
+
+
+def iter_blocks(matrix, block_rows, dtype):
+    """
+    Satir bloklarini (baslangic, kopya) olarak dondur
+
+    Her blok secilen veri tipinde yeni bir dizidir (kaynak dosya degismez);
+    NaN hucreler coerce_array'deki gibi 0 kabul edilir.
+    """
+    for start in range(0, matrix.shape[0], block_rows):
+        block = np.array(matrix[start:start + block_rows], dtype=dtype)
+        block[np.isnan(block)] = 0
+        yield start, block
+
+
+class BlockedTOPSIS:
+    """
+    Bloklu TOPSIS: iki geciste, matrisin boyutundan bagimsiz ek bellekle
+
+    1. gecis: sutun kare toplamlari ve sutun min/max degerleri
+    2. gecis: her blok yerinde agirliklandirilir, D+ ve D- hesaplanir
+    Normalize ve agirlikli matrisler saklanmadigi icin 'full' detay desteklenmez.
+    """
+
+    def __init__(self, decision_matrix, weights, criteria_types, dtype='float64', block_rows=65536):
+        """
+        Args:
+            decision_matrix: Karar matrisi (memmap veya numpy array, kopyalanmaz)
+            weights: Kriter agirliklari
+            criteria_types: Kriter tipleri ('max' veya 'min')
+            dtype: Blok hesaplamalarinin veri tipi ('float32' veya 'float64')
+            block_rows: Ayni anda islenen satir sayisi
+        """
+        self.decision_matrix = decision_matrix
+        self.weights = np.array(weights, dtype=float)
+        self.criteria_types = criteria_types
+        self.dtype = _check_dtype(dtype)
+        self.block_rows = int(block_rows)
+        self.n_alternatives, self.n_criteria = decision_matrix.shape
+        self.k = None
+        self.timings = {}
+
+        if self.block_rows < 1:
+            raise ValueError('block_rows en az 1 olmali')
+        if len(self.weights) != self.n_criteria or len(criteria_types) != self.n_criteria:
+            raise ValueError('Agirlik ve kriter tipi sayisi kriter sayisina esit olmali')
+
+    def scan(self):
+        """1. Adim: Sutun kare toplamlari, min ve max (float64 biriktirme)"""
+        sum_squares = np.zeros(self.n_criteria)
+        self.col_min = np.full(self.n_criteria, np.inf)
+        self.col_max = np.full(self.n_criteria, -np.inf)
+
+        for _, block in iter_blocks(self.decision_matrix, self.block_rows, self.dtype):
+            sum_squares += np.einsum('ij,ij->j', block, block, dtype=np.float64)
+            np.minimum(self.col_min, block.min(axis=0), out=self.col_min)
+            np.maximum(self.col_max, block.max(axis=0), out=self.col_max)
+
+        norm_factors = np.sqrt(sum_squares)
+        norm_factors[norm_factors == 0] = 1
+        # Agirlikli normalize deger = x * w / norm
+        self.factors = self.weights / norm_factors
+        return self.factors
+
+    def find_ideal_solutions(self):
+        """2. Adim: Ideal cozumler, sutun min/max degerlerinden (matris okunmaz)"""
+        scaled_min = self.col_min * self.factors
+        scaled_max = self.col_max * self.factors
+        high = np.maximum(scaled_min, scaled_max)
+        low = np.minimum(scaled_min, scaled_max)
+
+        is_benefit = benefit_mask(self.criteria_types)
+        self.ideal_positive = np.where(is_benefit, high, low)
+        self.ideal_negative = np.where(is_benefit, low, high)
+        return self.ideal_positive, self.ideal_negative
+
+    def calculate_distances(self):
+        """3. Adim: D+ ve D-, her blok yerinde agirliklandirilarak"""
+        self.distance_positive = np.empty(self.n_alternatives, dtype=self.dtype)
+        self.distance_negative = np.empty(self.n_alternatives, dtype=self.dtype)
+        factors = self.factors.astype(self.dtype)
+        ideals = [(self.ideal_positive.astype(self.dtype), self.distance_positive),
+                  (self.ideal_negative.astype(self.dtype), self.distance_negative)]
+        buffer = None
+
+        for start, block in iter_blocks(self.decision_matrix, self.block_rows, self.dtype):
+            block *= factors
+            if buffer is None or buffer.shape != block.shape:
+                buffer = np.empty_like(block)
+            for ideal, out in ideals:
+                np.subtract(block, ideal, out=buffer)
+                np.square(buffer, out=buffer)
+                np.sqrt(buffer.sum(axis=1), out=out[start:start + len(block)])
+
+        return self.distance_positive, self.distance_negative
+
+    def calculate_closeness(self):
+        """4. Adim: Yakinlik katsayisi ve siralama"""
+        denominator = self.distance_positive + self.distance_negative
+        denominator[denominator == 0] = 1
+        self.closeness = self.distance_negative / denominator
+        if self.k:
+            self.top_indices = top_k(self.closeness, self.k)
+            self.ranking = None
+        else:
+            self.ranking = rank(self.closeness)
+        return self.closeness, self.ranking
+
+    def run(self, detail='summary', progress=None, k=None):
+        """
+        Tum adimlari calistir
+
+        Args:
+            detail: 'weights-only' veya 'summary' (TOPSIS.run ile ayni alanlar)
+            progress: Her adimdan sonra progress(adim_adi, oran) seklinde cagrilir
+            k: Verilirse yalnizca en iyi k alternatif dondurulur (TOPSIS.run gibi)
+
+        Returns:
+            dict: TOPSIS.run alanlari; k verilmediyse alternatif bazli alanlar
+            (closeness, ranking, distance_*) listeye cevrilmeden numpy dizisi
+            olarak dondurulur, bellek siniri sonucta da korunur
+        """
+        if detail not in DETAIL_LEVELS:
+            raise ValueError(f"Gecersiz detay seviyesi: {detail}")
+        if detail == 'full':
+            raise ValueError("Bloklu modda 'full' detay desteklenmez")
+        self.k = k
+
+        steps = [self.scan, self.find_ideal_solutions, self.calculate_distances,
+                 self.calculate_closeness]
+        self.timings = run_steps(steps, progress)
+
+        if k:
+            rows = self.top_indices
+            result = {
+                'k': len(rows),
+                'n_alternatives': self.n_alternatives,
+                'indices': rows.tolist(),
+                'closeness': self.closeness[rows].tolist(),
+                'ranking': list(range(1, len(rows) + 1)),
+                'weights_used': self.weights.tolist()
+            }
+        else:
+            result = {
+                'closeness': self.closeness,
+                'ranking': self.ranking,
+                'weights_used': self.weights.tolist()
+            }
+        if detail == 'weights-only':
+            return result
+
+        distances = (self.distance_positive, self.distance_negative)
+        if k:
+            distances = [distance[rows].tolist() for distance in distances]
+        result.update({
+            'ideal_positive': self.ideal_positive.tolist(),
+            'ideal_negative': self.ideal_negative.tolist(),
+            'distance_positive': distances[0],
+            'distance_negative': distances[1]
+        })
+        return result
+
+
+class BlockedCRITIC:
+    """
+    Bloklu CRITIC: tek geciste, OnlineCRITIC biriktiricileriyle
+
+    Min-max normalizasyonu dogrusal oldugundan standart sapma ve korelasyonlar
+    ham momentlerden turetilir; normalize matris olusturulmaz, bu nedenle
+    'full' detay desteklenmez.
+    """
+
+    def __init__(self, decision_matrix, criteria_types, dtype='float64', block_rows=65536):
+        """
+        Args:
+            decision_matrix: Karar matrisi (memmap veya numpy array, kopyalanmaz)
+            criteria_types: Kriter tipleri ('max' veya 'min')
+            dtype: Blok hesaplamalarinin veri tipi ('float32' veya 'float64')
+            block_rows: Ayni anda islenen satir sayisi
+        """
+        self.decision_matrix = decision_matrix
+        self.criteria_types = criteria_types
+        self.dtype = _check_dtype(dtype)
+        self.block_rows = int(block_rows)
+        self.n_alternatives, self.n_criteria = decision_matrix.shape
+        self.timings = {}
+
+        if self.block_rows < 1:
+            raise ValueError('block_rows en az 1 olmali')
+
+    def run(self, detail='summary', progress=None):
+        """
+        Agirliklari hesapla
+
+        Args:
+            detail: 'weights-only' veya 'summary' (CRITIC.run ile ayni alanlar)
+            progress: Her bloktan sonra progress('update', oran) seklinde cagrilir
+        """
+        if detail not in DETAIL_LEVELS:
+            raise ValueError(f"Gecersiz detay seviyesi: {detail}")
+        if detail == 'full':
+            raise ValueError("Bloklu modda 'full' detay desteklenmez")
+
+        accumulator = OnlineCRITIC(self.criteria_types, dtype=self.dtype)
+        started = time.perf_counter()
+        for start, block in iter_blocks(self.decision_matrix, self.block_rows, self.dtype):
+            accumulator.update(block)
+            if progress:
+                progress('update', (start + len(block)) / self.n_alternatives)
+        self.timings = {'update': time.perf_counter() - started}
+
+        started = time.perf_counter()
+        result = accumulator.run()
+        self.timings['calculate_weights'] = time.perf_counter() - started
+        del result['n_alternatives']
+        if detail == 'weights-only':
+            return {'weights': result['weights']}
+        return result
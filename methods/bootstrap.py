@@ -0,0 +1,279 @@
+"""
+CRITIC agirliklari icin bootstrap / jackknife guven araliklari
+
+Her yeniden ornekleme, alternatif basina bir tekrar sayaci (c_i) olarak
+temsil edilir; yeniden orneklenmis matris hic olusturulmaz. CRITIC'in
+ihtiyac duydugu istatistikler agirlikli momentlerdir:
+
+    - Min-Max normalizasyonu sutun basina afin bir donusumdur; normalize
+      sutunun standart sapmasi sigma_j / aralik_j olur (aralik: c_i > 0 olan
+      satirlardaki max - min).
+    - Korelasyon afin donusumden etkilenmez (maliyet kriterlerinde isaret
+      degisir); catisma toplami sum_k r_jk = s_j / sigma_j * cov(x_j, y),
+      y = sum_k s_k x_k / sigma_k, tek bir yardimci sutunla hesaplanir.
+
+Boylece bir blok O(s m n) islem ve dort matris carpimiyla hesaplanir
+(s x n x n korelasyon yigini yerine). Sonuclar StackedCRITIC ile acikca
+olusturulan yiginlarla ayni agirliklari verir (fark ~1e-15).
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+
+import numpy as np
+
+from .kernels import benefit_mask
+
+RESAMPLING_METHODS = ('bootstrap', 'jackknife')
+
+
+def _first_selected(order, selected):
+    """
+    Her ornek ve sutun icin verilen sirada secili (c_i > 0) ilk satir
+
+    Bir satirin bootstrap orneginde bulunmama olasiligi ~0.37 oldugundan
+    dongu genellikle birkac adimda biter.
+
+    Args:
+        order: m x n, her sutunun satir sirasi (orn. buyukten kucuge)
+        selected: s x m secim maskesi
+
+    Returns:
+        numpy array: s x n satir indeksleri
+    """
+    s, n = selected.shape[0], order.shape[1]
+    result = np.zeros((s, n), dtype=np.intp)
+    pending = np.ones((s, n), dtype=bool)
+    for rows in order:
+        hit = selected[:, rows] & pending
+        result[hit] = np.broadcast_to(rows, (s, n))[hit]
+        pending &= ~hit
+        if not pending.any():
+            break
+    return result
+
+
+def resampled_weights(X, is_benefit, counts, order=None):
+    """
+    Satir tekrar sayaclariyla yeniden orneklenmis matrislerin CRITIC agirliklari
+
+    Args:
+        X: m x n karar matrisi (float64; standartlastirilmis olmasi sayisal
+           kararlilik icin onerilir, sonuc afin donusumden etkilenmez)
+        is_benefit: Fayda maskesi (n)
+        counts: s x m satir tekrar sayilari (her ornekte en az iki satir)
+        order: argsort(X, axis=0) (tekrar tekrar cagrilarda onceden hesaplanabilir)
+
+    Returns:
+        numpy array: s x n agirliklar
+    """
+    m, n = X.shape
+    if order is None:
+        order = np.argsort(X, axis=0)
+    counts = np.asarray(counts, dtype=float)
+    totals = counts.sum(axis=1, keepdims=True)
+    W = counts / totals
+    ddof_scale = totals / (totals - 1)
+    signs = np.where(is_benefit, 1.0, -1.0)
+
+    # Agirlikli ortalama ve orneklem varyansi (ddof=1, CRITIC ile ayni)
+    mean = W @ X
+    variance = np.maximum((W @ (X * X) - mean * mean) * ddof_scale, 0.0)
+    sigma = np.sqrt(variance)
+
+    # Secili satirlar uzerinde sutun araligi
+    selected = counts > 0
+    columns = np.arange(n)
+    high = X[_first_selected(order[::-1], selected), columns]
+    low = X[_first_selected(order, selected), columns]
+    spread = high - low
+
+    varying = (spread > 0) & (sigma > 0)
+    inv_sigma = np.divide(1.0, sigma, out=np.zeros_like(sigma), where=varying)
+    std_normalized = np.divide(sigma, spread, out=np.zeros_like(sigma), where=varying)
+
+    # sum_k r_jk = s_j / sigma_j * cov(x_j, y), y = sum_k s_k x_k / sigma_k
+    coefficients = signs * inv_sigma
+    Y = X @ coefficients.T
+    cross = (W * Y.T) @ X
+    mean_y = np.einsum('sj,sj->s', mean, coefficients)[:, np.newaxis]
+    covariance = (cross - mean * mean_y) * ddof_scale
+    row_sums = np.where(varying, signs * inv_sigma * covariance, 1.0)
+
+    # Iki farkli satirli orneklerde tum korelasyonlar +-1'dir ve gercek bilgi
+    # icerigi 0'dir; yuvarlama artiklari negatif olmasin, toplam goreli olarak
+    # ihmal edilebilirse (CRITIC gibi) esit agirlik verilir
+    information = np.maximum(std_normalized * (n - row_sums), 0.0)
+    total = information.sum(axis=1, keepdims=True)
+    negligible = total <= 1e-12 * n * std_normalized.sum(axis=1, keepdims=True)
+    weights = np.divide(information, total, out=np.full_like(information, 1.0 / n),
+                        where=~negligible)
+    return weights
+
+
+def _standardize(X):
+    """Sutunlari ortalama 0, olcek 1 olacak sekilde kaydir (sabit sutunlar 0)"""
+    scale = X.std(axis=0)
+    return (X - X.mean(axis=0)) / np.where(scale == 0, 1.0, scale)
+
+
+def _bootstrap_block(decision_matrix, criteria_types, n_samples, seed_seq, chunk_size):
+    """
+    Tek bir blok icin bootstrap agirliklari
+
+    Surec havuzunda calisabilmesi icin modul seviyesinde tanimlidir.
+    """
+    rng = np.random.default_rng(seed_seq)
+    X = _standardize(decision_matrix)
+    m = X.shape[0]
+    is_benefit = benefit_mask(criteria_types)
+    order = np.argsort(X, axis=0)
+
+    weights = np.empty((n_samples, X.shape[1]))
+    for start in range(0, n_samples, chunk_size):
+        size = min(chunk_size, n_samples - start)
+        picks = rng.integers(0, m, size=(size, m))
+        flat = (picks + np.arange(size)[:, np.newaxis] * m).ravel()
+        counts = np.bincount(flat, minlength=size * m).reshape(size, m)
+        weights[start:start + size] = resampled_weights(X, is_benefit, counts, order)
+    return weights
+
+
+def _jackknife_block(decision_matrix, criteria_types, start, stop):
+    """Birakilan alternatifler [start, stop) icin jackknife agirliklari"""
+    X = _standardize(decision_matrix)
+    m = X.shape[0]
+    counts = np.ones((stop - start, m))
+    counts[np.arange(stop - start), np.arange(start, stop)] = 0
+    return resampled_weights(X, benefit_mask(criteria_types), counts)
+
+
+def rank_descending(weights):
+    """Her satirdaki agirliklarin sirasi (1 = en yuksek agirlik)"""
+    order = np.argsort(-weights, axis=-1, kind='stable')
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(1, weights.shape[-1] + 1), axis=-1)
+    return ranks
+
+
+class CriticBootstrap:
+    """
+    CRITIC agirliklari icin yeniden ornekleme ile guven araliklari
+
+    'bootstrap' alternatifleri iadeli olarak yeniden orneklenir; ornekler
+    sabit boyutlu bloklara ayrilir ve her blok SeedSequence'tan turetilen
+    kendi tohumunu kullandigi icin sonuc isci sayisindan bagimsizdir.
+    'jackknife' her alternatifi bir kez disarida birakir (m ornek, rastgelelik
+    yok); araliklar jackknife standart hatasiyla normal yaklasimdir.
+    """
+
+    def __init__(self, decision_matrix, criteria_types, method='bootstrap', seed=42):
+        """
+        Args:
+            decision_matrix: Karar matrisi (alternatifler x kriterler)
+            criteria_types: Kriter tipleri ('max' veya 'min')
+            method: 'bootstrap' veya 'jackknife'
+            seed: Tekrarlanabilirlik icin tohum (bootstrap)
+        """
+        self.decision_matrix = np.array(decision_matrix, dtype=float)
+        self.criteria_types = criteria_types
+        self.method = method
+        self.seed = seed
+        self.n_alternatives, self.n_criteria = self.decision_matrix.shape
+
+        if method not in RESAMPLING_METHODS:
+            raise ValueError(f"Bilinmeyen yeniden ornekleme yontemi: {method}")
+        if self.n_alternatives < 3:
+            raise ValueError('Yeniden ornekleme icin en az 3 alternatif gerekli')
+
+    def _jobs(self, n_samples, block_size, chunk_size):
+        if self.method == 'jackknife':
+            bounds = range(0, self.n_alternatives, block_size)
+            return _jackknife_block, [
+                (self.decision_matrix, self.criteria_types, start,
+                 min(start + block_size, self.n_alternatives))
+                for start in bounds
+            ]
+
+        block_sizes = [block_size] * (n_samples // block_size)
+        if n_samples % block_size:
+            block_sizes.append(n_samples % block_size)
+        seeds = np.random.SeedSequence(self.seed).spawn(len(block_sizes))
+        return _bootstrap_block, [
+            (self.decision_matrix, self.criteria_types, size, seed_seq, chunk_size)
+            for size, seed_seq in zip(block_sizes, seeds)
+        ]
+
+    def run(self, n_samples=10000, confidence=0.95, n_workers=None, block_size=1000, chunk_size=250):
+        """
+        Yeniden orneklemeyi calistir
+
+        Args:
+            n_samples: Bootstrap ornek sayisi (jackknife'ta alternatif sayisi kullanilir)
+            confidence: Guven duzeyi (orn. 0.95)
+            n_workers: Surec sayisi (None: CPU sayisi, 1: ayni surecte)
+            block_size: Bir iscinin tek seferde isledigi ornek sayisi
+            chunk_size: Blok icinde tek seferde hesaplanan ornek sayisi
+
+        Returns:
+            dict: Kriter basina guven araliklari ve agirlik sirasi kararliligi
+        """
+        if not 0 < confidence < 1:
+            raise ValueError('confidence 0 ile 1 arasinda olmali')
+        if self.method == 'bootstrap' and n_samples < 2:
+            raise ValueError('n_samples en az 2 olmali')
+
+        block, jobs = self._jobs(n_samples, block_size, chunk_size)
+
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+        n_workers = max(1, min(n_workers, len(jobs)))
+
+        if n_workers == 1:
+            blocks = [block(*job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                blocks = list(executor.map(block, *zip(*jobs)))
+        samples = np.concatenate(blocks)
+
+        # Tum alternatiflerle hesaplanan nokta tahmini
+        counts = np.ones((1, self.n_alternatives))
+        estimate = resampled_weights(_standardize(self.decision_matrix),
+                                     benefit_mask(self.criteria_types), counts)[0]
+
+        alpha = 1 - confidence
+        if self.method == 'bootstrap':
+            lower, upper = np.percentile(samples, [100 * alpha / 2, 100 * (1 - alpha / 2)], axis=0)
+            std_error = samples.std(axis=0, ddof=1)
+        else:
+            m = len(samples)
+            std_error = np.sqrt((m - 1) / m * ((samples - samples.mean(axis=0)) ** 2).sum(axis=0))
+            z = NormalDist().inv_cdf(1 - alpha / 2)
+            lower = np.clip(estimate - z * std_error, 0, 1)
+            upper = np.clip(estimate + z * std_error, 0, 1)
+
+        # Agirlik sirasi kararliligi: rank_probability[j, r] = P(kriter j, r+1. sirada)
+        n = self.n_criteria
+        ranks = rank_descending(samples)
+        flat = np.arange(n) * n + (ranks - 1)
+        rank_probability = np.bincount(flat.ravel(), minlength=n * n).reshape(n, n) / len(samples)
+        base_rank = rank_descending(estimate)
+        rank_lower, rank_upper = np.percentile(ranks, [100 * alpha / 2, 100 * (1 - alpha / 2)], axis=0)
+
+        return {
+            'method': self.method,
+            'n_samples': len(samples),
+            'seed': self.seed if self.method == 'bootstrap' else None,
+            'confidence': confidence,
+            'weights': estimate.tolist(),
+            'mean': samples.mean(axis=0).tolist(),
+            'std_error': std_error.tolist(),
+            'lower': lower.tolist(),
+            'upper': upper.tolist(),
+            'base_rank': base_rank.tolist(),
+            'rank_stability': rank_probability[np.arange(n), base_rank - 1].tolist(),
+            'mean_rank': (rank_probability @ np.arange(1, n + 1)).tolist(),
+            'rank_lower': np.floor(rank_lower).astype(int).tolist(),
+            'rank_upper': np.ceil(rank_upper).astype(int).tolist(),
+            'rank_probability': rank_probability.tolist()
+        }
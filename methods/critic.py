@@ -1,7 +1,14 @@
 import numpy as np
-import pandas as pd
 
+from .kernels import benefit_mask, blocked_correlation, minmax_normalize, pearson_correlation
+from .registry import DETAIL_LEVELS, WEIGHTING, register, run_steps
 
+# Bu kriter sayısından itibaren korelasyon karolara bölünerek hesaplanır
+BLOCKED_MIN_CRITERIA = 2048
+BLOCKED_TILE_SIZE = 1024
+
+
+@register('critic', WEIGHTING)
 class CRITIC:
     """
     CRITIC (Criteria Importance Through Intercriteria Correlation) Yöntemi
@@ -9,26 +16,51 @@ class CRITIC:
     Objektif ağırlıklandırma yöntemi - kriter ağırlıklarını veri tabanlı hesaplar.
     """
 
-    def __init__(self, decision_matrix, criteria_types):
+    def __init__(self, decision_matrix, criteria_types, vectorized=True,
+                 tile_size=None, n_workers=None):
         """
         Args:
             decision_matrix: numpy array (alternatifler x kriterler)
             criteria_types: list - her kriter için 'max' veya 'min'
+            vectorized: True ise vektörize motor, False ise eski döngü
+                        tabanlı hesaplama kullanılır (doğrulama için)
+            tile_size: Verilirse korelasyon bu genişlikte karolarla paralel
+                       hesaplanır (None: BLOCKED_MIN_CRITERIA ve üzerinde
+                       BLOCKED_TILE_SIZE)
+            n_workers: Karo hesaplaması için iş parçacığı sayısı (None: CPU sayısı)
         """
-        self.decision_matrix = np.array(decision_matrix, dtype=float)
+        # Zaten float64 dizi ise kopyalanmaz (hesaplamalar matrisi değiştirmez)
+        self.decision_matrix = np.asarray(decision_matrix, dtype=float)
         self.criteria_types = criteria_types
+        self.vectorized = vectorized
+        self.tile_size = tile_size
+        self.n_workers = n_workers
+        self.record_steps = True
+        self.materialize_correlation = True
         self.n_alternatives, self.n_criteria = self.decision_matrix.shape
 
         # Sonuçları sakla
         self.normalized_matrix = None
         self.std_devs = None
         self.correlation_matrix = None
+        self.conflict = None
         self.information_content = None
         self.weights = None
         self.steps = {}
+        self.timings = {}
+
+    def _record_step(self, name, values):
+        """Ara sonucu (detay seviyesi 'full' ise) steps sözlüğüne ekle"""
+        if self.record_steps:
+            self.steps[name] = values.tolist()
 
     def normalize(self):
         """Adım 1: Min-Max Normalizasyonu"""
+        if self.vectorized:
+            self.normalized_matrix = self._normalize_vectorized()
+            self._record_step('normalized_matrix', self.normalized_matrix)
+            return self.normalized_matrix
+
         self.normalized_matrix = np.zeros_like(self.decision_matrix)
 
         for j in range(self.n_criteria):
@@ -46,18 +78,42 @@ class CRITIC:
                     # Maliyet kriteri: küçük değer iyi
                     self.normalized_matrix[:, j] = (max_val - col) / (max_val - min_val)
 
-        self.steps['normalized_matrix'] = self.normalized_matrix.tolist()
+        self._record_step('normalized_matrix', self.normalized_matrix)
         return self.normalized_matrix
 
+    def _normalize_vectorized(self):
+        """Min-Max normalizasyonunun broadcast ile tek adımda hesaplanması"""
+        return minmax_normalize(self.decision_matrix, benefit_mask(self.criteria_types))
+
     def calculate_std_deviation(self):
         """Adım 2: Standart Sapma Hesaplama (Örneklem Standart Sapması)"""
         # Excel STDEV/STDEV.S ile uyumlu: ddof=1 (n-1 ile bölme)
         self.std_devs = np.std(self.normalized_matrix, axis=0, ddof=1)
-        self.steps['std_devs'] = self.std_devs.tolist()
+        self._record_step('std_devs', self.std_devs)
         return self.std_devs
 
     def calculate_correlation(self):
         """Adım 3: Korelasyon Matrisi Hesaplama"""
+        tile_size = self.tile_size
+        if tile_size is None and self.n_criteria >= BLOCKED_MIN_CRITERIA:
+            tile_size = BLOCKED_TILE_SIZE
+
+        if self.vectorized and tile_size:
+            # Karolu hesaplama; Σ(1 - r) satır toplamları karolarla birlikte
+            # biriktirilir, matris yalnızca gerekiyorsa oluşturulur
+            self.correlation_matrix, self.conflict = blocked_correlation(
+                self.normalized_matrix, tile_size, self.n_workers,
+                materialize=self.materialize_correlation
+            )
+            if self.correlation_matrix is not None:
+                self._record_step('correlation_matrix', self.correlation_matrix)
+            return self.correlation_matrix
+
+        if self.vectorized:
+            self.correlation_matrix = self._correlation_vectorized()
+            self._record_step('correlation_matrix', self.correlation_matrix)
+            return self.correlation_matrix
+
         n = self.n_criteria
         self.correlation_matrix = np.zeros((n, n))
 
@@ -81,19 +137,29 @@ class CRITIC:
                     else:
                         self.correlation_matrix[i, j] = numerator / denominator
 
-        self.steps['correlation_matrix'] = self.correlation_matrix.tolist()
+        self._record_step('correlation_matrix', self.correlation_matrix)
         return self.correlation_matrix
 
+    def _correlation_vectorized(self):
+        """Pearson korelasyon matrisinin birim sütunların matris çarpımı ile hesaplanması"""
+        # Payda sıfır ise (sabit sütun) korelasyon 0 kabul edilir
+        return pearson_correlation(self.normalized_matrix)
+
     def calculate_information_content(self):
         """Adım 4: Bilgi İçeriği (C) Hesaplama"""
         # Her kriter için: C_j = σ_j * Σ(1 - r_jk)
-        self.information_content = np.zeros(self.n_criteria)
+        if self.vectorized:
+            if self.conflict is None:
+                self.conflict = np.sum(1 - self.correlation_matrix, axis=1)
+            self.information_content = self.std_devs * self.conflict
+        else:
+            self.information_content = np.zeros(self.n_criteria)
 
-        for j in range(self.n_criteria):
-            conflict = np.sum(1 - self.correlation_matrix[j, :])
-            self.information_content[j] = self.std_devs[j] * conflict
+            for j in range(self.n_criteria):
+                conflict = np.sum(1 - self.correlation_matrix[j, :])
+                self.information_content[j] = self.std_devs[j] * conflict
 
-        self.steps['information_content'] = self.information_content.tolist()
+        self._record_step('information_content', self.information_content)
         return self.information_content
 
     def calculate_weights(self):
@@ -105,22 +171,42 @@ class CRITIC:
         else:
             self.weights = self.information_content / total
 
-        self.steps['weights'] = self.weights.tolist()
+        self._record_step('weights', self.weights)
         return self.weights
 
-    def run(self):
-        """Tüm adımları çalıştır"""
-        self.normalize()
-        self.calculate_std_deviation()
-        self.calculate_correlation()
-        self.calculate_information_content()
-        self.calculate_weights()
-
-        return {
-            'weights': self.weights.tolist(),
-            'normalized_matrix': self.normalized_matrix.tolist(),
+    def run(self, detail='full', progress=None):
+        """
+        Tüm adımları çalıştır
+
+        Args:
+            detail: 'weights-only' (yalnızca ağırlıklar), 'summary' (kriter
+                    bazlı vektörler ve korelasyon matrisi) veya 'full' (normalize
+                    matris ve adım adım sonuçlar dahil)
+            progress: Her adımdan sonra progress(adım_adı, oran) şeklinde
+                      çağrılır; istisna fırlatarak hesaplama durdurulabilir
+        """
+        if detail not in DETAIL_LEVELS:
+            raise ValueError(f"Geçersiz detay seviyesi: {detail}")
+        self.record_steps = detail == 'full'
+        # Yalnızca ağırlıklar isteniyorsa n x n korelasyon matrisi gerekmez
+        self.materialize_correlation = detail != 'weights-only'
+
+        steps = [self.normalize, self.calculate_std_deviation, self.calculate_correlation,
+                 self.calculate_information_content, self.calculate_weights]
+        self.timings = run_steps(steps, progress)
+
+        result = {'weights': self.weights.tolist()}
+        if detail == 'weights-only':
+            return result
+
+        result.update({
             'std_devs': self.std_devs.tolist(),
             'correlation_matrix': self.correlation_matrix.tolist(),
-            'information_content': self.information_content.tolist(),
-            'steps': self.steps
-        }
+            'information_content': self.information_content.tolist()
+        })
+        if detail == 'summary':
+            return result
+
+        result['normalized_matrix'] = self.normalized_matrix.tolist()
+        result['steps'] = self.steps
+        return result
@@ -0,0 +1,103 @@
+import numpy as np
+
+from .kernels import benefit_mask, rank
+from .registry import DETAIL_LEVELS, RANKING, register, run_steps
+
+
+@register('edas', RANKING)
+class EDAS:
+    """
+    EDAS (Evaluation based on Distance from Average Solution)
+    Ortalama Cozume Uzaklik Yontemi
+
+    Adimlar:
+    1. Ortalama cozum (AV) - her kriterin ortalamasi
+    2. Ortalamadan pozitif (PDA) ve negatif (NDA) uzakliklar
+    3. Agirlikli toplamlar (SP, SN) ve normalizasyonu (NSP, NSN)
+    4. Degerlendirme skoru AS = (NSP + NSN) / 2 ve siralama (buyuk AS daha iyi)
+    """
+
+    def __init__(self, decision_matrix, weights, criteria_types):
+        """
+        Args:
+            decision_matrix: Karar matrisi (numpy array)
+            weights: Kriter agirliklari (liste veya numpy array)
+            criteria_types: Kriter tipleri ('max' veya 'min')
+        """
+        self.decision_matrix = np.asarray(decision_matrix, dtype=float)
+        self.weights = np.array(weights, dtype=float)
+        self.criteria_types = criteria_types
+        self.n_alternatives, self.n_criteria = self.decision_matrix.shape
+        self.timings = {}
+
+    def calculate_average(self):
+        """1. Adim: Ortalama cozum"""
+        self.average = self.decision_matrix.mean(axis=0)
+        return self.average
+
+    def calculate_distances(self):
+        """2. Adim: PDA ve NDA (maliyet kriterlerinde yon ters cevrilir)"""
+        signs = np.where(benefit_mask(self.criteria_types), 1.0, -1.0)
+        # Ortalamasi sifir olan kriterler uzakliga katki yapmaz
+        safe_average = np.where(self.average == 0, 1.0, np.abs(self.average))
+        deviation = signs * (self.decision_matrix - self.average) / safe_average
+        deviation[:, self.average == 0] = 0
+
+        self.pda = np.maximum(deviation, 0)
+        self.nda = np.maximum(-deviation, 0)
+        return self.pda, self.nda
+
+    def calculate_weighted_sums(self):
+        """3. Adim: SP, SN ve normalize degerleri NSP, NSN"""
+        self.sp = self.pda @ self.weights
+        self.sn = self.nda @ self.weights
+
+        sp_max, sn_max = self.sp.max(), self.sn.max()
+        self.nsp = self.sp / sp_max if sp_max > 0 else np.zeros_like(self.sp)
+        self.nsn = 1 - self.sn / sn_max if sn_max > 0 else np.ones_like(self.sn)
+        return self.nsp, self.nsn
+
+    def calculate_scores(self):
+        """4. Adim: Degerlendirme skoru ve siralama"""
+        self.appraisal_score = (self.nsp + self.nsn) / 2
+        self.ranking = rank(self.appraisal_score)
+        return self.appraisal_score, self.ranking
+
+    def run(self, detail='full', progress=None):
+        """
+        Tum adimlari calistir ve sonuclari dondur
+
+        Args:
+            detail: 'weights-only' (skor, siralama ve kullanilan agirliklar),
+                    'summary' (ortalama cozum, SP/SN ve NSP/NSN dahil) veya
+                    'full' (PDA ve NDA matrisleri dahil)
+            progress: Her adimdan sonra progress(adim_adi, oran) seklinde cagrilir
+        """
+        if detail not in DETAIL_LEVELS:
+            raise ValueError(f"Gecersiz detay seviyesi: {detail}")
+
+        steps = [self.calculate_average, self.calculate_distances,
+                 self.calculate_weighted_sums, self.calculate_scores]
+        self.timings = run_steps(steps, progress)
+
+        result = {
+            'appraisal_score': self.appraisal_score.tolist(),
+            'ranking': self.ranking.tolist(),
+            'weights_used': self.weights.tolist()
+        }
+        if detail == 'weights-only':
+            return result
+
+        result.update({
+            'average': self.average.tolist(),
+            'sp': self.sp.tolist(),
+            'sn': self.sn.tolist(),
+            'nsp': self.nsp.tolist(),
+            'nsn': self.nsn.tolist()
+        })
+        if detail == 'summary':
+            return result
+
+        result['pda'] = self.pda.tolist()
+        result['nda'] = self.nda.tolist()
+        return result
@@ -0,0 +1,89 @@
+import numpy as np
+
+from .kernels import sum_normalize
+from .registry import DETAIL_LEVELS, WEIGHTING, register, run_steps
+
+
+@register('entropy', WEIGHTING)
+class Entropy:
+    """
+    Entropi Agirliklandirma Yontemi
+
+    Objektif agirliklandirma: alternatifler arasinda daha fazla farklilasan
+    (entropisi dusuk) kriterler daha yuksek agirlik alir. Kriter yonu
+    agirliklari etkilemez; ortak arayuz icin alinir.
+    """
+
+    def __init__(self, decision_matrix, criteria_types):
+        """
+        Args:
+            decision_matrix: Karar matrisi (alternatifler x kriterler), negatif olmayan
+            criteria_types: Kriter tipleri ('max' veya 'min')
+        """
+        self.decision_matrix = np.asarray(decision_matrix, dtype=float)
+        self.criteria_types = criteria_types
+        self.n_alternatives, self.n_criteria = self.decision_matrix.shape
+        self.timings = {}
+
+        if np.any(self.decision_matrix < 0):
+            raise ValueError('Entropi yontemi negatif olmayan degerler gerektirir')
+
+    def normalize(self):
+        """1. Adim: Toplam normalizasyonu (p_ij); tamami sifir sutunlar esit dagilim (1/m) sayilir"""
+        self.normalized_matrix = sum_normalize(self.decision_matrix)
+        # Bilgi tasimayan sutun e_j = 1, d_j = 0 almali (p = 0 iken e_j = 0 olurdu)
+        zero = self.decision_matrix.sum(axis=0) == 0
+        self.normalized_matrix[:, zero] = 1.0 / self.n_alternatives
+        return self.normalized_matrix
+
+    def calculate_entropy(self):
+        """2. Adim: Kriter entropileri e_j = -k * sum(p_ij * ln p_ij), k = 1 / ln(m)"""
+        P = self.normalized_matrix
+        # 0 * ln(0) = 0 kabul edilir
+        plogp = np.zeros_like(P)
+        positive = P > 0
+        plogp[positive] = P[positive] * np.log(P[positive])
+
+        k = 1.0 / np.log(self.n_alternatives) if self.n_alternatives > 1 else 0.0
+        self.entropy = -k * plogp.sum(axis=0)
+        return self.entropy
+
+    def calculate_weights(self):
+        """3. Adim: Farklilasma derecesi d_j = 1 - e_j ve agirliklar"""
+        self.divergence = 1 - self.entropy
+        total = np.sum(self.divergence)
+
+        if total == 0:
+            self.weights = np.ones(self.n_criteria) / self.n_criteria
+        else:
+            self.weights = self.divergence / total
+        return self.weights
+
+    def run(self, detail='full', progress=None):
+        """
+        Tum adimlari calistir
+
+        Args:
+            detail: 'weights-only' (yalnizca agirliklar), 'summary' (entropi ve
+                    farklilasma dahil) veya 'full' (normalize matris dahil)
+            progress: Her adimdan sonra progress(adim_adi, oran) seklinde cagrilir
+        """
+        if detail not in DETAIL_LEVELS:
+            raise ValueError(f"Gecersiz detay seviyesi: {detail}")
+
+        steps = [self.normalize, self.calculate_entropy, self.calculate_weights]
+        self.timings = run_steps(steps, progress)
+
+        result = {'weights': self.weights.tolist()}
+        if detail == 'weights-only':
+            return result
+
+        result.update({
+            'entropy': self.entropy.tolist(),
+            'divergence': self.divergence.tolist()
+        })
+        if detail == 'summary':
+            return result
+
+        result['normalized_matrix'] = self.normalized_matrix.tolist()
+        return result
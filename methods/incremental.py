@@ -0,0 +1,409 @@
+import numpy as np
+
+from .kernels import benefit_mask
+
+
+class IncrementalTOPSIS:
+    """
+    Alternatif ekleme/silme/guncelleme icin artimli TOPSIS modeli
+
+    Sutun kare toplamlari ile sutun min/max degerleri guncel tutulur; bir
+    satir degistiginde normalizasyon katsayilari ve ideal cozumler O(n)
+    maliyetle yenilenir. Silinen deger bir sutunun uc degeriyse yalnizca o
+    sutun yeniden taranir. Kare uzakliklar sutun katkilarinin toplami
+    olarak saklanir; bir duzenlemeden sonra yalnizca olcegi veya ideal
+    degeri degisen sutunlarin katkisi O(m) maliyetle cikarilip yeniden
+    eklenir, duzenlenen satirin uzakliklari O(n) ile bastan hesaplanir.
+    Kayan nokta birikimi resync_interval duzenlemede bir tam hesapla silinir.
+    """
+
+    def __init__(self, decision_matrix, weights, criteria_types, resync_interval=1000):
+        """
+        Args:
+            decision_matrix: Karar matrisi (alternatifler x kriterler)
+            weights: Kriter agirliklari
+            criteria_types: Kriter tipleri ('max' veya 'min')
+            resync_interval: Kayan nokta birikimine karsi kare toplamlarinin
+                             kac duzenlemede bir bastan hesaplanacagi
+        """
+        matrix = np.array(decision_matrix, dtype=float)
+        self.n_alternatives, self.n_criteria = matrix.shape
+        self.weights = np.array(weights, dtype=float)
+        self.criteria_types = criteria_types
+        self.is_benefit = benefit_mask(criteria_types)
+        self.resync_interval = resync_interval
+
+        # Sutun bazli islemler icin Fortran sirali, buyuyebilen depolama
+        capacity = max(16, self.n_alternatives * 2)
+        self._data = np.empty((capacity, self.n_criteria), order='F')
+        self._data[:self.n_alternatives] = matrix
+
+        self._d2_pos = np.empty(capacity)
+        self._d2_neg = np.empty(capacity)
+        self._edits = 0
+
+        self.ranking = None
+        self._rescan_all()
+        self._recompute()
+
+    # ========== DURUM ==========
+
+    @property
+    def decision_matrix(self):
+        """Guncel karar matrisi (kopyasiz gorunum)"""
+        return self._data[:self.n_alternatives]
+
+    def _rescan_all(self):
+        """Kare toplamlari ve min/max degerlerini bastan hesapla"""
+        X = self.decision_matrix
+        self.sum_squares = np.sum(X ** 2, axis=0)
+        if self.n_alternatives:
+            self.col_min = X.min(axis=0)
+            self.col_max = X.max(axis=0)
+        else:
+            self.col_min = np.full(self.n_criteria, np.inf)
+            self.col_max = np.full(self.n_criteria, -np.inf)
+        self._edits = 0
+
+    def _rescan_column(self, j):
+        """Uc degeri silinen sutunu yeniden tara"""
+        col = self._data[:self.n_alternatives, j]
+        if col.size:
+            self.col_min[j] = col.min()
+            self.col_max[j] = col.max()
+        else:
+            self.col_min[j] = np.inf
+            self.col_max[j] = -np.inf
+
+    def _grow(self):
+        """Kapasiteyi iki katina cikar"""
+        m = self.n_alternatives
+        capacity = self._data.shape[0] * 2
+        data = np.empty((capacity, self.n_criteria), order='F')
+        data[:m] = self.decision_matrix
+        self._data = data
+        for name in ('_d2_pos', '_d2_neg'):
+            grown = np.empty(capacity)
+            grown[:m] = getattr(self, name)[:m]
+            setattr(self, name, grown)
+
+    def _remove_values(self, old):
+        """Bir satirin degerlerini biriktiricilerden cikar"""
+        self.sum_squares -= old ** 2
+        return np.flatnonzero((old <= self.col_min) | (old >= self.col_max))
+
+    def _after_edit(self, stale_columns, edited_rows=()):
+        """Biriktiricileri duzelt ve sonuclari guncelle; onceki siralamayi dondur"""
+        self._edits += 1
+        if self._edits >= self.resync_interval:
+            self._rescan_all()
+            return self._recompute()
+        np.maximum(self.sum_squares, 0, out=self.sum_squares)
+        for j in stale_columns:
+            self._rescan_column(j)
+        return self._update(edited_rows)
+
+    # ========== HESAPLAMA ==========
+
+    def _refresh_factors(self):
+        """Normalizasyon katsayilari, sutun olcekleri ve ideal cozumler (O(n))"""
+        norm_factors = np.sqrt(self.sum_squares)
+        norm_factors[norm_factors == 0] = 1
+        self.norm_factors = norm_factors
+
+        # Agirlikli normalize deger = x * w / s; uc degerler olcekle birlikte tasinir
+        self.scale = self.weights / norm_factors
+        high = np.maximum(self.col_max * self.scale, self.col_min * self.scale)
+        low = np.minimum(self.col_max * self.scale, self.col_min * self.scale)
+        self.ideal_positive = np.where(self.is_benefit, high, low)
+        self.ideal_negative = np.where(self.is_benefit, low, high)
+
+    def _add_column(self, j, sign, scale, ideal_positive, ideal_negative, column, diff):
+        """j sutununun kare uzaklik katkisini ekle (sign=1) veya cikar (sign=-1)"""
+        m = self.n_alternatives
+        accumulate = np.add if sign > 0 else np.subtract
+        np.multiply(self._data[:m, j], scale, out=column)
+        for d2, ideal in ((self._d2_pos[:m], ideal_positive), (self._d2_neg[:m], ideal_negative)):
+            np.subtract(column, ideal, out=diff)
+            diff *= diff
+            accumulate(d2, diff, out=d2)
+
+    def _recompute(self):
+        """Normalizasyon, ideal cozumler, uzakliklar ve yakinlik katsayilari (tam hesap)"""
+        m = self.n_alternatives
+        self._refresh_factors()
+        self._d2_pos[:m] = 0
+        self._d2_neg[:m] = 0
+        column = np.empty(m)
+        diff = np.empty(m)
+        for j in range(self.n_criteria):
+            self._add_column(j, 1, self.scale[j], self.ideal_positive[j],
+                             self.ideal_negative[j], column, diff)
+        return self._finish()
+
+    def _update(self, edited_rows):
+        """
+        Yalnizca olcegi veya ideal degeri degisen sutunlarin katkisini yenile
+
+        Args:
+            edited_rows: Degerleri degisen (veya yeni) satirlar; uzakliklari
+                         sutun katkilarindan degil bastan hesaplanir
+        """
+        m = self.n_alternatives
+        old = (self.scale, self.ideal_positive, self.ideal_negative)
+        self._refresh_factors()
+        new = (self.scale, self.ideal_positive, self.ideal_negative)
+        changed = np.flatnonzero((old[0] != new[0]) | (old[1] != new[1]) | (old[2] != new[2]))
+
+        column = np.empty(m)
+        diff = np.empty(m)
+        for j in changed:
+            self._add_column(j, -1, *(values[j] for values in old), column, diff)
+            self._add_column(j, 1, *(values[j] for values in new), column, diff)
+        np.maximum(self._d2_pos[:m], 0, out=self._d2_pos[:m])
+        np.maximum(self._d2_neg[:m], 0, out=self._d2_neg[:m])
+
+        for i in edited_rows:
+            weighted = self._data[i] * self.scale
+            self._d2_pos[i] = np.sum((weighted - self.ideal_positive) ** 2)
+            self._d2_neg[i] = np.sum((weighted - self.ideal_negative) ** 2)
+        return self._finish()
+
+    def _finish(self):
+        """Kare uzakliklardan yakinlik katsayilari ve siralama; onceki siralamayi dondur"""
+        m = self.n_alternatives
+        d2_pos = self._d2_pos[:m]
+        d2_neg = self._d2_neg[:m]
+        self.distance_positive = np.sqrt(d2_pos)
+        self.distance_negative = np.sqrt(d2_neg)
+
+        denominator = self.distance_positive + self.distance_negative
+        denominator[denominator == 0] = 1
+        self.closeness = self.distance_negative / denominator
+
+        previous = self.ranking
+        order = np.argsort(-self.closeness)
+        self.ranking = np.empty(m, dtype=int)
+        self.ranking[order] = np.arange(1, m + 1)
+        return previous
+
+    @staticmethod
+    def _moved(previous, current):
+        """Sirasi degisen alternatiflerin indeksleri"""
+        return np.flatnonzero(previous != current)
+
+    # ========== DUZENLEMELER ==========
+
+    def _check_row(self, row):
+        row = np.asarray(row, dtype=float)
+        if row.shape != (self.n_criteria,):
+            raise ValueError('Satir uzunlugu kriter sayisina esit olmali')
+        return row
+
+    def add_alternative(self, row):
+        """
+        Sona yeni alternatif ekle
+
+        Returns:
+            numpy array: Sirasi degisen alternatiflerin indeksleri (yeni satir dahil)
+        """
+        row = self._check_row(row)
+        if self.n_alternatives == self._data.shape[0]:
+            self._grow()
+
+        i = self.n_alternatives
+        self._data[i] = row
+        self._d2_pos[i] = self._d2_neg[i] = 0
+        self.n_alternatives += 1
+        self.sum_squares += row ** 2
+        np.minimum(self.col_min, row, out=self.col_min)
+        np.maximum(self.col_max, row, out=self.col_max)
+
+        previous = self._after_edit([], [i])
+        previous = np.append(previous, 0)
+        return self._moved(previous, self.ranking)
+
+    def remove_alternative(self, index):
+        """
+        Alternatifi sil (sonraki satirlarin indeksi bir azalir)
+
+        Returns:
+            numpy array: Sirasi degisen alternatiflerin yeni indeksleri
+        """
+        m = self.n_alternatives
+        if not 0 <= index < m:
+            raise IndexError('Alternatif indeksi gecersiz')
+
+        old = self._data[index].copy()
+        stale = self._remove_values(old)
+        self._data[index:m - 1] = self._data[index + 1:m].copy()
+        self._d2_pos[index:m - 1] = self._d2_pos[index + 1:m].copy()
+        self._d2_neg[index:m - 1] = self._d2_neg[index + 1:m].copy()
+        self.n_alternatives -= 1
+
+        previous = self._after_edit(stale)
+        previous = np.delete(previous, index)
+        return self._moved(previous, self.ranking)
+
+    def update_alternative(self, index, row):
+        """
+        Alternatifin degerlerini guncelle
+
+        Returns:
+            numpy array: Sirasi degisen alternatiflerin indeksleri
+        """
+        if not 0 <= index < self.n_alternatives:
+            raise IndexError('Alternatif indeksi gecersiz')
+
+        row = self._check_row(row)
+        old = self._data[index].copy()
+        stale = self._remove_values(old)
+        self._data[index] = row
+        self.sum_squares += row ** 2
+        np.minimum(self.col_min, row, out=self.col_min)
+        np.maximum(self.col_max, row, out=self.col_max)
+
+        return self._moved(self._after_edit(stale, [index]), self.ranking)
+
+    def set_weights(self, weights):
+        """Agirliklari degistir (biriktiriciler degismez)"""
+        self.weights = np.array(weights, dtype=float)
+        return self._moved(self._recompute(), self.ranking)
+
+    def result(self, detail='full'):
+        """
+        Sonuclari TOPSIS.run ile ayni alanlarla, listeye cevirmeden dondur
+
+        Args:
+            detail: 'weights-only', 'summary' veya 'full' (TOPSIS.run ile ayni)
+
+        Returns:
+            dict: alan adi -> numpy array
+        """
+        result = {
+            'closeness': self.closeness,
+            'ranking': self.ranking,
+            'weights_used': self.weights
+        }
+        if detail == 'weights-only':
+            return result
+        result.update({
+            'ideal_positive': self.ideal_positive,
+            'ideal_negative': self.ideal_negative,
+            'distance_positive': self.distance_positive,
+            'distance_negative': self.distance_negative
+        })
+        if detail == 'summary':
+            return result
+        normalized = self.decision_matrix / self.norm_factors
+        result['normalized_matrix'] = normalized
+        result['weighted_matrix'] = normalized * self.weights
+        return result
+
+
+class OnlineCRITIC:
+    """
+    Parca parca gelen veriler icin cevrimici (online) CRITIC
+
+    Her kriter icin sayac, min, max, ortalama ve capraz moment matrisi
+    (Welford/Chan birlestirme formulleri) tutulur; karar matrisinin tamami
+    bellekte saklanmaz. Min-max normalizasyonu her sutun icin dogrusal bir
+    donusum oldugundan (maliyet kriterinde isaret degisir), normalize
+    matrisin standart sapmasi ve korelasyonlari ham momentlerden turetilir:
+
+        σ_j = s_j / (max_j - min_j),   r_jk = ±corr(x_j, x_k)
+
+    Ayri parcalar uzerinde olusturulan biriktiriciler merge ile birlestirilebilir.
+    """
+
+    def __init__(self, criteria_types, dtype=np.float64):
+        """
+        Args:
+            criteria_types: list - her kriter için 'max' veya 'min'
+            dtype: Parça hesaplamalarının veri tipi (float32 veya float64);
+                   biriktiriciler her zaman float64 tutulur
+        """
+        self.criteria_types = criteria_types
+        self.dtype = np.dtype(dtype)
+        self.n_criteria = len(criteria_types)
+        self.count = 0
+        self.mean = np.zeros(self.n_criteria)
+        self.comoment = np.zeros((self.n_criteria, self.n_criteria))
+        self.col_min = np.full(self.n_criteria, np.inf)
+        self.col_max = np.full(self.n_criteria, -np.inf)
+
+    def _combine(self, count, mean, comoment, col_min, col_max):
+        """Baska bir biriktiricinin momentlerini bu biriktiriciye ekle (Chan)"""
+        if count == 0:
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.comoment += comoment + np.outer(delta, delta) * (self.count * count / total)
+        self.mean += delta * (count / total)
+        self.count = total
+        np.minimum(self.col_min, col_min, out=self.col_min)
+        np.maximum(self.col_max, col_max, out=self.col_max)
+
+    def update(self, batch):
+        """
+        Yeni alternatif satirlarini ekle
+
+        Args:
+            batch: k x n dizi (tek satir icin n uzunlugunda dizi de olur)
+        """
+        batch = np.atleast_2d(np.asarray(batch, dtype=self.dtype))
+        if batch.shape[1] != self.n_criteria:
+            raise ValueError('Satir uzunlugu kriter sayisina esit olmali')
+        if batch.shape[0] == 0:
+            return self
+
+        batch_mean = batch.mean(axis=0)
+        centered = batch - batch_mean
+        self._combine(batch.shape[0], batch_mean, centered.T @ centered,
+                      batch.min(axis=0), batch.max(axis=0))
+        return self
+
+    def merge(self, other):
+        """Baska bir parcanin biriktiricisini birlestir"""
+        if other.criteria_types != self.criteria_types:
+            raise ValueError('Kriter tipleri ayni olmali')
+        self._combine(other.count, other.mean, other.comoment, other.col_min, other.col_max)
+        return self
+
+    def run(self):
+        """Mevcut biriktiricilerden CRITIC agirliklarini hesapla"""
+        if self.count < 2:
+            raise ValueError('En az 2 alternatif gerekli')
+
+        ranges = self.col_max - self.col_min
+        constant = ranges == 0
+        safe_ranges = np.where(constant, 1.0, ranges)
+
+        # Normalize matrisin ornek standart sapmasi (ddof=1)
+        raw_var = np.maximum(np.diag(self.comoment), 0)
+        std_devs = np.sqrt(raw_var / (self.count - 1)) / safe_ranges
+        std_devs[constant] = 0
+
+        # Korelasyon: maliyet kriterlerinde normalizasyon isareti tersine cevirir
+        signs = np.where(benefit_mask(self.criteria_types), 1.0, -1.0)
+        denominator = np.sqrt(np.outer(raw_var, raw_var))
+        zero = (denominator == 0) | constant[:, np.newaxis] | constant[np.newaxis, :]
+        correlation = np.divide(self.comoment, denominator,
+                                out=np.zeros_like(self.comoment), where=~zero)
+        correlation *= np.outer(signs, signs)
+        np.fill_diagonal(correlation, 1.0)
+
+        information_content = std_devs * np.sum(1 - correlation, axis=1)
+        total = np.sum(information_content)
+        if total == 0:
+            weights = np.ones(self.n_criteria) / self.n_criteria
+        else:
+            weights = information_content / total
+
+        return {
+            'weights': weights.tolist(),
+            'std_devs': std_devs.tolist(),
+            'correlation_matrix': correlation.tolist(),
+            'information_content': information_content.tolist(),
+            'n_alternatives': self.count
+        }
@@ -0,0 +1,211 @@
+"""
+Yontemler arasinda paylasilan vektorize hesaplama cekirdekleri
+
+Tum fonksiyonlar alternatifler x kriterler bicimindeki float64 matrislerle
+calisir ve sutun bazli islemleri broadcast ile tek adimda yapar. Sutunlari
+son eksende tutan normalizasyon ve korelasyon cekirdekleri s x m x n
+senaryo yiginlarini da kabul eder.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+
+def benefit_mask(criteria_types):
+    """Kriter tiplerini ('max'/'min') fayda maskesine cevir (True: fayda)"""
+    return np.array([t == 'max' for t in criteria_types], dtype=bool)
+
+
+def vector_normalize(X):
+    """Vektor normalizasyonu: x_ij / sqrt(sum_i x_ij^2) (sifir sutunlar degismez)"""
+    norm_factors = np.sqrt(np.sum(X ** 2, axis=0))
+    norm_factors[norm_factors == 0] = 1
+    return X / norm_factors
+
+
+def minmax_normalize(X, is_benefit):
+    """
+    Min-Max normalizasyonu, yon dahil
+
+    Fayda kriterlerinde (x - min) / (max - min), maliyet kriterlerinde
+    (max - x) / (max - min). Sabit sutunlar (aralik = 0) 0 olur. X, m x n
+    matris veya s x m x n senaryo yigini olabilir (sutunlar son eksende).
+    """
+    min_vals = X.min(axis=-2, keepdims=True)
+    max_vals = X.max(axis=-2, keepdims=True)
+    ranges = max_vals - min_vals
+
+    constant = ranges == 0
+    safe_ranges = np.where(constant, 1.0, ranges)
+
+    normalized = np.where(
+        is_benefit,
+        (X - min_vals) / safe_ranges,
+        (max_vals - X) / safe_ranges
+    )
+    if constant.any():
+        normalized = np.where(constant, 0.0, normalized)
+    return normalized
+
+
+def sum_normalize(X):
+    """Toplam normalizasyonu: x_ij / sum_i x_ij (toplami sifir sutunlar degismez)"""
+    totals = X.sum(axis=0)
+    totals = np.where(totals == 0, 1.0, totals)
+    return X / totals
+
+
+def ideal_solutions(X, is_benefit):
+    """
+    Sutun bazli ideal (en iyi) ve negatif-ideal (en kotu) degerler
+
+    Returns:
+        tuple: (ideal, negatif-ideal) vektorleri
+    """
+    col_max = X.max(axis=0)
+    col_min = X.min(axis=0)
+    return np.where(is_benefit, col_max, col_min), np.where(is_benefit, col_min, col_max)
+
+
+def euclidean_distance(X, point):
+    """Her satirin verilen noktaya Oklid uzakligi"""
+    return np.sqrt(np.sum((X - point) ** 2, axis=1))
+
+
+def manhattan_distance(X, point):
+    """Her satirin verilen noktaya Manhattan (L1) uzakligi"""
+    return np.sum(np.abs(X - point), axis=1)
+
+
+def rank(scores, descending=True):
+    """
+    Skorlari 1'den baslayan siralara cevir (1 = en iyi)
+
+    Args:
+        scores: Alternatif skorlari
+        descending: True ise buyuk skor daha iyi (TOPSIS), False ise kucuk (VIKOR)
+    """
+    order = np.argsort(-scores) if descending else np.argsort(scores)
+    ranking = np.empty(len(scores), dtype=int)
+    ranking[order] = np.arange(1, len(scores) + 1)
+    return ranking
+
+
+def top_k(scores, k, descending=True):
+    """
+    En iyi k alternatifin indeksleri (en iyiden baslayarak)
+
+    Tam siralama yerine argpartition kullanilir: O(m + k log k).
+
+    Args:
+        scores: Alternatif skorlari
+        k: Istenen alternatif sayisi (m'den buyukse m)
+        descending: True ise buyuk skor daha iyi
+    """
+    k = min(int(k), len(scores))
+    if k < 1:
+        raise ValueError('k en az 1 olmali')
+    keys = -scores if descending else scores
+    if k < len(scores):
+        candidates = np.argpartition(keys, k - 1)[:k]
+    else:
+        candidates = np.arange(len(scores))
+    return candidates[np.argsort(keys[candidates], kind='stable')]
+
+
+def _unit_columns(Z):
+    """Sutunlari merkezle ve birim uzunluga olcekle (sabit sutunlar 0 kalir)"""
+    U = Z - Z.mean(axis=-2, keepdims=True)
+    norms = np.sqrt(np.einsum('...ij,...ij->...j', U, U))
+    scale = np.divide(1.0, norms, out=np.zeros_like(norms), where=norms != 0)
+    U *= scale[..., np.newaxis, :]
+    return U, norms != 0
+
+
+def pearson_correlation(Z):
+    """
+    Sutunlar arasi Pearson korelasyon matrisi
+
+    Z, m x n matris veya s x m x n yigin olabilir (sonuc n x n veya s x n x n).
+    Sabit sutunlarin korelasyonu 0, kosegen 1'dir.
+    """
+    U, _ = _unit_columns(Z)
+    correlation = np.matmul(np.swapaxes(U, -1, -2), U)
+    diagonal = np.arange(Z.shape[-1])
+    correlation[..., diagonal, diagonal] = 1.0
+    return correlation
+
+
+def correlation_conflict(Z):
+    """
+    Catisma toplamlari sum_k (1 - r_jk), korelasyon matrisi olusturulmadan
+
+    Birim sutunlar U icin sum_k r_jk = U_j . (sum_k U_k) - |U_j|^2 + 1 oldugundan
+    islem O(m n) bellek ve zamanla yapilir (n x n yerine). Sonuc
+    pearson_correlation ile hesaplanan satir toplamlariyla ayni (yuvarlama
+    farki ~1e-12); yigin (s x m x n) girdilerde s x n dondurur.
+    """
+    U, varying = _unit_columns(Z)
+    total = U.sum(axis=-1, keepdims=True)
+    row_sums = np.einsum('...ij,...ij->...j', U, total) - varying + 1.0
+    return Z.shape[-1] - row_sums
+
+
+def _tile_pairs(n, tile_size):
+    """Ust ucgen karo ciftleri (i <= j) icin sutun dilimleri"""
+    bounds = [(start, min(start + tile_size, n)) for start in range(0, n, tile_size)]
+    return [(bounds[a], bounds[b]) for a in range(len(bounds)) for b in range(a, len(bounds))]
+
+
+def blocked_correlation(Z, tile_size=1024, n_workers=None, materialize=True):
+    """
+    Pearson korelasyonu, kriterler karolara bolunerek is parcacigi havuzunda
+
+    Sutunlar bir kez merkezlenip birim uzunluga olceklenir; her (i, j) karosu
+    U_i^T U_j matris carpimidir (numpy GIL'i birakir). Simetri nedeniyle
+    yalnizca ust ucgen karolar hesaplanir. Her satirin catisma toplami
+    sum_k (1 - r_jk) karolar hesaplanirken biriktirilir, boylece n x n matrisin
+    olusturulmasi istege baglidir. Sabit sutunlarin korelasyonu 0, kosegen 1'dir.
+
+    Args:
+        Z: m x n matris (orn. normalize karar matrisi)
+        tile_size: Karo genisligi (kriter sayisi)
+        n_workers: Is parcacigi sayisi (None: CPU sayisi)
+        materialize: False ise korelasyon matrisi olusturulmaz
+
+    Returns:
+        tuple: (korelasyon matrisi veya None, catisma vektoru)
+    """
+    n = Z.shape[1]
+    # Kriterler satirlarda (n x m, C sirali): karo dilimleri bitisik bellekte
+    U = np.array(Z.T, dtype=np.float64, order='C')
+    U -= U.mean(axis=1, keepdims=True)
+    norms = np.sqrt(np.einsum('ij,ij->i', U, U))
+    scale = np.divide(1.0, norms, out=np.zeros_like(norms), where=norms != 0)
+    U *= scale[:, np.newaxis]
+
+    correlation = np.empty((n, n)) if materialize else None
+
+    def compute(pair):
+        (i0, i1), (j0, j1) = pair
+        tile = U[i0:i1] @ U[j0:j1].T
+        if i0 == j0:
+            np.fill_diagonal(tile, 1.0)
+        if correlation is not None:
+            correlation[i0:i1, j0:j1] = tile
+            if i0 != j0:
+                correlation[j0:j1, i0:i1] = tile.T
+        row_sums = tile.sum(axis=1)
+        col_sums = tile.sum(axis=0) if i0 != j0 else None
+        return pair, row_sums, col_sums
+
+    pairs = _tile_pairs(n, tile_size)
+    totals = np.zeros(n)
+    with ThreadPoolExecutor(max_workers=n_workers or os.cpu_count() or 1) as pool:
+        for ((i0, i1), (j0, j1)), row_sums, col_sums in pool.map(compute, pairs):
+            totals[i0:i1] += row_sums
+            if col_sums is not None:
+                totals[j0:j1] += col_sums
+
+    return correlation, n - totals
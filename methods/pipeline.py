@@ -0,0 +1,58 @@
+import numpy as np
+
+from .critic import CRITIC
+from .registry import DETAIL_LEVELS
+from .topsis import TOPSIS
+
+
+class CriticTopsis:
+    """
+    CRITIC agirliklari ile TOPSIS siralamasi (tek adimda)
+
+    Karar matrisi bir kez float64 diziye cevrilir ve her iki yontem ayni
+    diziyi kopyalamadan kullanir; CRITIC agirliklari TOPSIS'e listeye
+    cevrilmeden aktarilir. Sonuclar iki yontemin ayri ayri calistirilmasiyla
+    birebir aynidir.
+    """
+
+    def __init__(self, decision_matrix, criteria_types):
+        """
+        Args:
+            decision_matrix: Karar matrisi (alternatifler x kriterler)
+            criteria_types: Kriter tipleri ('max' veya 'min')
+        """
+        self.decision_matrix = np.asarray(decision_matrix, dtype=float)
+        self.criteria_types = criteria_types
+        self.critic = CRITIC(self.decision_matrix, criteria_types)
+        self.topsis = None
+        self.timings = {}
+
+    def run(self, detail='full', progress=None):
+        """
+        CRITIC ve ardindan TOPSIS'i calistir
+
+        Args:
+            detail: Her iki yontem icin detay seviyesi ('weights-only', 'summary', 'full')
+            progress: Istege bagli progress(adim, oran) geri cagirimi; CRITIC
+                      adimlari 0-0.5, TOPSIS adimlari 0.5-1 araligina dusurulur
+
+        Returns:
+            dict: 'critic' (CRITIC.run ciktisi) ve 'topsis' (TOPSIS.run ciktisi)
+        """
+        if detail not in DETAIL_LEVELS:
+            raise ValueError(f"Gecersiz detay seviyesi: {detail}")
+
+        def scaled(offset):
+            if progress is None:
+                return None
+            return lambda step, fraction: progress(step, offset + 0.5 * fraction)
+
+        critic_result = self.critic.run(detail, scaled(0.0))
+        self.topsis = TOPSIS(self.decision_matrix, self.critic.weights, self.criteria_types)
+        topsis_result = self.topsis.run(detail, scaled(0.5))
+        self.timings = {'critic': self.critic.timings, 'topsis': self.topsis.timings}
+
+        return {
+            'critic': critic_result,
+            'topsis': topsis_result
+        }
@@ -0,0 +1,81 @@
+"""
+Cok kriterli karar verme yontemleri kaydi
+
+Her yontem ortak bir arayuz saglar:
+    - 'weighting' yontemleri: Yontem(decision_matrix, criteria_types, **params)
+    - 'ranking' yontemleri:   Yontem(decision_matrix, weights, criteria_types, **params)
+    - params: istemcinin ayarlayabilecegi ek parametrelerin adlari (orn. VIKOR icin v)
+    - run(detail='full', progress=None) -> JSON'a cevrilebilir sozluk
+    - timings: run sonrasi adim bazli sureler (saniye)
+"""
+import time
+
+DETAIL_LEVELS = ('weights-only', 'summary', 'full')
+
+WEIGHTING, RANKING = 'weighting', 'ranking'
+
+METHODS = {}
+
+
+def register(name, kind, params=()):
+    """Sinifi verilen adla kaydeden dekorator (params: istemciye acik ek parametreler)"""
+    if kind not in (WEIGHTING, RANKING):
+        raise ValueError(f"Gecersiz yontem turu: {kind}")
+
+    def decorator(cls):
+        cls.method_name = name
+        cls.method_kind = kind
+        cls.method_params = tuple(params)
+        METHODS[name] = cls
+        return cls
+    return decorator
+
+
+def get_method(name):
+    """Kayitli yontem sinifini dondur, yoksa None"""
+    return METHODS.get(name)
+
+
+def available_methods():
+    """Kayitli yontemlerin adlari ve turleri"""
+    return {name: cls.method_kind for name, cls in sorted(METHODS.items())}
+
+
+def create(name, decision_matrix, criteria_types, weights=None, **params):
+    """
+    Kayitli yontemi ortak argumanlarla olustur
+
+    Args:
+        name: Yontem adi ('critic', 'topsis', 'entropy', ...)
+        weights: Siralama yontemleri icin kriter agirliklari
+        params: Yonteme ozgu ek parametreler (orn. VIKOR icin v)
+    """
+    cls = get_method(name)
+    if cls is None:
+        raise ValueError(f"Bilinmeyen yontem: {name}")
+    if cls.method_kind == RANKING:
+        if weights is None:
+            raise ValueError(f"{name} yontemi agirlik gerektirir")
+        return cls(decision_matrix, weights, criteria_types, **params)
+    return cls(decision_matrix, criteria_types, **params)
+
+
+def run_steps(steps, progress=None):
+    """
+    Adimlari sirayla calistir ve her adimin suresini olc
+
+    Args:
+        steps: Argumansiz cagrilacak adim metodlari
+        progress: Her adimdan sonra progress(adim_adi, oran) seklinde cagrilir
+
+    Returns:
+        dict: adim adi -> sure (saniye)
+    """
+    timings = {}
+    for i, step in enumerate(steps, 1):
+        start = time.perf_counter()
+        step()
+        timings[step.__name__] = time.perf_counter() - start
+        if progress:
+            progress(step.__name__, i / len(steps))
+    return timings
@@ -0,0 +1,157 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .topsis import TOPSIS
+
+
+def _simulate_block(decision_matrix, base_weights, criteria_types, method,
+                    concentration, perturbation, n_samples, seed_seq, chunk_size):
+    """
+    Tek bir blok icin agirlik orneklemesi ve TOPSIS degerlendirmesi
+
+    Surec havuzunda calisabilmesi icin modul seviyesinde tanimlidir.
+    Blok sonucu alternatif x sira sayac matrisi ve agirlik toplamidir.
+    """
+    rng = np.random.default_rng(seed_seq)
+    weights = sample_weights(base_weights, n_samples, rng, method,
+                             concentration, perturbation)
+
+    topsis = TOPSIS(decision_matrix, base_weights, criteria_types)
+    ranking = topsis.run_batch(weights, chunk_size=chunk_size)['ranking']
+
+    # Sira sayaclari: rank_counts[i, r] = alternatif i'nin r+1. oldugu ornek sayisi
+    m = topsis.n_alternatives
+    flat = np.arange(m) * m + (ranking - 1)
+    rank_counts = np.bincount(flat.ravel(), minlength=m * m).reshape(m, m)
+
+    return rank_counts, weights.sum(axis=0)
+
+
+def sample_weights(base_weights, n_samples, rng, method='dirichlet',
+                   concentration=100.0, perturbation=0.1):
+    """
+    Temel agirliklar etrafinda rastgele agirlik vektorleri uret
+
+    Args:
+        base_weights: Temel agirlik vektoru (orn. CRITIC agirliklari)
+        n_samples: Uretilecek vektor sayisi
+        rng: numpy Generator
+        method: 'dirichlet' (ortalamasi temel agirliklar olan Dirichlet) veya
+                'uniform' (her kritere +-perturbation oraninda bozulma)
+        concentration: Dirichlet yogunluk parametresi (buyudukce dagilim daralir)
+        perturbation: 'uniform' yontemi icin goreli bozulma orani
+
+    Returns:
+        numpy array: n_samples x n, her satirin toplami 1
+    """
+    base_weights = np.asarray(base_weights, dtype=float)
+    base_weights = base_weights / base_weights.sum()
+
+    if method == 'dirichlet':
+        alpha = np.maximum(base_weights * concentration, 1e-6)
+        return rng.dirichlet(alpha, size=n_samples)
+
+    if method == 'uniform':
+        factors = 1 + rng.uniform(-perturbation, perturbation,
+                                  size=(n_samples, base_weights.size))
+        weights = base_weights * np.clip(factors, 0, None)
+        totals = weights.sum(axis=1, keepdims=True)
+        totals[totals == 0] = 1
+        return weights / totals
+
+    raise ValueError(f"Bilinmeyen ornekleme yontemi: {method}")
+
+
+class WeightSensitivity:
+    """
+    TOPSIS siralamalari icin Monte Carlo agirlik duyarlilik analizi
+
+    Agirliklar temel agirliklar (orn. CRITIC) etrafinda orneklenir ve her
+    ornek TOPSIS.run_batch ile vektorize olarak degerlendirilir. Ornekler
+    sabit boyutlu bloklara ayrilir; her blok SeedSequence'tan turetilen
+    kendi tohumunu kullandigi icin sonuc isci sayisindan bagimsizdir.
+    """
+
+    def __init__(self, decision_matrix, weights, criteria_types,
+                 method='dirichlet', concentration=100.0, perturbation=0.1, seed=42):
+        """
+        Args:
+            decision_matrix: Karar matrisi (alternatifler x kriterler)
+            weights: Temel kriter agirliklari
+            criteria_types: Kriter tipleri ('max' veya 'min')
+            method: 'dirichlet' veya 'uniform'
+            concentration: Dirichlet yogunluk parametresi
+            perturbation: 'uniform' icin goreli bozulma orani
+            seed: Tekrarlanabilirlik icin tohum
+        """
+        self.decision_matrix = np.array(decision_matrix, dtype=float)
+        self.weights = np.array(weights, dtype=float)
+        self.criteria_types = criteria_types
+        self.method = method
+        self.concentration = concentration
+        self.perturbation = perturbation
+        self.seed = seed
+        self.n_alternatives, self.n_criteria = self.decision_matrix.shape
+
+        if self.weights.sum() <= 0:
+            raise ValueError('Agirliklarin toplami pozitif olmali')
+
+    def run(self, n_samples=10000, n_workers=None, block_size=50000, chunk_size=4096):
+        """
+        Simulasyonu calistir
+
+        Args:
+            n_samples: Toplam ornek sayisi
+            n_workers: Surec sayisi (None: CPU sayisi, 1: ayni surecte)
+            block_size: Bir iscinin tek seferde isledigi ornek sayisi
+            chunk_size: TOPSIS.run_batch icin parca boyutu
+
+        Returns:
+            dict: Sira kabul indeksleri ve ozet istatistikler
+        """
+        if n_samples < 1:
+            raise ValueError('n_samples en az 1 olmali')
+
+        block_sizes = [block_size] * (n_samples // block_size)
+        if n_samples % block_size:
+            block_sizes.append(n_samples % block_size)
+        seeds = np.random.SeedSequence(self.seed).spawn(len(block_sizes))
+
+        jobs = [
+            (self.decision_matrix, self.weights, self.criteria_types, self.method,
+             self.concentration, self.perturbation, size, seed_seq, chunk_size)
+            for size, seed_seq in zip(block_sizes, seeds)
+        ]
+
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+        n_workers = max(1, min(n_workers, len(jobs)))
+
+        if n_workers == 1:
+            block_results = [_simulate_block(*job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                block_results = list(executor.map(_simulate_block, *zip(*jobs)))
+
+        rank_counts = sum(counts for counts, _ in block_results)
+        weight_sums = sum(sums for _, sums in block_results)
+
+        # Sira kabul indeksleri: b[i, r] = P(alternatif i, r+1. sirada)
+        acceptability = rank_counts / n_samples
+        ranks = np.arange(1, self.n_alternatives + 1)
+        mean_rank = acceptability @ ranks
+        rank_std = np.sqrt(np.maximum(acceptability @ ranks ** 2 - mean_rank ** 2, 0))
+
+        return {
+            'n_samples': n_samples,
+            'method': self.method,
+            'seed': self.seed,
+            'rank_acceptability': acceptability.tolist(),
+            'first_rank_probability': acceptability[:, 0].tolist(),
+            'mean_rank': mean_rank.tolist(),
+            'rank_std': rank_std.tolist(),
+            'mean_weights': (weight_sums / n_samples).tolist(),
+            'base_weights': (self.weights / self.weights.sum()).tolist()
+        }
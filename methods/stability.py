@@ -0,0 +1,229 @@
+"""
+TOPSIS siralamalari icin kesin agirlik kararlilik araliklari
+
+Kriter j'nin agirligi t'ye tasinirken diger agirliklar oransal olarak
+yeniden olceklenir: w_k(t) = w_k * s(t), s(t) = (1 - t) / (1 - w_j).
+Agirliklar negatif olmadigindan agirlikli matrisin ideal cozumleri
+normalize matrisin ideallerinin w ile carpimidir; bu yuzden
+
+    D_i(t)^2 = t^2 * a_ij + s(t)^2 * (sum_k w_k^2 a_ik - w_j^2 a_ij)
+
+(a_ik = (r_ik - r*_k)^2) kapali bicimde yazilir. Normalize matris ve iki
+m x n fark matrisi bir kez hesaplanir; her t noktasi O(m) islemle
+degerlendirilir. Kaba izgarada isaret degisimi bulunan ikili yakinlik
+farklari C_a(t) - C_b(t) vektorize ikiye bolme ile kesin sinira indirilir.
+Izgara nokta bloklari halinde taranir; bellekte ayni anda en fazla
+BLOCK_CELLS (nokta x alternatif) yakinlik katsayisi bulunur.
+"""
+import numpy as np
+
+from .kernels import benefit_mask, ideal_solutions, vector_normalize
+
+STABILITY_MODES = ('ranking', 'winner')
+
+# Bir izgara blogunda hesaplanan en fazla yakinlik katsayisi (nokta x alternatif)
+BLOCK_CELLS = 1 << 20
+
+
+def _bisect(difference, good, bad, tolerance=1e-12):
+    """
+    Parantezlenmis kokleri ikiye bolme ile bul (tum ciftler icin ayni anda)
+
+    Args:
+        difference: t dizisini alip cift basina farki donduren fonksiyon
+        good: Farkin pozitif oldugu uclar
+        bad: Farkin pozitif olmadigi uclar
+        tolerance: Parantez genisligi bu degerin altina inince durulur
+
+    Returns:
+        numpy array: Cift basina isaret degisim noktasi
+    """
+    good = np.array(good, dtype=float)
+    bad = np.array(bad, dtype=float)
+    while np.abs(bad - good).max() > tolerance:
+        mid = 0.5 * (good + bad)
+        positive = difference(mid) > 0
+        good = np.where(positive, mid, good)
+        bad = np.where(positive, bad, mid)
+    return 0.5 * (good + bad)
+
+
+class WeightStability:
+    """
+    Kriter basina siralamanin ve liderin korundugu agirlik araliklari
+
+    'ranking' araligi boyunca tum siralama, 'winner' araligi boyunca yalnizca
+    birinci alternatif ayni kalir (winner araligi ranking araligini kapsar).
+    Ilk yer degistirme her zaman mevcut siralamada komsu iki alternatif
+    arasinda oldugundan siralama icin m - 1 komsu fark izlenir. Ayni izgara
+    hucresinde iki kez isaret degistiren farklar (dokunup geri donme)
+    izgara sikligina bagli olarak kacabilir; mevcut durumdaki esitlikler
+    (ayni yakinlik katsayisi) yok sayilir.
+    """
+
+    def __init__(self, decision_matrix, weights, criteria_types):
+        """
+        Args:
+            decision_matrix: Karar matrisi (alternatifler x kriterler)
+            weights: Mevcut kriter agirliklari (toplami 1 olacak sekilde olceklenir)
+            criteria_types: Kriter tipleri ('max' veya 'min')
+        """
+        self.decision_matrix = np.asarray(decision_matrix, dtype=float)
+        self.criteria_types = criteria_types
+        self.n_alternatives, self.n_criteria = self.decision_matrix.shape
+
+        weights = np.array(weights, dtype=float)
+        if len(weights) != self.n_criteria:
+            raise ValueError('Agirlik sayisi kriter sayisina esit olmali')
+        if (weights < 0).any() or weights.sum() <= 0:
+            raise ValueError('Agirliklar negatif olmamali ve toplami pozitif olmali')
+        if self.n_alternatives < 2:
+            raise ValueError('Kararlilik analizi icin en az 2 alternatif gerekli')
+        self.weights = weights / weights.sum()
+
+        # Tek normalize matris; ideal farklarinin kareleri tum kriterler icin ortak
+        self.normalized_matrix = vector_normalize(self.decision_matrix)
+        best, worst = ideal_solutions(self.normalized_matrix, benefit_mask(criteria_types))
+        self.gap_positive = (self.normalized_matrix - best) ** 2
+        self.gap_negative = (self.normalized_matrix - worst) ** 2
+
+        squared = self.weights ** 2
+        self.closeness = self._closeness(np.sqrt(self.gap_positive @ squared),
+                                         np.sqrt(self.gap_negative @ squared))
+        self.order = np.argsort(-self.closeness, kind='stable')
+
+    @staticmethod
+    def _closeness(distance_positive, distance_negative):
+        denominator = distance_positive + distance_negative
+        return distance_negative / np.where(denominator == 0, 1.0, denominator)
+
+    def closeness_path(self, criterion):
+        """
+        Kriter j'nin agirligina bagli yakinlik katsayisi fonksiyonu
+
+        Returns:
+            fonksiyon: closeness(t, rows) -> t ve rows broadcast bicimindeki
+                       yakinlik katsayilari
+        """
+        w_j = self.weights[criterion]
+        squared = self.weights ** 2
+        terms = []
+        for gap in (self.gap_positive, self.gap_negative):
+            own = gap[:, criterion]
+            rest = np.maximum(gap @ squared - w_j ** 2 * own, 0.0)
+            terms.append((own, rest))
+        remaining = 1.0 - w_j
+
+        def closeness(t, rows):
+            t = np.asarray(t, dtype=float)
+            scale = (1.0 - t) / remaining if remaining > 0 else np.zeros_like(t)
+            distances = [np.sqrt(t ** 2 * own[rows] + scale ** 2 * rest[rows])
+                         for own, rest in terms]
+            return self._closeness(*distances)
+
+        return closeness
+
+    def _pairs(self, mode):
+        """Izlenecek (onde olan, arkadaki) alternatif ciftleri"""
+        if mode == 'ranking':
+            return self.order[:-1], self.order[1:]
+        winner = self.order[0]
+        return np.full(self.n_alternatives - 1, winner), self.order[1:]
+
+    def _scan(self, closeness, points, pairs):
+        """
+        Mevcut agirliktan points yonunde her kip icin ilk isaret degisimi
+
+        Izgara BLOCK_CELLS sinirini asmayan nokta bloklari halinde taranir;
+        siniri bulunan kipler izlenmez, tum kipler bulununca tarama durur.
+
+        Args:
+            closeness: closeness_path ciktisi
+            points: Mevcut agirliktan baslayan izgara noktalari (bir yon)
+            pairs: kip -> izlenecek (onde olan, arkadaki) cift dizileri (_pairs)
+
+        Returns:
+            dict: kip -> (sinir, sinirda yer degistiren cift veya None)
+        """
+        everyone = slice(None)
+        current = closeness(points[0], everyone)
+        # Mevcut esitlikler yok sayilir
+        watched = {mode: current[leaders] - current[followers] > 0
+                   for mode, (leaders, followers) in pairs.items()}
+        bounds = {}
+        block = max(1, BLOCK_CELLS // self.n_alternatives)
+        for start in range(1, len(points), block):
+            path = closeness(points[start:start + block, np.newaxis], everyone)
+            for mode, (leaders, followers) in pairs.items():
+                if mode in bounds:
+                    continue
+                crossed = (path[:, leaders] - path[:, followers] <= 0) & watched[mode]
+                hits = np.flatnonzero(crossed.any(axis=1))
+                if len(hits):
+                    bounds[mode] = self._root(closeness, points, start + hits[0], leaders,
+                                              followers, np.flatnonzero(crossed[hits[0]]))
+            if len(bounds) == len(pairs):
+                break
+        for mode in pairs:
+            bounds.setdefault(mode, (float(points[-1]), None))
+        return bounds
+
+    @staticmethod
+    def _root(closeness, points, step, leaders, followers, pairs):
+        """
+        points[step - 1] ile points[step] arasinda yer degistiren ciftlerden
+        mevcut agirliga en yakin kesin sinir
+
+        Returns:
+            tuple: (sinir, yer degistiren [onde olan, arkadaki] cift)
+        """
+        rows = np.stack((leaders[pairs], followers[pairs]))
+        roots = _bisect(
+            lambda t: np.subtract(*closeness(t, rows)),
+            np.full(len(pairs), points[step - 1]), np.full(len(pairs), points[step])
+        )
+        nearest = np.argmin(np.abs(roots - points[0]))
+        pair = pairs[nearest]
+        return float(roots[nearest]), [int(leaders[pair]), int(followers[pair])]
+
+    def run(self, grid_size=201):
+        """
+        Tum kriterler icin kararlilik araliklarini hesapla
+
+        Args:
+            grid_size: [0, 1] araligindaki kaba izgara nokta sayisi
+
+        Returns:
+            dict: Kriter basina 'ranking' ve 'winner' araliklari; her sinir
+                  icin yer degistiren alternatif cifti (sinir 0 veya 1 ise None)
+        """
+        if grid_size < 2:
+            raise ValueError('grid_size en az 2 olmali')
+        grid = np.linspace(0.0, 1.0, grid_size)
+
+        result = {
+            'weights': self.weights.tolist(),
+            'closeness': self.closeness.tolist(),
+            'best': int(self.order[0]),
+            'grid_size': grid_size
+        }
+        pairs = {mode: self._pairs(mode) for mode in STABILITY_MODES}
+        for mode in STABILITY_MODES:
+            result[mode] = {'interval': [], 'swap': []}
+
+        for j in range(self.n_criteria):
+            closeness = self.closeness_path(j)
+            w_j = self.weights[j]
+            bounds = {mode: ([], []) for mode in STABILITY_MODES}
+            # Once azalan, sonra artan yon; izgara degerleri iki kip icin ortak
+            for points in (np.concatenate(([w_j], grid[grid < w_j][::-1])),
+                           np.concatenate(([w_j], grid[grid > w_j]))):
+                found = self._scan(closeness, points, pairs)
+                for mode in STABILITY_MODES:
+                    bound, swap = found[mode]
+                    bounds[mode][0].append(bound)
+                    bounds[mode][1].append(swap)
+            for mode in STABILITY_MODES:
+                result[mode]['interval'].append(bounds[mode][0])
+                result[mode]['swap'].append(bounds[mode][1])
+        return result
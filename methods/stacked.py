@@ -0,0 +1,172 @@
+"""
+Ayni boyutlu karar matrisi yiginlari (senaryolar / karar vericiler) icin CRITIC
+
+s x m x n yiginin tum senaryolari tek seferde, yigin boyunca broadcast eden
+cekirdeklerle hesaplanir; senaryo basina CRITIC nesnesi olusturulmaz.
+"""
+import numpy as np
+
+from .kernels import benefit_mask, correlation_conflict, minmax_normalize, pearson_correlation
+from .registry import DETAIL_LEVELS, run_steps
+
+AGGREGATIONS = ('mean', 'geometric')
+
+
+class StackedCRITIC:
+    """
+    Senaryo yigini icin CRITIC agirliklari
+
+    Her senaryonun sonucu ayni matrisle calistirilan CRITIC ile aynidir
+    (yuvarlama farki ~1e-15). Yalnizca agirliklar istendiginde s x n x n
+    korelasyon yigini olusturulmaz.
+    """
+
+    def __init__(self, stack, criteria_types):
+        """
+        Args:
+            stack: s x m x n dizi (senaryolar x alternatifler x kriterler)
+            criteria_types: Tum senaryolar icin ortak kriter tipleri ('max' veya 'min')
+        """
+        self.stack = np.asarray(stack, dtype=float)
+        if self.stack.ndim != 3:
+            raise ValueError(f'Senaryo yigini 3 boyutlu olmali (s x m x n): {self.stack.shape}')
+        self.criteria_types = criteria_types
+        self.n_scenarios, self.n_alternatives, self.n_criteria = self.stack.shape
+        if len(criteria_types) != self.n_criteria:
+            raise ValueError('Kriter tipi sayisi kriter sayisina esit olmali')
+
+        self.materialize_correlation = True
+        self.normalized_matrix = None
+        self.std_devs = None
+        self.correlation_matrix = None
+        self.conflict = None
+        self.information_content = None
+        self.weights = None
+        self.timings = {}
+
+    def normalize(self):
+        """1. Adim: Senaryo basina Min-Max normalizasyonu"""
+        self.normalized_matrix = minmax_normalize(self.stack, benefit_mask(self.criteria_types))
+        return self.normalized_matrix
+
+    def calculate_std_deviation(self):
+        """2. Adim: Orneklem standart sapmalari (s x n, ddof=1)"""
+        self.std_devs = np.std(self.normalized_matrix, axis=1, ddof=1)
+        return self.std_devs
+
+    def calculate_correlation(self):
+        """3. Adim: Korelasyon yigini (s x n x n) ve catisma toplamlari"""
+        if self.materialize_correlation:
+            self.correlation_matrix = pearson_correlation(self.normalized_matrix)
+            self.conflict = self.n_criteria - self.correlation_matrix.sum(axis=2)
+        else:
+            self.correlation_matrix = None
+            self.conflict = correlation_conflict(self.normalized_matrix)
+        return self.correlation_matrix
+
+    def calculate_information_content(self):
+        """4. Adim: C_sj = sigma_sj * sum_k (1 - r_sjk)"""
+        self.information_content = self.std_devs * self.conflict
+        return self.information_content
+
+    def calculate_weights(self):
+        """5. Adim: Senaryo basina agirliklar (bilgi icerigi sifirsa esit agirlik)"""
+        totals = self.information_content.sum(axis=1, keepdims=True)
+        zero = totals[:, 0] == 0
+        self.weights = self.information_content / np.where(totals == 0, 1.0, totals)
+        self.weights[zero] = 1.0 / self.n_criteria
+        return self.weights
+
+    def run(self, detail='full', progress=None):
+        """
+        Tum adimlari calistir
+
+        Args:
+            detail: 'weights-only' (s x n agirliklar), 'summary' (standart
+                    sapma, bilgi icerigi ve korelasyon yigini dahil) veya
+                    'full' (normalize yigin dahil)
+            progress: Her adimdan sonra progress(adim_adi, oran) seklinde cagrilir
+        """
+        if detail not in DETAIL_LEVELS:
+            raise ValueError(f"Gecersiz detay seviyesi: {detail}")
+        self.materialize_correlation = detail != 'weights-only'
+
+        steps = [self.normalize, self.calculate_std_deviation, self.calculate_correlation,
+                 self.calculate_information_content, self.calculate_weights]
+        self.timings = run_steps(steps, progress)
+
+        result = {'weights': self.weights.tolist()}
+        if detail == 'weights-only':
+            return result
+
+        result.update({
+            'std_devs': self.std_devs.tolist(),
+            'correlation_matrix': self.correlation_matrix.tolist(),
+            'information_content': self.information_content.tolist()
+        })
+        if detail == 'summary':
+            return result
+
+        result['normalized_matrix'] = self.normalized_matrix.tolist()
+        return result
+
+
+def aggregate_weights(weights, method='mean', scenario_weights=None):
+    """
+    Senaryo agirliklarini tek agirlik vektorunde birlestir
+
+    Args:
+        weights: s x n agirlik matrisi (StackedCRITIC.weights)
+        method: 'mean' (aritmetik ortalama) veya 'geometric' (geometrik
+                ortalama; grup kararlarinda yaygin, sonuc yeniden olceklenir)
+        scenario_weights: Senaryo onem dereceleri (None: esit)
+
+    Returns:
+        numpy array: Toplami 1 olan n agirlik
+    """
+    weights = np.asarray(weights, dtype=float)
+    if scenario_weights is None:
+        scenario_weights = np.full(weights.shape[0], 1.0 / weights.shape[0])
+    else:
+        scenario_weights = np.asarray(scenario_weights, dtype=float)
+        scenario_weights = scenario_weights / scenario_weights.sum()
+
+    if method == 'mean':
+        combined = scenario_weights @ weights
+    elif method == 'geometric':
+        # Herhangi bir senaryoda sifir agirlik alan kriterin geometrik ortalamasi 0
+        with np.errstate(divide='ignore'):
+            combined = np.exp(scenario_weights @ np.log(weights))
+    else:
+        raise ValueError(f"Bilinmeyen birlestirme yontemi: {method}")
+
+    total = combined.sum()
+    if total == 0:
+        return np.full(weights.shape[1], 1.0 / weights.shape[1])
+    return combined / total
+
+
+def weight_spread(weights, aggregate=None):
+    """
+    Senaryolar arasi agirlik yayilimi
+
+    Args:
+        weights: s x n agirlik matrisi
+        aggregate: Karsilastirilacak ortak agirliklar (None: aritmetik ortalama)
+
+    Returns:
+        dict: Kriter basina std (ddof=1), min, max ve aralik; senaryo basina
+              ortak agirliklara L1 uzakligi (deviation)
+    """
+    weights = np.asarray(weights, dtype=float)
+    if aggregate is None:
+        aggregate = weights.mean(axis=0)
+    ddof = 1 if weights.shape[0] > 1 else 0
+    low, high = weights.min(axis=0), weights.max(axis=0)
+    return {
+        'std': weights.std(axis=0, ddof=ddof).tolist(),
+        'min': low.tolist(),
+        'max': high.tolist(),
+        'range': (high - low).tolist(),
+        'deviation': np.abs(weights - aggregate).sum(axis=1).tolist()
+    }
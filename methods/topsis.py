@@ -1,6 +1,10 @@
 import numpy as np
 
+from .kernels import benefit_mask, euclidean_distance, ideal_solutions, rank, top_k, vector_normalize
+from .registry import DETAIL_LEVELS, RANKING, register, run_steps
 
+
+@register('topsis', RANKING)
 class TOPSIS:
     """
     TOPSIS (Technique for Order Preference by Similarity to Ideal Solution)
@@ -21,18 +25,17 @@ class TOPSIS:
             weights: Kriter agirliklari (liste veya numpy array)
             criteria_types: Kriter tipleri ('max' veya 'min')
         """
-        self.decision_matrix = np.array(decision_matrix, dtype=float)
+        # Zaten float64 dizi ise kopyalanmaz (hesaplamalar matrisi degistirmez)
+        self.decision_matrix = np.asarray(decision_matrix, dtype=float)
         self.weights = np.array(weights, dtype=float)
         self.criteria_types = criteria_types
         self.n_alternatives, self.n_criteria = self.decision_matrix.shape
+        self.k = None
+        self.timings = {}
 
     def normalize(self):
         """1. Adim: Vektor normalizasyonu"""
-        # Her sutunun karesinin toplaminin karekoku
-        norm_factors = np.sqrt(np.sum(self.decision_matrix ** 2, axis=0))
-        # Sifira bolunmeyi onle
-        norm_factors[norm_factors == 0] = 1
-        self.normalized_matrix = self.decision_matrix / norm_factors
+        self.normalized_matrix = vector_normalize(self.decision_matrix)
         return self.normalized_matrix
 
     def weighted_normalize(self):
@@ -42,25 +45,17 @@ class TOPSIS:
 
     def find_ideal_solutions(self):
         """3. Adim: Ideal (A+) ve negatif-ideal (A-) cozumler"""
-        self.ideal_positive = np.zeros(self.n_criteria)
-        self.ideal_negative = np.zeros(self.n_criteria)
-
-        for j in range(self.n_criteria):
-            if self.criteria_types[j] == 'max':
-                self.ideal_positive[j] = np.max(self.weighted_matrix[:, j])
-                self.ideal_negative[j] = np.min(self.weighted_matrix[:, j])
-            else:  # min
-                self.ideal_positive[j] = np.min(self.weighted_matrix[:, j])
-                self.ideal_negative[j] = np.max(self.weighted_matrix[:, j])
-
+        self.ideal_positive, self.ideal_negative = ideal_solutions(
+            self.weighted_matrix, benefit_mask(self.criteria_types)
+        )
         return self.ideal_positive, self.ideal_negative
 
     def calculate_distances(self):
         """4. Adim: Ideal ve negatif-ideal cozumlere uzakliklar"""
         # Ideal cozume uzaklik (D+)
-        self.distance_positive = np.sqrt(np.sum((self.weighted_matrix - self.ideal_positive) ** 2, axis=1))
+        self.distance_positive = euclidean_distance(self.weighted_matrix, self.ideal_positive)
         # Negatif-ideal cozume uzaklik (D-)
-        self.distance_negative = np.sqrt(np.sum((self.weighted_matrix - self.ideal_negative) ** 2, axis=1))
+        self.distance_negative = euclidean_distance(self.weighted_matrix, self.ideal_negative)
 
         return self.distance_positive, self.distance_negative
 
@@ -72,33 +67,123 @@ class TOPSIS:
         denominator[denominator == 0] = 1
         self.closeness = self.distance_negative / denominator
 
-        # Siralama (buyukten kucuge)
-        self.ranking = np.argsort(-self.closeness) + 1  # 1'den baslayan siralama
+        # Siralama (buyukten kucuge, 1 = en iyi); top-k modunda yalnizca en iyi
+        # k alternatif argpartition ile secilir, tam siralama yapilmaz
+        if self.k:
+            self.top_indices = top_k(self.closeness, self.k)
+            self.ranking = None
+        else:
+            self.ranking = rank(self.closeness)
 
         return self.closeness, self.ranking
 
-    def run(self):
-        """Tum adimlari calistir ve sonuclari dondur"""
-        self.normalize()
-        self.weighted_normalize()
-        self.find_ideal_solutions()
-        self.calculate_distances()
-        self.calculate_closeness()
+    def run_batch(self, weights_matrix, chunk_size=256):
+        """
+        Ayni karar matrisini birden fazla agirlik vektoru ile degerlendir
+
+        Normalizasyon bir kez yapilir; agirlik vektorleri chunk_size'lik
+        gruplar halinde broadcast ile islenir. Bellek kullanimi en fazla
+        chunk_size x alternatif x kriter buyuklugunde gecici dizi kadardir.
+
+        Args:
+            weights_matrix: k x n agirlik matrisi (her satir bir agirlik vektoru)
+            chunk_size: Ayni anda islenecek agirlik vektoru sayisi
 
-        # Siralama indekslerini duzelt
-        ranking_order = np.argsort(-self.closeness)
-        final_ranking = np.zeros(self.n_alternatives, dtype=int)
-        for rank, idx in enumerate(ranking_order):
-            final_ranking[idx] = rank + 1
+        Returns:
+            dict: 'closeness' ve 'ranking' (k x m numpy array)
+        """
+        weights_matrix = np.atleast_2d(np.array(weights_matrix, dtype=float))
+        if weights_matrix.shape[1] != self.n_criteria:
+            raise ValueError('Agirlik matrisinin sutun sayisi kriter sayisina esit olmali')
+        if chunk_size < 1:
+            raise ValueError('chunk_size en az 1 olmali')
+
+        if getattr(self, 'normalized_matrix', None) is None:
+            self.normalize()
+
+        n_weights = weights_matrix.shape[0]
+        is_benefit = benefit_mask(self.criteria_types)
+        closeness = np.empty((n_weights, self.n_alternatives))
+
+        for start in range(0, n_weights, chunk_size):
+            W = weights_matrix[start:start + chunk_size]
+            # k x m x n agirlikli matrisler
+            weighted = self.normalized_matrix[np.newaxis, :, :] * W[:, np.newaxis, :]
+
+            col_max = weighted.max(axis=1)
+            col_min = weighted.min(axis=1)
+            ideal_positive = np.where(is_benefit, col_max, col_min)
+            ideal_negative = np.where(is_benefit, col_min, col_max)
+
+            d_pos = np.sqrt(np.sum((weighted - ideal_positive[:, np.newaxis, :]) ** 2, axis=2))
+            d_neg = np.sqrt(np.sum((weighted - ideal_negative[:, np.newaxis, :]) ** 2, axis=2))
+
+            denominator = d_pos + d_neg
+            denominator[denominator == 0] = 1
+            closeness[start:start + chunk_size] = d_neg / denominator
+
+        # Her alternatifin sirasi (1 = en iyi)
+        order = np.argsort(-closeness, axis=1)
+        ranking = np.empty_like(order)
+        ranks = np.broadcast_to(np.arange(1, self.n_alternatives + 1), order.shape)
+        np.put_along_axis(ranking, order, ranks, axis=1)
 
         return {
-            'normalized_matrix': self.normalized_matrix.tolist(),
-            'weighted_matrix': self.weighted_matrix.tolist(),
+            'closeness': closeness,
+            'ranking': ranking
+        }
+
+    def run(self, detail='full', progress=None, k=None):
+        """
+        Tum adimlari calistir ve sonuclari dondur
+
+        Args:
+            detail: 'weights-only' (yalnizca yakinlik katsayilari, siralama ve
+                    kullanilan agirliklar), 'summary' (uzakliklar ve ideal
+                    cozumler dahil) veya 'full' (normalize ve agirlikli matrisler dahil)
+            progress: Her adimdan sonra progress(adim_adi, oran) seklinde
+                      cagrilir; istisna firlatarak hesaplama durdurulabilir
+            k: Verilirse yalnizca en iyi k alternatif dondurulur; alternatif
+               bazli listeler bu k alternatifi en iyiden baslayarak icerir,
+               'indices' ozgun indeksleri verir
+        """
+        if detail not in DETAIL_LEVELS:
+            raise ValueError(f"Gecersiz detay seviyesi: {detail}")
+        self.k = k
+
+        steps = [self.normalize, self.weighted_normalize, self.find_ideal_solutions,
+                 self.calculate_distances, self.calculate_closeness]
+        self.timings = run_steps(steps, progress)
+
+        if k:
+            rows = self.top_indices
+            result = {
+                'k': len(rows),
+                'n_alternatives': self.n_alternatives,
+                'indices': rows.tolist(),
+                'closeness': self.closeness[rows].tolist(),
+                'ranking': list(range(1, len(rows) + 1)),
+                'weights_used': self.weights.tolist()
+            }
+        else:
+            rows = slice(None)
+            result = {
+                'closeness': self.closeness.tolist(),
+                'ranking': self.ranking.tolist(),
+                'weights_used': self.weights.tolist()
+            }
+        if detail == 'weights-only':
+            return result
+
+        result.update({
             'ideal_positive': self.ideal_positive.tolist(),
             'ideal_negative': self.ideal_negative.tolist(),
-            'distance_positive': self.distance_positive.tolist(),
-            'distance_negative': self.distance_negative.tolist(),
-            'closeness': self.closeness.tolist(),
-            'ranking': final_ranking.tolist(),
-            'weights_used': self.weights.tolist()
-        }
+            'distance_positive': self.distance_positive[rows].tolist(),
+            'distance_negative': self.distance_negative[rows].tolist()
+        })
+        if detail == 'summary':
+            return result
+
+        result['normalized_matrix'] = self.normalized_matrix[rows].tolist()
+        result['weighted_matrix'] = self.weighted_matrix[rows].tolist()
+        return result
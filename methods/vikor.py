@@ -0,0 +1,131 @@
+import numpy as np
+
+from .kernels import benefit_mask, ideal_solutions, rank
+from .registry import DETAIL_LEVELS, RANKING, register, run_steps
+
+
+@register('vikor', RANKING, params=('v',))
+class VIKOR:
+    """
+    VIKOR (VIseKriterijumska Optimizacija I Kompromisno Resenje)
+    Uzlasik Siralama Yontemi
+
+    Adimlar:
+    1. Kriter bazli en iyi (f*) ve en kotu (f-) degerlerin belirlenmesi
+    2. Grup faydasi (S) ve bireysel pismanlik (R) degerleri
+    3. Uzlasi indeksi (Q) ve siralama (kucuk Q daha iyi)
+    4. Uzlasik cozumun kabul edilebilir avantaj ve istikrar kosullari
+    """
+
+    def __init__(self, decision_matrix, weights, criteria_types, v=0.5):
+        """
+        Args:
+            decision_matrix: Karar matrisi (numpy array)
+            weights: Kriter agirliklari (liste veya numpy array)
+            criteria_types: Kriter tipleri ('max' veya 'min')
+            v: Grup faydasi stratejisinin agirligi (0-1, varsayilan 0.5)
+        """
+        self.decision_matrix = np.asarray(decision_matrix, dtype=float)
+        self.weights = np.array(weights, dtype=float)
+        self.criteria_types = criteria_types
+        self.v = float(v)
+        self.n_alternatives, self.n_criteria = self.decision_matrix.shape
+        self.timings = {}
+
+        if not 0 <= self.v <= 1:
+            raise ValueError('v parametresi 0 ile 1 arasinda olmali')
+
+    def find_ideal_solutions(self):
+        """1. Adim: En iyi (f*) ve en kotu (f-) degerler"""
+        self.best, self.worst = ideal_solutions(self.decision_matrix, benefit_mask(self.criteria_types))
+        return self.best, self.worst
+
+    def calculate_utility_regret(self):
+        """2. Adim: S_i = sum_j w_j * d_ij, R_i = max_j w_j * d_ij"""
+        spread = self.best - self.worst
+        # Sabit kriterler (f* = f-) pismanliga katki yapmaz
+        safe_spread = np.where(spread == 0, 1.0, spread)
+        self.weighted_regret = self.weights * (self.best - self.decision_matrix) / safe_spread
+        self.weighted_regret[:, spread == 0] = 0
+
+        self.utility = self.weighted_regret.sum(axis=1)
+        self.regret = self.weighted_regret.max(axis=1)
+        return self.utility, self.regret
+
+    def calculate_compromise(self):
+        """3. Adim: Q_i = v (S_i - S*) / (S- - S*) + (1 - v) (R_i - R*) / (R- - R*)"""
+        def scaled(values):
+            low, high = values.min(), values.max()
+            if high == low:
+                return np.zeros_like(values)
+            return (values - low) / (high - low)
+
+        self.q = self.v * scaled(self.utility) + (1 - self.v) * scaled(self.regret)
+        self.ranking = rank(self.q, descending=False)
+        return self.q, self.ranking
+
+    def check_conditions(self):
+        """
+        4. Adim: Uzlasik cozum kumesi
+
+        C1 (kabul edilebilir avantaj): Q(a2) - Q(a1) >= 1 / (m - 1)
+        C2 (kabul edilebilir istikrar): a1, S veya R'ye gore de en iyi
+        C1 saglanmazsa Q(aM) - Q(a1) < 1 / (m - 1) olan tum alternatifler,
+        yalnizca C2 saglanmazsa a1 ve a2 uzlasik cozumdur.
+        """
+        order = np.argsort(self.q)
+        first = order[0]
+        threshold = 1.0 / (self.n_alternatives - 1) if self.n_alternatives > 1 else 0.0
+
+        self.advantage = bool(self.n_alternatives < 2 or self.q[order[1]] - self.q[first] >= threshold)
+        self.stability = bool(self.utility[first] == self.utility.min()
+                              or self.regret[first] == self.regret.min())
+
+        if not self.advantage:
+            self.compromise = order[self.q[order] - self.q[first] < threshold]
+        elif not self.stability:
+            self.compromise = order[:2]
+        else:
+            self.compromise = order[:1]
+        return self.compromise
+
+    def run(self, detail='full', progress=None):
+        """
+        Tum adimlari calistir ve sonuclari dondur
+
+        Args:
+            detail: 'weights-only' (Q, siralama ve kullanilan agirliklar),
+                    'summary' (S, R, en iyi/en kotu degerler ve uzlasik cozum dahil)
+                    veya 'full' (agirlikli pismanlik matrisi dahil)
+            progress: Her adimdan sonra progress(adim_adi, oran) seklinde cagrilir
+        """
+        if detail not in DETAIL_LEVELS:
+            raise ValueError(f"Gecersiz detay seviyesi: {detail}")
+
+        steps = [self.find_ideal_solutions, self.calculate_utility_regret,
+                 self.calculate_compromise, self.check_conditions]
+        self.timings = run_steps(steps, progress)
+
+        result = {
+            'q': self.q.tolist(),
+            'ranking': self.ranking.tolist(),
+            'weights_used': self.weights.tolist()
+        }
+        if detail == 'weights-only':
+            return result
+
+        result.update({
+            'utility': self.utility.tolist(),
+            'regret': self.regret.tolist(),
+            'best': self.best.tolist(),
+            'worst': self.worst.tolist(),
+            'v': self.v,
+            'acceptable_advantage': self.advantage,
+            'acceptable_stability': self.stability,
+            'compromise': self.compromise.tolist()
+        })
+        if detail == 'summary':
+            return result
+
+        result['weighted_regret'] = self.weighted_regret.tolist()
+        return result
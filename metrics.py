@@ -0,0 +1,263 @@
+import bisect
+import cProfile
+import glob
+import json
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+
+from flask import g, has_request_context
+
+from storage import atomic_write_bytes
+
+# Gecikme histogrami kova sinirlari (saniye)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Matris boyutu kovalari (hucre sayisi ust sinirlari); daha buyukler 'inf'
+SIZE_BUCKETS = (100, 10 ** 4, 10 ** 6, 10 ** 8)
+
+
+def size_bucket(cells):
+    """Hucre sayisini etiket degerine cevir ('none', '1e2', '1e4', ..., 'inf')"""
+    if cells is None:
+        return 'none'
+    for limit in SIZE_BUCKETS:
+        if cells <= limit:
+            return f'1e{len(str(limit)) - 1}'
+    return 'inf'
+
+
+class LatencyHistograms:
+    """
+    Route ve matris boyutu kovasina gore gecikme histogramlari
+
+    Prometheus metin bicimine (text/plain; version=0.0.4) cevrilebilir;
+    harici bir istemci kutuphanesi gerektirmez.
+    """
+
+    def __init__(self, name='kds_request_duration_seconds', buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.buckets = tuple(buckets)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels, seconds):
+        """
+        Bir olcum ekle
+
+        Args:
+            labels: Etiket ciftleri (orn. (('route', '/critic/analyze'), ('size', '1e4')))
+            seconds: Sure (saniye)
+        """
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += seconds
+            series[2] += 1
+
+    def snapshot(self):
+        """Serilerin JSON'a cevrilebilir kopyasi: [[etiketler, kovalar, toplam, sayi], ...]"""
+        with self._lock:
+            return [[[list(pair) for pair in labels], [*counts], total, count]
+                    for labels, (counts, total, count) in self._series.items()]
+
+    def render(self, snapshots=None):
+        """
+        Prometheus metin bicimi satirlari
+
+        Args:
+            snapshots: {pid: snapshot()}; verilirse tum sureclerin serileri
+                       pid etiketiyle yazilir (varsayilan: yalnizca bu surec)
+        """
+        if snapshots is None:
+            snapshots = {os.getpid(): self.snapshot()}
+        lines = [f'# HELP {self.name} Istek suresi (saniye)',
+                 f'# TYPE {self.name} histogram']
+        items = sorted(
+            (tuple(tuple(pair) for pair in labels) + (('pid', str(pid)),), (counts, total, count))
+            for pid, series in snapshots.items()
+            for labels, counts, total, count in series
+        )
+
+        for labels, (counts, total, count) in items:
+            label_text = ','.join(f'{k}="{_escape(v)}"' for k, v in labels)
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'{self.name}_bucket{{{label_text},le="{le}"}} {cumulative}')
+            lines.append(f'{self.name}_sum{{{label_text}}} {total}')
+            lines.append(f'{self.name}_count{{{label_text}}} {count}')
+        return lines
+
+
+class MetricsSnapshots:
+    """
+    Prefork iscilerin metriklerini paylasilan bir klasorde toplar
+
+    Her surec kendi anlik goruntusunu '<pid>.json' olarak (atomik) yazar;
+    /metrics hangi isciye gelirse gelsin tum dosyalari okuyup pid etiketiyle
+    yayinlar. Istek sonlarinda yazma en fazla interval saniyede bir yapilir
+    (schedule); diger iscilerin sayaclari bu kadar geriden gelebilir. Sayaclar
+    sunucu baslarken (clear) sifirlanir; yeniden baslayan iscilerin eski
+    dosyalari sayaclarin geri gitmemesi icin korunur.
+    """
+
+    def __init__(self, directory, interval=1.0):
+        """
+        Args:
+            directory: Tum iscilerin paylastigi klasor
+            interval: Iki yazma arasindaki en kisa sure (saniye, 0: her istekte)
+        """
+        self.directory = directory
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._last = float('-inf')
+        self._pending = None
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+    def schedule(self, snapshot):
+        """
+        Anlik goruntuyu en fazla interval saniyede bir yaz
+
+        Args:
+            snapshot: Goruntuyu ureten fonksiyon; yalnizca yazilirken cagrilir
+
+        Aralik dolmadan gelen cagrilar icin aralik sonunda tek bir yazma
+        zamanlanir, boylece bosta kalan iscinin son durumu da yazilir.
+        """
+        with self._lock:
+            if self._pending is not None:
+                return
+            wait = self._last + self.interval - time.monotonic()
+            if wait > 0:
+                self._pending = threading.Timer(wait, self.flush, (snapshot,))
+                self._pending.daemon = True
+                self._pending.start()
+                return
+            self._last = time.monotonic()
+        self.write(snapshot())
+
+    def flush(self, snapshot):
+        """Zamanlanmis yazmayi beklemeden simdi yaz (orn. isci kapanirken)"""
+        with self._lock:
+            if self._pending is not None:
+                self._pending.cancel()
+                self._pending = None
+            self._last = time.monotonic()
+        self.write(snapshot())
+
+    def write(self, snapshot):
+        """Bu surecin anlik goruntusunu yaz"""
+        atomic_write_bytes(os.path.join(self.directory, f'{os.getpid()}.json'),
+                           json.dumps(snapshot).encode('utf-8'))
+
+    def read(self):
+        """Tum sureclerin anlik goruntuleri (pid -> sozluk)"""
+        snapshots = {}
+        for path in glob.glob(os.path.join(self.directory, '*.json')):
+            name = os.path.splitext(os.path.basename(path))[0]
+            if not name.isdigit():
+                continue
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    snapshots[int(name)] = json.load(f)
+            except (OSError, ValueError):
+                continue
+        return snapshots
+
+    @staticmethod
+    def clear(directory):
+        """Onceki calistirmalardan kalan anlik goruntuleri sil"""
+        for path in glob.glob(os.path.join(directory, '*.json')):
+            os.remove(path)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+# ========== ISTEK ICI ZAMANLAYICILAR ==========
+
+@contextmanager
+def timed(name):
+    """
+    Blogun suresini istek zamanlayicilarina ekle (Server-Timing basligi icin)
+
+    Istek baglami disinda (orn. arka plan islerinde) yalnizca blogu calistirir.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_timing(name, time.perf_counter() - start)
+
+
+def record_timing(name, seconds):
+    """Hazir olculmus bir sureyi istek zamanlayicilarina ekle"""
+    if has_request_context() and hasattr(g, 'timings'):
+        g.timings[name] = g.timings.get(name, 0.0) + seconds
+
+
+def note_matrix_size(cells):
+    """Istek metrikleri icin matris hucre sayisini kaydet"""
+    if has_request_context():
+        g.matrix_cells = int(cells)
+
+
+def server_timing_header(timings, total):
+    """Server-Timing basligi degeri (sureler milisaniye)"""
+    parts = [f'{_token(name)};dur={seconds * 1000:.2f}' for name, seconds in timings.items()]
+    parts.append(f'total;dur={total * 1000:.2f}')
+    return ', '.join(parts)
+
+
+def _token(name):
+    return ''.join(c if c.isalnum() or c in '-_.' else '_' for c in name)
+
+
+# ========== ORNEKLEMELI PROFIL ==========
+
+class RequestProfiler:
+    """
+    Isteklerin rastgele bir kesrini cProfile ile profille ve .prof olarak yaz
+
+    Cikti dosyalari snakeviz / pstats ile incelenebilir.
+    """
+
+    def __init__(self, rate=0.0, out_dir=None):
+        """
+        Args:
+            rate: Profillenecek istek orani (0-1, 0: kapali)
+            out_dir: .prof dosyalarinin yazilacagi klasor
+        """
+        self.rate = rate
+        self.out_dir = out_dir
+        if rate > 0 and out_dir and not os.path.exists(out_dir):
+            os.makedirs(out_dir)
+
+    @property
+    def enabled(self):
+        return self.rate > 0 and bool(self.out_dir)
+
+    def maybe_start(self):
+        """Orneklenirse profili baslat ve dondur, aksi halde None"""
+        if not self.enabled or random.random() >= self.rate:
+            return None
+        profiler = cProfile.Profile()
+        profiler.enable()
+        return profiler
+
+    def finish(self, profiler, label):
+        """Profili durdur ve dosyaya yaz; dosya yolunu dondur"""
+        profiler.disable()
+        filename = f'{time.strftime("%Y%m%d-%H%M%S")}-{_token(label)}-{os.getpid()}-{threading.get_ident()}.prof'
+        path = os.path.join(self.out_dir, filename)
+        profiler.dump_stats(path)
+        return path
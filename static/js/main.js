@@ -234,6 +234,169 @@ function loadSampleData() {
     showAlert('Ornek veriler yuklendi!', 'success');
 }
 
+/**
+ * Run analysis as a background job and poll its progress
+ */
+async function runJob(method, data, onProgress, interval = 300) {
+    const response = await fetch('/jobs', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ ...data, method: method })
+    });
+    const submitted = await response.json();
+    if (!submitted.success) {
+        throw new Error(submitted.error);
+    }
+
+    while (true) {
+        await new Promise(resolve => setTimeout(resolve, interval));
+        const status = await (await fetch(`/jobs/${submitted.job_id}`)).json();
+        if (onProgress) onProgress(status);
+
+        if (status.status === 'done') return status;
+        if (status.status === 'failed') throw new Error(status.error);
+        if (status.status === 'cancelled') throw new Error('Is iptal edildi');
+    }
+}
+
+/**
+ * Update job progress bar
+ */
+function updateJobProgress(status) {
+    const bar = document.getElementById('jobProgressBar');
+    if (!bar) return;
+    const percent = Math.round(status.progress * 100);
+    bar.style.width = `${percent}%`;
+    bar.textContent = `${percent}%`;
+    const step = document.getElementById('jobProgressStep');
+    if (step && status.step) step.textContent = status.step;
+}
+
+/**
+ * Escape text for safe insertion into HTML
+ */
+function escapeHtml(value) {
+    return String(value)
+        .replace(/&/g, '&amp;')
+        .replace(/</g, '&lt;')
+        .replace(/>/g, '&gt;')
+        .replace(/"/g, '&quot;');
+}
+
+/**
+ * Paginated server-side table (/<kind>/data/<name>)
+ *
+ * Rows are fetched page by page; clicking a header sorts on the server.
+ * Matrices with many columns are shown in column windows.
+ */
+function createDataTable(elementId, url, options = {}) {
+    const target = document.getElementById(elementId);
+    const state = {
+        offset: 0,
+        limit: options.limit || 25,
+        sort: options.sort ?? null,
+        order: options.order || 'asc',
+        columnStart: 0,
+        columnWidth: options.columnWidth || 0
+    };
+    const params = options.params || {};
+    const decimals = options.decimals ?? 4;
+    const format = options.format || ((key, value) =>
+        typeof value === 'number' ? formatNumber(value, decimals) : escapeHtml(value));
+
+    async function load() {
+        const query = new URLSearchParams({ offset: state.offset, limit: state.limit, order: state.order });
+        Object.entries(params).forEach(([key, value]) => {
+            if (value !== null && value !== undefined) query.set(key, value);
+        });
+        if (state.sort !== null) query.set('sort', state.sort);
+        if (state.columnWidth) query.set('columns', `${state.columnStart}:${state.columnStart + state.columnWidth}`);
+
+        try {
+            const data = await (await fetch(`${url}?${query}`)).json();
+            if (!data.success) {
+                target.innerHTML = `<div class="alert alert-danger mb-0">Hata: ${escapeHtml(data.error)}</div>`;
+                return;
+            }
+            render(data);
+        } catch (error) {
+            target.innerHTML = `<div class="alert alert-danger mb-0">Bir hata olustu: ${escapeHtml(error.message)}</div>`;
+        }
+    }
+
+    function arrow(key) {
+        if (String(state.sort) !== String(key)) return '';
+        return state.order === 'desc' ? ' &#9660;' : ' &#9650;';
+    }
+
+    function render(data) {
+        const first = data.total ? data.offset + 1 : 0;
+        const last = Math.min(data.offset + data.limit, data.total);
+
+        let html = '<div class="table-responsive"><table class="table table-sm table-hover"><thead><tr>';
+        html += `<th role="button" data-sort="label">${escapeHtml(options.labelTitle || '')}${arrow('label')}</th>`;
+        data.columns.forEach(column => {
+            html += `<th role="button" data-sort="${escapeHtml(column.key)}">${escapeHtml(column.name)}${arrow(column.key)}</th>`;
+        });
+        html += '</tr></thead><tbody>';
+        data.rows.forEach(row => {
+            const rowClass = options.rowClass ? options.rowClass(row, data) : '';
+            html += `<tr class="${rowClass}"><th>${escapeHtml(row.label)}</th>`;
+            row.values.forEach((value, j) => {
+                html += `<td>${format(data.columns[j].key, value, row)}</td>`;
+            });
+            html += '</tr>';
+        });
+        html += '</tbody></table></div>';
+
+        html += '<div class="d-flex justify-content-between align-items-center small">';
+        html += `<span class="text-muted">${first}-${last} / ${data.total}</span><div>`;
+        if (data.total_columns && state.columnWidth && data.total_columns > state.columnWidth) {
+            const lastColumn = Math.min(state.columnStart + state.columnWidth, data.total_columns);
+            html += `<span class="text-muted me-2">Sutun ${state.columnStart + 1}-${lastColumn} / ${data.total_columns}</span>`;
+            html += `<button class="btn btn-sm btn-outline-secondary me-1" data-move="left" ${state.columnStart === 0 ? 'disabled' : ''}>&laquo;</button>`;
+            html += `<button class="btn btn-sm btn-outline-secondary me-3" data-move="right" ${lastColumn >= data.total_columns ? 'disabled' : ''}>&raquo;</button>`;
+        }
+        html += `<button class="btn btn-sm btn-outline-secondary me-1" data-move="prev" ${data.offset === 0 ? 'disabled' : ''}>Onceki</button>`;
+        html += `<button class="btn btn-sm btn-outline-secondary" data-move="next" ${last >= data.total ? 'disabled' : ''}>Sonraki</button>`;
+        html += '</div></div>';
+        target.innerHTML = html;
+
+        target.querySelectorAll('th[data-sort]').forEach(th => th.addEventListener('click', () => {
+            const key = th.dataset.sort;
+            state.order = String(state.sort) === key && state.order === 'asc' ? 'desc' : 'asc';
+            state.sort = key;
+            state.offset = 0;
+            load();
+        }));
+        target.querySelectorAll('button[data-move]').forEach(button => button.addEventListener('click', () => {
+            const move = button.dataset.move;
+            if (move === 'prev') state.offset = Math.max(state.offset - state.limit, 0);
+            if (move === 'next') state.offset += state.limit;
+            if (move === 'left') state.columnStart = Math.max(state.columnStart - state.columnWidth, 0);
+            if (move === 'right') state.columnStart += state.columnWidth;
+            load();
+        }));
+    }
+
+    showLoading(elementId);
+    load();
+    return { reload: load, state: state };
+}
+
+/**
+ * Fetch downsampled chart series (/<kind>/charts)
+ */
+async function fetchChartSeries(kind, params = {}) {
+    const query = new URLSearchParams();
+    Object.entries(params).forEach(([key, value]) => {
+        if (value !== null && value !== undefined) query.set(key, value);
+    });
+    const data = await (await fetch(`/${kind}/charts?${query}`)).json();
+    if (!data.success) throw new Error(data.error);
+    return data.series;
+}
+
 // Document ready
 document.addEventListener('DOMContentLoaded', function() {
     initTooltips();
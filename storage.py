@@ -0,0 +1,135 @@
+import io
+import json
+import os
+import re
+import uuid
+
+import numpy as np
+
+RUN_ID_PATTERN = re.compile(r'^[a-z]+-[0-9a-f]{32}$')
+META_KEY = '__meta__'
+
+
+def is_numeric_list(value):
+    """Sayisal (1-B veya 2-B duzgun) liste mi?"""
+    if not isinstance(value, list) or not value:
+        return False
+    try:
+        arr = np.asarray(value)
+    except ValueError:
+        # Duzensiz (ragged) listeler
+        return False
+    return arr.dtype.kind in 'fiub'
+
+
+def split_results(data, prefix=''):
+    """Sozlugu JSON meta verisi ve sayisal dizilere ayir"""
+    meta = {}
+    arrays = {}
+    for key, value in data.items():
+        path = f'{prefix}{key}'
+        if isinstance(value, dict):
+            sub_meta, sub_arrays = split_results(value, f'{path}/')
+            meta[key] = sub_meta
+            arrays.update(sub_arrays)
+        elif isinstance(value, np.ndarray) or is_numeric_list(value):
+            arrays[path] = np.asarray(value)
+        else:
+            meta[key] = value
+    return meta, arrays
+
+
+def _merge(meta, arrays):
+    """split_results ile ayrilan veriyi listelerle birlikte tekrar birlestir"""
+    for path, arr in arrays.items():
+        target = meta
+        *parents, leaf = path.split('/')
+        for part in parents:
+            target = target.setdefault(part, {})
+        target[leaf] = arr.tolist()
+    return meta
+
+
+def atomic_write_bytes(filepath, payload):
+    """Gecici dosyaya yazip yeniden adlandirarak atomik yazma"""
+    directory = os.path.dirname(filepath)
+    tmp_path = os.path.join(directory, f'.{os.path.basename(filepath)}.{uuid.uuid4().hex}.tmp')
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, filepath)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class ResultStore:
+    """
+    Her analiz calismasini kendi kimligiyle saklayan sonuc deposu
+
+    Her calisma tek bir .npz dosyasidir: sayisal matrisler ikili olarak,
+    isimler ve diger alanlar '__meta__' altinda JSON olarak tutulur.
+    Yazma islemi gecici dosya + yeniden adlandirma ile atomiktir, bu sayede
+    eszamanli istekler birbirinin sonucunu ezmez.
+    """
+
+    def __init__(self, base_dir):
+        """
+        Args:
+            base_dir: Calisma dosyalarinin yazilacagi klasor
+        """
+        self.base_dir = base_dir
+        if not os.path.exists(base_dir):
+            os.makedirs(base_dir)
+
+    def path(self, run_id):
+        """Calisma dosyasinin yolu (gecersiz kimlikte None)"""
+        if not RUN_ID_PATTERN.match(run_id or ''):
+            return None
+        return os.path.join(self.base_dir, f'{run_id}.npz')
+
+    def new_id(self, kind):
+        """Yeni calisma kimligi uret (orn. 'critic-<32 hex>')"""
+        return f'{kind}-{uuid.uuid4().hex}'
+
+    def save(self, kind, results, run_id=None):
+        """
+        Sonucu kaydet ve calisma kimligini dondur
+
+        Args:
+            kind: Sonuc turu ('critic', 'topsis', ...)
+            results: Kaydedilecek sonuc sozlugu
+            run_id: Onceden uretilmis kimlik (yoksa yenisi uretilir)
+        """
+        run_id = run_id or self.new_id(kind)
+        meta, arrays = split_results(results)
+        meta_bytes = json.dumps({'kind': kind, 'results': meta}, ensure_ascii=False).encode('utf-8')
+        arrays[META_KEY] = np.frombuffer(meta_bytes, dtype=np.uint8)
+
+        buffer = io.BytesIO()
+        np.savez(buffer, **arrays)
+        atomic_write_bytes(self.path(run_id), buffer.getvalue())
+        return run_id
+
+    def load_arrays(self, run_id):
+        """
+        Sonucu JSON'a cevirmeden yukle
+
+        Returns:
+            tuple: (meta sozlugu, {'yol/anahtar': numpy array}) veya None
+        """
+        path = self.path(run_id)
+        if path is None or not os.path.exists(path):
+            return None
+        with np.load(path) as npz:
+            arrays = {key: npz[key] for key in npz.files}
+        meta = json.loads(arrays.pop(META_KEY).tobytes().decode('utf-8'))
+        return meta, arrays
+
+    def load(self, run_id):
+        """Sonucu eski JSON sonuclariyla ayni sekilde (listelerle) yukle"""
+        loaded = self.load_arrays(run_id)
+        if loaded is None:
+            return None
+        meta, arrays = loaded
+        return _merge(meta['results'], arrays)
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Testler repo kokundeki modulleri (methods, app, ...) dogrudan ice aktarir
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
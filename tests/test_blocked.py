@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from methods import CRITIC, TOPSIS, BlockedCRITIC, BlockedTOPSIS, open_matrix
+
+CRITERIA_TYPES = ['max', 'min'] * 7 + ['max']
+BLOCK_ROWS = 700
+
+# float32 modunun float64'e gore belgelenen dogrulugu (methods/blocked.py)
+FLOAT32_WEIGHT_TOLERANCE = 1e-7
+FLOAT32_CLOSENESS_TOLERANCE = 5e-7
+
+
+@pytest.fixture(scope='module')
+def problem(tmp_path_factory):
+    X = np.random.default_rng(7).random((3000, 15)) * 100
+    path = tmp_path_factory.mktemp('blocked') / 'matrix.npy'
+    np.save(path, X)
+    weights = np.array(CRITIC(X, CRITERIA_TYPES).run('summary')['weights'])
+    reference = TOPSIS(X, weights, CRITERIA_TYPES).run('summary')
+    return open_matrix(path), weights, reference
+
+
+def _blocked(matrix, weights, dtype):
+    critic = BlockedCRITIC(matrix, CRITERIA_TYPES, dtype=dtype, block_rows=BLOCK_ROWS).run('summary')
+    topsis = BlockedTOPSIS(matrix, weights, CRITERIA_TYPES, dtype=dtype, block_rows=BLOCK_ROWS).run('summary')
+    return np.array(critic['weights']), topsis
+
+
+def test_open_matrix_is_memory_mapped(problem):
+    matrix, _, _ = problem
+    assert isinstance(matrix, np.memmap)
+
+
+def test_float64_matches_in_memory_methods(problem):
+    matrix, weights, reference = problem
+    blocked_weights, topsis = _blocked(matrix, weights, 'float64')
+    np.testing.assert_allclose(blocked_weights, weights, rtol=0, atol=1e-12)
+    np.testing.assert_allclose(topsis['closeness'], reference['closeness'], rtol=0, atol=1e-12)
+    np.testing.assert_allclose(topsis['distance_positive'], reference['distance_positive'], rtol=0, atol=1e-12)
+    assert isinstance(topsis['closeness'], np.ndarray)
+    assert topsis['ranking'].tolist() == reference['ranking']
+
+
+def test_float32_within_documented_tolerance(problem):
+    matrix, weights, reference = problem
+    blocked_weights, topsis = _blocked(matrix, weights, 'float32')
+    np.testing.assert_allclose(blocked_weights, weights, rtol=0, atol=FLOAT32_WEIGHT_TOLERANCE)
+    closeness = np.array(reference['closeness'])
+    np.testing.assert_allclose(topsis['closeness'], closeness, rtol=0, atol=FLOAT32_CLOSENESS_TOLERANCE)
+
+    # Ayni siralama; yalnizca float64 yakinlik farki tolerans icinde olan
+    # komsular yer degistirebilir
+    order = np.argsort(topsis['ranking'])
+    assert np.all(np.diff(closeness[order]) <= 2 * FLOAT32_CLOSENESS_TOLERANCE)
+    reference_order = np.argsort(reference['ranking'])
+    assert order[:10].tolist() == reference_order[:10].tolist()
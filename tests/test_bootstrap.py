@@ -0,0 +1,41 @@
+import numpy as np
+
+from methods import CRITIC, CriticBootstrap
+from methods.bootstrap import _standardize, resampled_weights
+from methods.kernels import benefit_mask
+
+CRITERIA_TYPES = ['max', 'min', 'max']
+
+
+def _problem():
+    return np.random.default_rng(1).random((5, 3)) * 10
+
+
+def _critic_weights(matrix):
+    return np.array(CRITIC(matrix, CRITERIA_TYPES).run('weights-only')['weights'])
+
+
+def test_resamples_match_critic():
+    X = _problem()
+    rng = np.random.default_rng(0)
+    picks = rng.integers(0, 5, size=(500, 5))
+    counts = np.array([np.bincount(row, minlength=5) for row in picks])
+    weights = resampled_weights(_standardize(X), benefit_mask(CRITERIA_TYPES), counts)
+    for row, w in zip(picks, weights):
+        np.testing.assert_allclose(w, _critic_weights(X[row]), atol=1e-9)
+
+
+def test_two_distinct_rows_give_uniform_weights():
+    # Tum korelasyonlar +-1, bilgi icerigi 0: CRITIC esit agirlik verir
+    X = _problem()
+    counts = np.array([[4, 0, 1, 0, 0], [2, 3, 0, 0, 0]])
+    weights = resampled_weights(_standardize(X), benefit_mask(CRITERIA_TYPES), counts)
+    for row, w in zip(counts, weights):
+        np.testing.assert_allclose(w, _critic_weights(np.repeat(X, row, axis=0)), atol=1e-12)
+        np.testing.assert_allclose(w, np.full(3, 1 / 3))
+
+
+def test_bootstrap_weights_stay_in_unit_interval():
+    result = CriticBootstrap(_problem(), CRITERIA_TYPES, seed=3).run(n_samples=2000, n_workers=1)
+    assert np.all(np.array(result['mean']) >= 0)
+    assert np.all(np.array(result['upper']) <= 1)
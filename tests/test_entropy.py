@@ -0,0 +1,22 @@
+import numpy as np
+
+from methods import Entropy
+
+
+def test_zero_column_gets_no_weight():
+    # Tamami sifir sutun, sabit sutun gibi bilgi tasimaz
+    X = np.array([[1, 0, 5], [2, 0, 5], [3, 0, 6]], dtype=float)
+    result = Entropy(X, ['max', 'max', 'max']).run('summary')
+    np.testing.assert_allclose(result['entropy'][1], 1.0)
+    assert abs(result['weights'][1]) < 1e-12
+    assert result['weights'][0] > result['weights'][2]
+    np.testing.assert_allclose(sum(result['weights']), 1.0)
+
+
+def test_zero_column_matches_constant_column():
+    X = np.array([[1, 0, 5], [2, 0, 5], [3, 0, 6]], dtype=float)
+    constant = X.copy()
+    constant[:, 1] = 4
+    types = ['max', 'min', 'max']
+    np.testing.assert_allclose(Entropy(X, types).run('weights-only')['weights'],
+                               Entropy(constant, types).run('weights-only')['weights'], atol=1e-12)